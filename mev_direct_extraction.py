@@ -2,8 +2,6 @@ import os
 import asyncio
 import json
 import time
-import hmac
-import hashlib
 import uuid
 from datetime import datetime
 from web3 import Web3
@@ -13,6 +11,9 @@ from modules.oracle_hunter import OracleHunter
 from modules.executor import Executor
 from modules.council_bridge import CouncilBridge
 from modules.territory_manager import TerritoryManager
+from modules.vault_manifest import GENESIS, VaultManifest
+from modules.vault_merkle import MerkleCheckpointer
+from modules.vault_writer import get_writer
 
 # [PHASE IV] COHERENCE GUARDS
 class CoherenceGuard:
@@ -54,50 +55,50 @@ class CoherenceGuard:
 class HoloeconomicSink:
     def __init__(self, vault_path="evidence/proposals"):
         self.vault_path = vault_path
-        self.root_key = os.getenv("SENTINEL_ROOT_KEY", "COHERENCE_DEFAULT_SECRET").encode()
-        self.last_hash = "GENESIS"
+        self.last_hash = GENESIS
         os.makedirs(self.vault_path, exist_ok=True)
+        self.manifest = VaultManifest(self.vault_path)
+        self.merkle = MerkleCheckpointer(self.vault_path)
+        self.writer = get_writer(self.vault_path)
         self._initialize_lineage()
 
     def _initialize_lineage(self):
-        """Finds the latest hash in the vault to maintain the chain of evidence."""
-        files = sorted([f for f in os.listdir(self.vault_path) if f.endswith(".json")])
-        if files:
-            try:
-                with open(os.path.join(self.vault_path, files[-1]), "r") as f:
-                    data = json.load(f)
-                    self.last_hash = data.get("signature", "GENESIS")
-            except:
-                pass
+        """Reads the chain tip from the vault manifest (O(1) in vault size)."""
+        if not self.manifest.exists():
+            # Vault sealed before the manifest existed: index it once.
+            self.manifest.rebuild()
+        tip = self.manifest.tip()
+        self.last_hash = tip["signature"] if tip else GENESIS
 
     def record_extraction(self, record):
         """
         Logs a signed extraction to the Evidence Vault as an immutable proposal.
         """
         extraction_id = f"ext-{int(time.time())}-{uuid.uuid4().hex[:4]}"
-        filename = os.path.join(self.vault_path, f"{extraction_id}.json")
         
         payload_body = {
             "id": extraction_id,
             "timestamp": datetime.utcnow().isoformat(),
             "status": "EXTRACTED",
             "type": "RECOGNITION_REWARD",
-            "content": record,
-            "parent_hash": self.last_hash
+            "content": record
         }
         
-        # Cryptographic Sealing (HMAC-SHA256)
-        payload_str = json.dumps(payload_body, sort_keys=True)
-        signature = hmac.new(self.root_key, payload_str.encode(), hashlib.sha256).hexdigest()
+        # Cryptographic Sealing (HMAC-SHA256): the vault writer links
+        # parent_hash to the current tip and signs in commit order, so
+        # concurrent producers cannot fork the lineage.
+        sealed = self.writer.write(
+            f"{extraction_id}.json",
+            payload_body,
+            sealed=True,
+            extras={
+                "justification": f"Automated extraction by ZoaGrad Mirror Node. PnL: {record.get('pnl_est', 0)}",
+                "coherence_score": record.get("coherence_score", 1.0)
+            }
+        )
+        self.merkle.update()  # seals a Merkle root once a batch fills
         
-        payload_body["signature"] = signature
-        payload_body["justification"] = f"Automated extraction by ZoaGrad Mirror Node. PnL: {record.get('pnl_est', 0)}"
-        payload_body["coherence_score"] = record.get("coherence_score", 1.0)
-
-        with open(filename, "w") as f:
-            json.dump(payload_body, f, indent=2)
-        
-        self.last_hash = signature
+        self.last_hash = sealed["signature"]
         print(f"[HOLO-SINK] :: SEALED & RECORDED :: {extraction_id}")
 
 # [ZOAGRAD MIRROR NODE] :: DIRECT EXTRACTION PROTOCOL
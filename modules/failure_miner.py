@@ -0,0 +1,239 @@
+import json
+import math
+import os
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from modules.scribe import MUTATION_LOG_DIR, iter_mutations
+
+"""
+FAILURE PATTERN MINER
+=====================
+Batch analytics over the whole mutation history.
+
+The Learner reacts to one mutation at a time. The miner loads every
+record into columnar arrays (clone, asset, generation, pnl, outcome and
+one float column per numeric trait) and answers the post-mortem questions
+with a handful of vectorized group-bys:
+
+    - loss rate and mean PnL per asset
+    - loss rate and mean PnL per trait quantile bucket, globally and per asset
+    - correlation of each trait (aggression, slippage, gas_tolerance, ...)
+      with losses and with PnL
+
+Buckets whose loss rate stands out from their baseline are ranked by a
+binomial z-score and returned as expertise rules.
+"""
+
+# A record counts as a loss on the same terms the Learner uses.
+LOSS_OUTCOMES = ("DIED",)
+
+
+class MutationFrame:
+    """Mutation records as flat arrays; traits missing from a record are NaN."""
+
+    def __init__(self, clone, clones, asset, assets, generation, pnl, outcome, outcomes, traits):
+        self.clone = np.asarray(clone, dtype=np.int64)
+        self.clones = list(clones)
+        self.asset = np.asarray(asset, dtype=np.int64)
+        self.assets = list(assets)
+        self.generation = np.asarray(generation, dtype=np.int64)
+        self.pnl = np.asarray(pnl, dtype=np.float64)
+        self.outcome = np.asarray(outcome, dtype=np.int64)
+        self.outcomes = list(outcomes)
+        self.traits = {k: np.asarray(v, dtype=np.float64) for k, v in traits.items()}
+        died = np.isin(self.outcome, [i for i, o in enumerate(self.outcomes) if o in LOSS_OUTCOMES])
+        self.loss = (self.pnl < 0) | died
+
+    def __len__(self) -> int:
+        return len(self.pnl)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "MutationFrame":
+        codes = {"clone": {}, "asset": {}, "outcome": {}}
+        clone, asset, generation, pnl, outcome = [], [], [], [], []
+        trait_rows: Dict[str, List] = {}
+        trait_vals: Dict[str, List] = {}
+        for i, rec in enumerate(records):
+            traits = rec.get("traits") or {}
+            clone.append(codes["clone"].setdefault(str(rec.get("id", "UNKNOWN")), len(codes["clone"])))
+            asset.append(codes["asset"].setdefault(str(traits.get("asset", "UNKNOWN")), len(codes["asset"])))
+            outcome.append(codes["outcome"].setdefault(str(rec.get("event_type", "")), len(codes["outcome"])))
+            generation.append(rec.get("generation") or 0)
+            pnl.append(rec.get("pnl") or 0.0)
+            for k, v in traits.items():
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    trait_rows.setdefault(k, []).append(i)
+                    trait_vals.setdefault(k, []).append(v)
+        n = len(pnl)
+        traits = {}
+        for k, rows in trait_rows.items():
+            col = np.full(n, np.nan)
+            col[np.asarray(rows, dtype=np.int64)] = trait_vals[k]
+            traits[k] = col
+        return cls(clone, codes["clone"], asset, codes["asset"], generation, pnl,
+                   outcome, codes["outcome"], traits)
+
+    @classmethod
+    def load(cls, vault_path: str = "evidence/proposals") -> "MutationFrame":
+        """Every mutation in the vault: legacy mutation_*.json files and the Scribe log."""
+        def records():
+            with os.scandir(vault_path) as it:
+                legacy = sorted(e.name for e in it if e.name.startswith("mutation_") and e.name.endswith(".json"))
+            for name in legacy:
+                try:
+                    with open(os.path.join(vault_path, name), "r") as f:
+                        yield json.load(f)
+                except (OSError, ValueError):
+                    continue
+            for _, rec in iter_mutations(os.path.join(vault_path, MUTATION_LOG_DIR)):
+                yield rec
+        return cls.from_records(records())
+
+
+def _group(keys: np.ndarray, loss: np.ndarray, pnl: np.ndarray, size: int):
+    """(count, loss rate, mean pnl) per key in one pass of bincount."""
+    n = np.bincount(keys, minlength=size).astype(np.float64)
+    losses = np.bincount(keys, weights=loss, minlength=size)
+    pnl_sum = np.bincount(keys, weights=pnl, minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return n, losses / n, pnl_sum / n
+
+
+def _zscore(rate, base, n):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (rate - base) / np.sqrt(base * (1.0 - base) / n)
+
+
+def _corr(x: np.ndarray, y: np.ndarray) -> float:
+    xs, ys = x - x.mean(), y - y.mean()
+    denom = math.sqrt(float(xs @ xs) * float(ys @ ys))
+    return float(xs @ ys) / denom if denom else 0.0
+
+
+def mine(frame: MutationFrame, bins: int = 4, min_support: int = 30, min_z: float = 2.0,
+         min_lift: float = 1.25) -> Dict:
+    """
+    Group-by statistics over `frame` plus ranked insights.
+
+    Trait buckets are quantile bins of the trait's observed values. A bucket
+    is reported when it has at least `min_support` records and its loss rate
+    is both `min_lift` times and `min_z` standard errors above its baseline
+    (all records, or the asset's records for per-asset buckets). The lift
+    floor keeps huge histories from promoting statistically "significant"
+    but negligible differences.
+    """
+    n_assets = len(frame.assets)
+    loss = frame.loss.astype(np.float64)
+    total = len(frame)
+    base = float(loss.mean()) if total else 0.0
+
+    a_n, a_rate, a_pnl = _group(frame.asset, loss, frame.pnl, n_assets)
+    assets = [
+        {"asset": frame.assets[i], "n": int(a_n[i]), "loss_rate": float(a_rate[i]), "mean_pnl": float(a_pnl[i])}
+        for i in range(n_assets) if a_n[i]
+    ]
+
+    buckets, correlations, candidates = [], [], []
+    for trait, col in sorted(frame.traits.items()):
+        seen = ~np.isnan(col)
+        if seen.sum() < 2:
+            continue
+        x = col[seen]
+        l, p, a = loss[seen], frame.pnl[seen], frame.asset[seen]
+        correlations.append({
+            "trait": trait, "n": int(seen.sum()),
+            "loss_corr": _corr(x, l), "pnl_corr": _corr(x, p),
+        })
+
+        edges = np.unique(np.quantile(x, np.linspace(0, 1, bins + 1)))
+        if len(edges) < 2:
+            continue
+        nb = len(edges) - 1
+        b = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, nb - 1)
+
+        # Global buckets and asset x bucket cells from the same two bincounts
+        g_n, g_rate, g_pnl = _group(b, l, p, nb)
+        c_n, c_rate, c_pnl = _group(a * nb + b, l, p, n_assets * nb)
+        c_base = np.repeat(a_rate, nb)
+        g_z = _zscore(g_rate, base, g_n)
+        c_z = _zscore(c_rate, c_base, c_n)
+
+        for k in range(nb):
+            row = {"trait": trait, "scope": "GLOBAL", "bucket": k, "bins": nb,
+                   "lo": float(edges[k]), "hi": float(edges[k + 1]),
+                   "n": int(g_n[k]), "loss_rate": float(g_rate[k]), "mean_pnl": float(g_pnl[k]),
+                   "baseline": base, "z": float(g_z[k])}
+            buckets.append(row)
+            candidates.append(row)
+        for cell in np.flatnonzero(c_n >= min_support):
+            k = int(cell % nb)
+            if c_n[cell] == g_n[k]:
+                continue  # the whole bucket is one asset: same rule as the GLOBAL one
+            candidates.append({
+                "trait": trait, "scope": frame.assets[cell // nb], "bucket": k, "bins": nb,
+                "lo": float(edges[k]), "hi": float(edges[k + 1]),
+                "n": int(c_n[cell]), "loss_rate": float(c_rate[cell]), "mean_pnl": float(c_pnl[cell]),
+                "baseline": float(c_base[cell]), "z": float(c_z[cell]),
+            })
+
+    ranked = sorted(
+        (c for c in candidates
+         if c["n"] >= min_support and np.isfinite(c["z"]) and c["z"] >= min_z
+         and c["loss_rate"] >= c["baseline"] * min_lift),
+        key=lambda c: (-c["z"], c["trait"], c["scope"], c["lo"]),
+    )
+    return {
+        "records": total,
+        "loss_rate": base,
+        "assets": assets,
+        "buckets": buckets,
+        "correlations": correlations,
+        "insights": [_insight(c) for c in ranked],
+    }
+
+
+def pattern_key(c: Dict) -> str:
+    """
+    Stable identity of a mined bucket: scope, trait and quantile position.
+    The rates and edges in the insight text drift as history grows; the
+    key does not, so a re-mined bucket updates its rule instead of adding one.
+    """
+    return f"{c['scope']}:{c['trait']}:q{c['bucket'] + 1}/{c['bins']}"
+
+
+def _insight(c: Dict) -> Dict:
+    where = "" if c["scope"] == "GLOBAL" else f" on {c['scope']}"
+    return {
+        "scope": c["scope"],
+        "key": pattern_key(c),
+        "insight": (
+            f"Loss rate {c['loss_rate']:.0%} (baseline {c['baseline']:.0%}) when {c['trait']} "
+            f"is in [{c['lo']:.4g}, {c['hi']:.4g}]{where}. Avoid this range or reduce exposure."
+        ),
+        "confidence": int(min(95, 50 + 10 * c["z"])),
+        "evidence": {k: (round(v, 6) if isinstance(v, float) else v)
+                     for k, v in c.items() if k not in ("scope",)},
+    }
+
+
+def mine_vault(vault_path: str = "evidence/proposals", **kwargs) -> Dict:
+    return mine(MutationFrame.load(vault_path), **kwargs)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mine failure patterns from the mutation history")
+    parser.add_argument("--vault", default="evidence/proposals")
+    parser.add_argument("--bins", type=int, default=4)
+    parser.add_argument("--min-support", type=int, default=30)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    report = mine_vault(args.vault, bins=args.bins, min_support=args.min_support)
+    print(f"[MINER] :: {report['records']} records :: loss rate {report['loss_rate']:.1%}")
+    for c in report["correlations"]:
+        print(f"[MINER] :: {c['trait']:<16} r(loss)={c['loss_corr']:+.3f} r(pnl)={c['pnl_corr']:+.3f} n={c['n']}")
+    for ins in report["insights"][:args.top]:
+        print(f"[MINER] :: [{ins['confidence']}] {ins['insight']}")
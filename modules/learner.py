@@ -3,11 +3,28 @@ import os
 import json
 from datetime import datetime
 
+from modules.scribe import MUTATION_LOG_DIR, iter_mutations
+from modules.vault_writer import get_writer
+
 class Learner:
-    def __init__(self, expertise_path="evidence/expertise.yaml", vault_path="evidence/proposals"):
+    """
+    Post-mortem learner. The expertise matrix is loaded once and kept in
+    memory with a per-asset set of known insights; scan_vault() resumes
+    from a watermark (legacy file mtime + Scribe log position) and writes
+    expertise and watermark once per `batch_size` records.
+    """
+
+    def __init__(self, expertise_path="evidence/expertise.yaml", vault_path="evidence/proposals", batch_size=10000):
         self.expertise_path = expertise_path
         self.vault_path = vault_path
+        self.batch_size = batch_size
+        self.watermark_path = os.path.splitext(expertise_path)[0] + ".watermark.json"
         os.makedirs(os.path.dirname(expertise_path), exist_ok=True)
+        self._expertise = None
+        self._index = {}          # asset -> set of insights already in the matrix
+        self._global_index = set()
+        self._loaded_mtime = None
+        self._dirty = False
         
     def load_expertise(self):
         if not os.path.exists(self.expertise_path):
@@ -18,6 +35,42 @@ class Learner:
     def save_expertise(self, expertise):
         with open(self.expertise_path, 'w') as f:
             yaml.dump(expertise, f, default_flow_style=False, sort_keys=False)
+        self._adopt(expertise)
+
+    # --- In-memory expertise ---
+
+    def _mtime(self):
+        try:
+            return os.stat(self.expertise_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _adopt(self, expertise):
+        expertise.setdefault("global_rules", [])
+        expertise.setdefault("assets", {})
+        self._expertise = expertise
+        self._index = {
+            asset: {r.get("insight") for r in rules or []}
+            for asset, rules in expertise["assets"].items()
+        }
+        self._global_index = {r.get("insight") for r in expertise["global_rules"] or []}
+        self._loaded_mtime = self._mtime()
+        self._dirty = False
+
+    def expertise(self):
+        """The cached matrix; re-read only if another writer changed the file."""
+        if self._expertise is None or (not self._dirty and self._mtime() != self._loaded_mtime):
+            self._adopt(self.load_expertise())
+        return self._expertise
+
+    def flush(self):
+        """Persists the matrix if anything was learned since the last save."""
+        if self._dirty:
+            self.save_expertise(self._expertise)
+            return True
+        return False
+
+    # --- Learning ---
 
     def learn_from_mutation(self, mutation_file):
         """
@@ -28,8 +81,14 @@ class Learner:
 
         with open(mutation_file, 'r') as f:
             mutation_data = json.load(f)
+        return self.learn_from_record(mutation_data)
 
-        expertise = self.load_expertise()
+    def learn_from_record(self, mutation_data, persist=True):
+        """
+        Updates the expertise matrix from one mutation record. With
+        `persist=False` the change stays in memory until flush().
+        """
+        expertise = self.expertise()
         
         # Simple Logic: If a mutation failed (PnL < 0), record the trait that caused it
         pnl = mutation_data.get("pnl", 0)
@@ -42,23 +101,23 @@ class Learner:
             asset = traits.get("asset", "UNKNOWN")
             slippage = traits.get("slippage", "UNKNOWN")
             
-            if asset not in expertise["assets"]:
-                expertise["assets"][asset] = []
-                
             rule_id = f"{asset}-ERR-{int(datetime.utcnow().timestamp())}"
             insight = f"Detected failure with slippage guard {slippage}. Consider increasing threshold or reducing exposure."
             
             # Check if a similar rule already exists to avoid duplicates
-            exists = any(r["insight"] == insight for r in expertise["assets"][asset])
+            known = self._index.setdefault(asset, set())
             
-            if not exists:
-                expertise["assets"][asset].append({
+            if insight not in known:
+                known.add(insight)
+                expertise["assets"].setdefault(asset, []).append({
                     "rule_id": rule_id,
                     "insight": insight,
                     "status": "ACTIVE",
                     "confidence": 75 # Initial low confidence until verified
                 })
-                self.save_expertise(expertise)
+                self._dirty = True
+                if persist:
+                    self.flush()
                 
                 # Emit Vector_Null Directive for Reflexive Patching
                 if pnl < -1.0: # Only trigger on significant losses
@@ -68,17 +127,135 @@ class Learner:
         
         return False
 
-    def scan_vault(self):
+    # --- Incremental scan ---
+
+    def load_watermark(self):
+        try:
+            with open(self.watermark_path, 'r') as f:
+                mark = json.load(f)
+            return {
+                "legacy_mtime_ns": mark.get("legacy_mtime_ns", 0),
+                "legacy_at_mark": mark.get("legacy_at_mark", []),
+                "log": tuple(mark["log"]) if mark.get("log") else None,
+            }
+        except (OSError, ValueError):
+            return {"legacy_mtime_ns": 0, "legacy_at_mark": [], "log": None}
+
+    def _save_watermark(self, mark):
+        tmp = self.watermark_path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump({**mark, "log": list(mark["log"]) if mark["log"] else None,
+                       "updated_at": datetime.utcnow().isoformat()}, f)
+        os.replace(tmp, self.watermark_path)
+
+    def _checkpoint(self, mark):
+        # Expertise first: replaying after a crash in between is harmless
+        # because known insights are skipped.
+        self.flush()
+        self._save_watermark(mark)
+
+    def _new_legacy_files(self, mark):
+        """Legacy mutation_*.json files newer than the watermark, oldest first."""
+        fresh = []
+        at_mark = set(mark["legacy_at_mark"])
+        with os.scandir(self.vault_path) as it:
+            for entry in it:
+                if not (entry.name.startswith("mutation_") and entry.name.endswith(".json")):
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                if mtime > mark["legacy_mtime_ns"] or (mtime == mark["legacy_mtime_ns"] and entry.name not in at_mark):
+                    fresh.append((mtime, entry.name))
+        fresh.sort()
+        return fresh
+
+    def scan_vault(self, full=False):
         """
-        Scans the vault for all mutation records and learns from them.
+        Learns from mutation records added since the last scan (legacy
+        per-event files and the Scribe's mutation log). `full` ignores the
+        watermark and rescans everything.
         """
-        files = [os.path.join(self.vault_path, f) for f in os.listdir(self.vault_path) if f.startswith("mutation_") and f.endswith(".json")]
+        mark = {"legacy_mtime_ns": 0, "legacy_at_mark": [], "log": None} if full else self.load_watermark()
+        self.expertise()
         learned_count = 0
-        for f in files:
-            if self.learn_from_mutation(f):
+        pending = 0
+
+        for mtime, name in self._new_legacy_files(mark):
+            try:
+                with open(os.path.join(self.vault_path, name), 'r') as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                record = None
+            if record is not None and self.learn_from_record(record, persist=False):
+                learned_count += 1
+            if mtime != mark["legacy_mtime_ns"]:
+                mark["legacy_mtime_ns"], mark["legacy_at_mark"] = mtime, []
+            mark["legacy_at_mark"].append(name)
+            pending += 1
+            if pending >= self.batch_size:
+                self._checkpoint(mark)
+                pending = 0
+
+        for position, record in iter_mutations(os.path.join(self.vault_path, MUTATION_LOG_DIR), mark["log"]):
+            if self.learn_from_record(record, persist=False):
                 learned_count += 1
+            mark["log"] = position
+            pending += 1
+            if pending >= self.batch_size:
+                self._checkpoint(mark)
+                pending = 0
+
+        if pending or self._dirty:
+            self._checkpoint(mark)
         return learned_count
 
+    def mine_failure_patterns(self, top=10, **kwargs):
+        """
+        Runs the batch failure miner over the whole mutation history and
+        merges its `top` ranked insights into the matrix (GLOBAL ones into
+        global_rules). Rules are keyed on the bucket's pattern_key, so a
+        bucket mined again refreshes its rule's text, confidence and
+        evidence in place. Returns the number of new rules.
+        """
+        from modules.failure_miner import mine_vault
+
+        expertise = self.expertise()
+        mined = {}
+        for rule in expertise["global_rules"] + [r for rules in expertise["assets"].values() for r in rules or []]:
+            if rule.get("pattern_key"):
+                mined[rule["pattern_key"]] = rule
+        stamp = int(datetime.utcnow().timestamp())
+        added = changed = 0
+        for rank, found in enumerate(mine_vault(self.vault_path, **kwargs)["insights"][:top], 1):
+            scope, insight = found["scope"], found["insight"]
+            if scope == "GLOBAL":
+                known, rules = self._global_index, expertise["global_rules"]
+            else:
+                known, rules = self._index.setdefault(scope, set()), expertise["assets"].setdefault(scope, [])
+            rule = mined.get(found["key"])
+            if rule is not None:
+                fresh = {"insight": insight, "confidence": found["confidence"], "evidence": found["evidence"]}
+                if any(rule.get(k) != v for k, v in fresh.items()):
+                    known.discard(rule.get("insight"))
+                    known.add(insight)
+                    rule.update(fresh)
+                    changed += 1
+                continue
+            known.add(insight)
+            rule = mined[found["key"]] = {
+                "rule_id": f"{scope}-PAT-{stamp}-{rank}",
+                "pattern_key": found["key"],
+                "insight": insight,
+                "status": "ACTIVE",
+                "confidence": found["confidence"],
+                "evidence": found["evidence"],
+            }
+            rules.append(rule)
+            added += 1
+        if added or changed:
+            self._dirty = True
+            self.flush()
+        return added
+
     def emit_vector_directive(self, asset, insight, pnl):
         """
         Emits a directive to Vector_Null to trigger a reflexive parameter tune.
@@ -106,9 +283,8 @@ class Learner:
             "urgency": "HIGH"
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(directive, f, indent=2)
-            
+        get_writer(self.vault_path).write(filepath, directive)
+
         print(f"[LEARNER] :: EMITTED VECTOR DIRECTIVE :: {directive_id}")
         return filepath
 
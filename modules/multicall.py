@@ -0,0 +1,406 @@
+import functools
+import json
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import requests
+
+"""
+MULTICALL
+=========
+Batched on-chain reads for the Oracle Hunter.
+
+Pricing one pair used to cost one eth_call per question: getPool for
+every factory x token order x fee tier, slot0 on each candidate pool,
+then slot0/token0 again, decimals, and the Aerodrome and V2 routers.
+Here the same reads are ABI-encoded locally and sent through Multicall3
+`aggregate3` (deployed at one address on every EVM chain) with
+allowFailure set on every call, so a reverting pool or router costs
+nothing but its own slot in the result:
+
+    round 1   decimals (uncached tokens) + getPool for every candidate
+              + Aerodrome / V2 getAmountsOut for pairs with known decimals
+    round 2   slot0 + token0 for every pool found in round 1
+              + router quotes still waiting on decimals
+
+Two eth_calls price any number of pairs; the results are decoded and
+ranked here with the same venue priority the serial path used.
+
+The transport is either a Web3 instance (w3.eth.call) or a JSON-RPC URL,
+so the encoder needs nothing beyond the standard library and requests.
+"""
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+ZERO_ADDRESS = "0x" + "00" * 20
+FEE_TIERS = (500, 3000, 10000)  # 0.05%, 0.3%, 1.0%
+DUST = 1e-9
+
+
+class MulticallError(Exception):
+    pass
+
+
+# --- Keccak-256 (Ethereum's pre-NIST padding; hashlib.sha3_256 differs) ---
+
+_RC = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+_ROT = (
+    (0, 36, 3, 41, 18), (1, 44, 10, 45, 2), (62, 6, 43, 15, 61),
+    (28, 55, 25, 21, 56), (27, 20, 39, 8, 14),
+)
+_MASK = (1 << 64) - 1
+
+
+def _rol(v: int, n: int) -> int:
+    return ((v << n) | (v >> (64 - n))) & _MASK if n else v
+
+
+def _keccak_f(a: List[List[int]]) -> None:
+    for rc in _RC:
+        c = [a[x][0] ^ a[x][1] ^ a[x][2] ^ a[x][3] ^ a[x][4] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ _rol(c[(x + 1) % 5], 1) for x in range(5)]
+        for x in range(5):
+            for y in range(5):
+                a[x][y] ^= d[x]
+        b = [[0] * 5 for _ in range(5)]
+        for x in range(5):
+            for y in range(5):
+                b[y][(2 * x + 3 * y) % 5] = _rol(a[x][y], _ROT[x][y])
+        for x in range(5):
+            for y in range(5):
+                a[x][y] = b[x][y] ^ (~b[(x + 1) % 5][y] & b[(x + 2) % 5][y])
+        a[0][0] ^= rc
+
+
+def keccak256(data: bytes) -> bytes:
+    rate = 136
+    padded = bytearray(data) + b"\x01" + b"\x00" * ((-len(data) - 1) % rate)
+    padded[-1] |= 0x80
+    a = [[0] * 5 for _ in range(5)]
+    for off in range(0, len(padded), rate):
+        block = padded[off:off + rate]
+        for i in range(rate // 8):
+            a[i % 5][i // 5] ^= int.from_bytes(block[8 * i:8 * i + 8], "little")
+        _keccak_f(a)
+    return b"".join(a[i % 5][i // 5].to_bytes(8, "little") for i in range(4))
+
+
+@functools.lru_cache(maxsize=None)
+def selector(signature: str) -> bytes:
+    """4-byte function selector; cached, the pure-Python keccak costs ~0.5 ms."""
+    return keccak256(signature.encode())[:4]
+
+
+# --- ABI encoding ---
+# Types: "address", "uint", "int", "bool", "bytes", [T] for a dynamic
+# array of T, (T1, T2, ...) for a tuple.
+
+def _is_dynamic(t) -> bool:
+    if t == "bytes" or isinstance(t, list):
+        return True
+    return isinstance(t, tuple) and any(_is_dynamic(x) for x in t)
+
+
+def _word(v: int) -> bytes:
+    return (v % (1 << 256)).to_bytes(32, "big")
+
+
+def _encode_value(t, v) -> bytes:
+    if t == "address":
+        return _word(int(v, 16))
+    if t in ("uint", "int"):
+        return _word(int(v))
+    if t == "bool":
+        return _word(1 if v else 0)
+    if t == "bytes":
+        return _word(len(v)) + bytes(v) + b"\x00" * (-len(v) % 32)
+    if isinstance(t, list):
+        return _word(len(v)) + encode_abi([t[0]] * len(v), v)
+    if isinstance(t, tuple):
+        return encode_abi(list(t), v)
+    raise ValueError(f"unsupported ABI type {t!r}")
+
+
+def encode_abi(types: Sequence, values: Sequence) -> bytes:
+    heads, tails = [], []
+    head_size = sum(32 if _is_dynamic(t) else len(_encode_value(t, v)) for t, v in zip(types, values))
+    for t, v in zip(types, values):
+        enc = _encode_value(t, v)
+        if _is_dynamic(t):
+            heads.append(_word(head_size + sum(len(x) for x in tails)))
+            tails.append(enc)
+        else:
+            heads.append(enc)
+    return b"".join(heads) + b"".join(tails)
+
+
+def encode_call(signature: str, types: Sequence = (), values: Sequence = ()) -> bytes:
+    return selector(signature) + encode_abi(types, values)
+
+
+# --- ABI decoding (only the shapes the hunter reads) ---
+
+def decode_uint(data: bytes, index: int = 0) -> int:
+    if len(data) < 32 * (index + 1):
+        raise ValueError("short return data")
+    return int.from_bytes(data[32 * index:32 * index + 32], "big")
+
+
+def decode_address(data: bytes, index: int = 0) -> str:
+    return "0x" + decode_uint(data, index).to_bytes(32, "big")[12:].hex()
+
+
+def decode_uint_array(data: bytes) -> List[int]:
+    """A single uint256[] return value."""
+    offset = decode_uint(data) // 32
+    n = decode_uint(data, offset)
+    return [decode_uint(data, offset + 1 + i) for i in range(n)]
+
+
+def _decode_aggregate3(data: bytes) -> List[Tuple[bool, bytes]]:
+    base = decode_uint(data)
+    n = int.from_bytes(data[base:base + 32], "big")
+    heads = base + 32
+    out = []
+    for i in range(n):
+        elem = heads + int.from_bytes(data[heads + 32 * i:heads + 32 * i + 32], "big")
+        success = bool(int.from_bytes(data[elem:elem + 32], "big"))
+        at = elem + int.from_bytes(data[elem + 32:elem + 64], "big")
+        size = int.from_bytes(data[at:at + 32], "big")
+        out.append((success, bytes(data[at + 32:at + 32 + size])))
+    return out
+
+
+# --- Calls ---
+
+AGGREGATE3 = "aggregate3((address,bool,bytes)[])"
+GET_POOL = "getPool(address,address,uint24)"
+SLOT0 = "slot0()"
+TOKEN0 = "token0()"
+DECIMALS = "decimals()"
+GET_AMOUNTS_OUT_V2 = "getAmountsOut(uint256,address[])"
+GET_AMOUNTS_OUT_AERO = "getAmountsOut(uint256,(address,address,bool,address)[])"
+
+
+class Call(NamedTuple):
+    target: str
+    data: bytes
+    allow_failure: bool = True
+
+
+class Multicall3:
+    """
+    Sends Call batches as Multicall3 aggregate3 eth_calls. `rpc` is a
+    Web3 instance or an HTTP JSON-RPC URL. Batches larger than
+    `batch_size` are split so a single eth_call stays under node limits.
+    """
+
+    def __init__(self, rpc, address: str = MULTICALL3_ADDRESS, batch_size: int = 500, timeout: float = 10):
+        self.rpc = rpc
+        self.address = address
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.round_trips = 0
+        self._id = 0
+
+    def eth_call(self, to: str, data: bytes) -> bytes:
+        self.round_trips += 1
+        if not isinstance(self.rpc, str):
+            try:
+                return bytes(self.rpc.eth.call({"to": to, "data": "0x" + data.hex()}))
+            except Exception as e:
+                raise MulticallError(f"eth_call failed: {e}") from e
+        self._id += 1
+        payload = {"jsonrpc": "2.0", "id": self._id, "method": "eth_call",
+                   "params": [{"to": to, "data": "0x" + data.hex()}, "latest"]}
+        try:
+            response = requests.post(self.rpc, data=json.dumps(payload),
+                                     headers={"Content-Type": "application/json"}, timeout=self.timeout)
+            reply = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise MulticallError(f"eth_call failed: {e}") from e
+        if "error" in reply:
+            raise MulticallError(f"eth_call failed: {reply['error']}")
+        return bytes.fromhex(reply["result"][2:])
+
+    def aggregate3(self, calls: Sequence[Call]) -> List[Tuple[bool, bytes]]:
+        """(success, returnData) for each call, in order."""
+        results: List[Tuple[bool, bytes]] = []
+        for start in range(0, len(calls), self.batch_size):
+            chunk = calls[start:start + self.batch_size]
+            data = encode_call(AGGREGATE3, [[("address", "bool", "bytes")]],
+                               [[(c.target, c.allow_failure, c.data) for c in chunk]])
+            raw = self.eth_call(self.address, data)
+            try:
+                decoded = _decode_aggregate3(raw)
+            except (ValueError, IndexError) as e:
+                raise MulticallError(f"aggregate3 failed: {e}") from e
+            if len(decoded) != len(chunk):
+                raise MulticallError(f"aggregate3 returned {len(decoded)} results for {len(chunk)} calls")
+            results.extend(decoded)
+        return results
+
+
+# --- Pool discovery and quoting ---
+
+def _ok(result: Tuple[bool, bytes], decode, *args):
+    """Decoded value of a successful call, None if it failed or returned garbage."""
+    success, data = result
+    if not success:
+        return None
+    try:
+        return decode(data, *args)
+    except (ValueError, IndexError):
+        return None
+
+
+def _state_calls(pools: Sequence[str]) -> List[Call]:
+    return [c for p in pools for c in (Call(p, encode_call(SLOT0)), Call(p, encode_call(TOKEN0)))]
+
+
+def _decode_state(pools: Sequence[str], results) -> Dict[str, Tuple[Optional[int], Optional[str]]]:
+    """pool -> (sqrtPriceX96, token0) for the leading 2 * len(pools) results; None where a read failed."""
+    return {p: (_ok(results[2 * i], decode_uint), _ok(results[2 * i + 1], decode_address))
+            for i, p in enumerate(pools)}
+
+
+class PoolQuoter:
+    """
+    Prices token pairs from batched reads. `factories` is the ordered
+    [(venue, factory address)] search list; the first initialized pool
+    (factory order, then token order, then fee tier) wins, falling back
+    to the Aerodrome router and then the V2 router when the pool price is
+    dust, exactly as the serial path did.
+    """
+
+    def __init__(self, multicall: Multicall3, factories: Sequence[Tuple[str, str]],
+                 fee_tiers: Sequence[int] = FEE_TIERS, aerodrome_router: Optional[str] = None,
+                 aerodrome_factory: Optional[str] = None, v2_router: Optional[str] = None,
+                 stables: Iterable[str] = ()):
+        self.multicall = multicall
+        self.factories = list(factories)
+        self.fee_tiers = list(fee_tiers)
+        self.aerodrome_router = aerodrome_router
+        self.aerodrome_factory = aerodrome_factory
+        self.v2_router = v2_router
+        self.stables = {s.lower() for s in stables}
+
+    def _candidates(self, token_in: str, token_out: str):
+        """(venue, fee, getPool call) in search order."""
+        for venue, factory in self.factories:
+            for a, b in ((token_in, token_out), (token_out, token_in)):
+                for fee in self.fee_tiers:
+                    yield venue, fee, Call(factory, encode_call(GET_POOL, ["address", "address", "uint"], [a, b, fee]))
+
+    def _router_calls(self, token_in: str, token_out: str, dec_in: int) -> List[Call]:
+        calls = []
+        amount_in = 10 ** dec_in
+        if self.aerodrome_router:
+            stable = token_in.lower() in self.stables and token_out.lower() in self.stables
+            route = (token_in, token_out, stable, self.aerodrome_factory or ZERO_ADDRESS)
+            calls.append(Call(self.aerodrome_router, encode_call(
+                GET_AMOUNTS_OUT_AERO, ["uint", [("address", "address", "bool", "address")]], [amount_in, [route]])))
+        if self.v2_router:
+            calls.append(Call(self.v2_router, encode_call(
+                GET_AMOUNTS_OUT_V2, ["uint", ["address"]], [amount_in, [token_in, token_out]])))
+        return calls
+
+    def _pool_state(self, pools: Iterable[str]) -> Dict[str, Tuple[Optional[int], Optional[str]]]:
+        pools = sorted(set(pools))
+        return _decode_state(pools, self.multicall.aggregate3(_state_calls(pools)) if pools else [])
+
+    def find_active_pool(self, token_in: str, token_out: str, factory: str) -> Tuple[Optional[str], Optional[int]]:
+        """First initialized (pool, fee) for token_in/token_out on one factory, in two round trips."""
+        candidates = [(fee, Call(factory, encode_call(GET_POOL, ["address", "address", "uint"], [token_in, token_out, fee])))
+                      for fee in self.fee_tiers]
+        found = self.multicall.aggregate3([call for _, call in candidates])
+        pools = [(fee, _ok(r, decode_address)) for (fee, _), r in zip(candidates, found)]
+        state = self._pool_state(p for _, p in pools if p and p != ZERO_ADDRESS)
+        for fee, pool in pools:
+            if pool and pool != ZERO_ADDRESS and state[pool][0]:
+                return pool, fee
+        return None, None
+
+    def quote(self, pairs: Sequence[Tuple[str, str]], decimals: Dict[str, int]) -> List[Dict]:
+        """
+        {"price", "venue", "pool", "fee"} for each (token_in, token_out) in
+        `pairs`; price is None when a token's decimals could not be read.
+        `decimals` (lowercase address -> decimals) is consulted first and
+        extended with every value read on chain.
+        """
+        pairs = [(a.lower(), b.lower()) for a, b in pairs]
+        missing = sorted({t for pair in pairs for t in pair if t not in decimals})
+
+        # Round 1: decimals, every getPool, router quotes whose decimals are known
+        calls = [Call(t, encode_call(DECIMALS)) for t in missing]
+        searches, routers = [], {}
+        for i, (a, b) in enumerate(pairs):
+            cands = list(self._candidates(a, b))
+            searches.append((len(calls), cands))
+            calls.extend(c for _, _, c in cands)
+            if a in decimals:
+                routers[i] = (len(calls), self._router_calls(a, b, decimals[a]))
+                calls.extend(routers[i][1])
+        results = self.multicall.aggregate3(calls)
+        for t, r in zip(missing, results):
+            value = _ok(r, decode_uint)
+            if value is not None and value < 256:
+                decimals[t] = value
+
+        # Round 2: pool state for every candidate found + deferred router quotes
+        found = []
+        for start, cands in searches:
+            pools = [(venue, fee, _ok(r, decode_address)) for (venue, fee, _), r
+                     in zip(cands, results[start:start + len(cands)])]
+            found.append([(v, f, p) for v, f, p in pools if p and p != ZERO_ADDRESS])
+        router_results = {i: results[start:start + len(rc)] for i, (start, rc) in routers.items()}
+        deferred = [(i, self._router_calls(a, b, decimals[a])) for i, (a, b) in enumerate(pairs)
+                    if i not in routers and a in decimals]
+        pools = sorted({p for f in found for _, _, p in f})
+        round2 = _state_calls(pools) + [c for _, rc in deferred for c in rc]
+        results = self.multicall.aggregate3(round2) if round2 else []
+        state = _decode_state(pools, results)
+        at = 2 * len(pools)
+        for i, rc in deferred:
+            router_results[i] = results[at:at + len(rc)]
+            at += len(rc)
+
+        quotes = []
+        for i, (a, b) in enumerate(pairs):
+            if a not in decimals or b not in decimals:
+                quotes.append({"price": None, "venue": None, "pool": None, "fee": None})
+                continue
+            quotes.append(self._rank(a, b, decimals[a], decimals[b], found[i], state, router_results.get(i, [])))
+        return quotes
+
+    def _rank(self, a, b, dec_in, dec_out, found, state, router_results) -> Dict:
+        quote = {"price": 0.0, "venue": None, "pool": None, "fee": None}
+        for venue, fee, pool in found:
+            sqrt_price, token0 = state[pool]
+            if sqrt_price:
+                quote.update(venue=venue, pool=pool, fee=fee)
+                ratio = (sqrt_price / (2 ** 96)) ** 2
+                if token0 is not None:
+                    raw = ratio if token0 == a else 1 / ratio
+                    quote["price"] = raw * 10 ** (dec_in - dec_out)
+                break
+        if quote["price"] >= DUST:
+            return quote
+
+        fallbacks = []
+        if self.aerodrome_router:
+            fallbacks.append(("Aerodrome", DUST))
+        if self.v2_router:
+            fallbacks.append(("Uniswap V2", 0.0))
+        for (venue, floor), result in zip(fallbacks, router_results):
+            amounts = _ok(result, decode_uint_array)
+            price = amounts[-1] / 10 ** dec_out if amounts else 0.0
+            if price > floor:
+                quote.update(price=price, venue=venue)
+                break
+        return quote
@@ -4,6 +4,8 @@ import requests
 import time
 from web3 import Web3
 
+from modules.multicall import Multicall3, MulticallError, PoolQuoter
+
 # --- AERODROME (BASE) ---
 AERODROME_ROUTER_ADDRESS = "0xcF77a3Ba9A5CA399B7c97c74d54e5b1Beb874E43"
 AERODROME_FACTORY_ADDRESS = "0x420DD381b31aEf6683db6B902084cB0FFECe40Da"
@@ -61,6 +63,19 @@ PRESEEDED_DECIMALS = {
 for k in list(PRESEEDED_DECIMALS.keys()):
     PRESEEDED_DECIMALS[k.lower()] = PRESEEDED_DECIMALS[k]
 
+# --- V3 POOL SEARCH ORDER (BASE) ---
+V3_FACTORIES = [
+    ("Uniswap V3", "0x33128a8fC17869897dcE68Ed026d694621f6FDfD"),
+    ("Aerodrome CL", "0x420dd381b31aef6683db6b902084cb0ffece4fab"),
+    ("SwapBased V3", "0x816fF4C7447186730c46D4c46d04412bE4246220"),
+]
+STABLES = [
+    "0x833589fCD6eDb6E08f4c7C32D4f71b54bDA02913", # USDC
+    "0xfde4c96c8593536e31f229ea8f37b2adb8523a2a", # USDT
+    "0x50c5725949a6f0c72e6c4a641f24049a917db0cb"  # DAI
+]
+WETH_ADDRESS = "0x4200000000000000000000000000000000000006"
+
 
 class OracleHunter:
     def __init__(self, config):
@@ -111,6 +126,7 @@ class OracleHunter:
         self.last_cex_price = 0.0
         self.last_dex_price = 0.0
         self.decimals_cache = {} # Cache for token decimals
+        self._quoter = None      # (w3, PoolQuoter) for batched Multicall3 reads
 
     def get_token_decimals(self, w3, token_address):
         """
@@ -222,8 +238,28 @@ class OracleHunter:
             return 0.0
 
 
+    def quoter(self, w3):
+        """PoolQuoter over Multicall3 for this connection (built once per w3)."""
+        if self._quoter is None or self._quoter[0] is not w3:
+            quoter = PoolQuoter(
+                Multicall3(w3), V3_FACTORIES,
+                aerodrome_router=AERODROME_ROUTER_ADDRESS,
+                aerodrome_factory=AERODROME_FACTORY_ADDRESS,
+                v2_router=UNISWAP_V2_ROUTER_ADDRESS,
+                stables=STABLES,
+            )
+            self._quoter = (w3, quoter)
+        return self._quoter[1]
+
     def find_active_pool(self, w3, token_in, token_out, factory_address, factory_abi):
-        """Scan all fee tiers [0.05%, 0.3%, 1.0%] to find live liquidity."""
+        """Scan all fee tiers [0.05%, 0.3%, 1.0%] to find live liquidity (one Multicall3 batch per step)."""
+        try:
+            pool_address, fee = self.quoter(w3).find_active_pool(token_in, token_out, factory_address)
+            return (Web3.to_checksum_address(pool_address), fee) if pool_address else (None, None)
+        except MulticallError:
+            return self._find_active_pool_serial(w3, token_in, token_out, factory_address, factory_abi)
+
+    def _find_active_pool_serial(self, w3, token_in, token_out, factory_address, factory_abi):
         FEE_TIERS = [500, 3000, 10000] # 0.05%, 0.3%, 1.0%
         POOL_ABI_MIN = [{"inputs":[],"name":"slot0","outputs":[{"internalType":"uint160","name":"sqrtPriceX96","type":"uint160"},{"internalType":"int24","name":"tick","type":"int24"},{"internalType":"uint16","name":"observationIndex","type":"uint16"},{"internalType":"uint16","name":"observationCardinality","type":"uint16"},{"internalType":"uint16","name":"observationCardinalityNext","type":"uint16"},{"internalType":"uint8","name":"feeProtocol","type":"uint8"},{"internalType":"bool","name":"unlocked","type":"bool"}],"stateMutability":"view","type":"function"}]
 
@@ -255,12 +291,52 @@ class OracleHunter:
             print("[HUNTER] :: Waiting for ETH Anchor Price...")
             await asyncio.sleep(2)
 
+    def get_on_chain_prices(self, w3, eth_price_usd, pairs):
+        """
+        Batched get_on_chain_price for [(token_in, token_out), ...].
+        Every pool search, slot0/token0 read, decimals lookup and router
+        quote goes through Multicall3 aggregate3 (two eth_calls for the
+        whole list). Falls back to serial reads if Multicall3 is unreachable.
+        """
+        try:
+            decimals = {k.lower(): v for k, v in PRESEEDED_DECIMALS.items()}
+            decimals.update((k.lower(), v) for k, v in self.decimals_cache.items())
+            known = set(decimals)
+            quotes = self.quoter(w3).quote(pairs, decimals)
+            for token in set(decimals) - known:
+                self.decimals_cache[Web3.to_checksum_address(token)] = decimals[token]
+        except MulticallError as e:
+            print(f"[QUOTER] :: Multicall unavailable ({e}) :: falling back to serial reads")
+            return [self._get_on_chain_price_serial(w3, eth_price_usd, a, b) for a, b in pairs]
+        except Exception as e:
+            print(f"[QUOTER] :: ERROR fetching prices: {e}")
+            return [(0.0, 0, "Error") for _ in pairs]
+
+        results = []
+        for (token_in, token_out), quote in zip(pairs, quotes):
+            if quote["price"] is None:
+                results.append((0.0, 0, "Error"))
+                continue
+            final_price = quote["price"]
+            # UNIT NORMALIZATION (The Rosetta Stone Fix)
+            if token_out.lower() == WETH_ADDRESS.lower():
+                final_price = final_price * eth_price_usd
+            results.append((final_price, 0, quote["venue"] or "V3-Dust"))
+        return results
+
     def get_on_chain_price(self, w3, eth_price_usd, token_in=None, token_out=None):
         """
         Query Uniswap V3 Pool directly (Slot0) to get price.
         Robust against Quoter reverts. Supports PEPE/DEGEN dynamic scaling.
         Fallbacks to Aerodrome CL if UniV3 pool not found.
         """
+        # Default to WETH/USDC if not specified
+        if not token_in: token_in = WETH_ADDRESS
+        if not token_out: token_out = "0x833589fCD6eDb6E08f4c7C32D4f71b54bDA02913" # USDC
+        return self.get_on_chain_prices(w3, eth_price_usd, [(token_in, token_out)])[0]
+
+    def _get_on_chain_price_serial(self, w3, eth_price_usd, token_in=None, token_out=None):
+        """One eth_call per read; used when Multicall3 is unavailable."""
         # SwapBased V3 Factory (Base)
         FACTORY_ADDRESS_SWAPBASED = Web3.to_checksum_address("0x816fF4C7447186730c46D4c46d04412bE4246220")
         
@@ -278,11 +354,7 @@ class OracleHunter:
             TOKEN_IN = Web3.to_checksum_address(token_in)
             TOKEN_OUT = Web3.to_checksum_address(token_out)
 
-            FACTORIES = [
-                ("Uniswap V3", Web3.to_checksum_address("0x33128a8fC17869897dcE68Ed026d694621f6FDfD")),
-                ("Aerodrome CL", Web3.to_checksum_address("0x420dd381b31aef6683db6b902084cb0ffece4fab")),
-                ("SwapBased V3", Web3.to_checksum_address("0x816fF4C7447186730c46D4c46d04412bE4246220"))
-            ]
+            FACTORIES = [(name, Web3.to_checksum_address(addr)) for name, addr in V3_FACTORIES]
 
             pool_address = None
             venue = None
@@ -294,12 +366,12 @@ class OracleHunter:
                 return 0.0, 0, "Error"
 
             for name, factory_addr in FACTORIES:
-                pool_address, fee_tier = self.find_active_pool(w3, TOKEN_IN, TOKEN_OUT, factory_addr, FACTORY_ABI)
+                pool_address, fee_tier = self._find_active_pool_serial(w3, TOKEN_IN, TOKEN_OUT, factory_addr, FACTORY_ABI)
                 if pool_address:
                     venue = name
                     break
                 # Try reversed order
-                pool_address, fee_tier = self.find_active_pool(w3, TOKEN_OUT, TOKEN_IN, factory_addr, FACTORY_ABI)
+                pool_address, fee_tier = self._find_active_pool_serial(w3, TOKEN_OUT, TOKEN_IN, factory_addr, FACTORY_ABI)
                 if pool_address:
                     venue = name
                     break
@@ -334,11 +406,6 @@ class OracleHunter:
             # 3. If Uniswap is Blind (Ghost Pool), Attempt Aerodrome
             if final_price < 1e-9: # Dust threshold (PEPE is ~1e-6, so 1e-9 is safe)
                 # Determine if pair is stable (USDT/USDC/DAI addresses)
-                STABLES = [
-                    "0x833589fCD6eDb6E08f4c7C32D4f71b54bDA02913", # USDC
-                    "0xfde4c96c8593536e31f229ea8f37b2adb8523a2a", # USDT
-                    "0x50c5725949a6f0c72e6c4a641f24049a917db0cb"  # DAI
-                ]
                 is_stable = (token_in.lower() in [s.lower() for s in STABLES]) and (token_out.lower() in [s.lower() for s in STABLES])
                 
                 aero_price = self.get_aerodrome_price(w3, TOKEN_IN, TOKEN_OUT, dec_in, dec_out, stable=is_stable)
@@ -357,8 +424,6 @@ class OracleHunter:
                         pass
 
             # 5. UNIT NORMALIZATION (The Rosetta Stone Fix)
-            WETH_ADDRESS = "0x4200000000000000000000000000000000000006"
-            
             # DEBUG PRINT
             # print(f"[DEBUG] Check Norm: Out={TOKEN_OUT} vs WETH={WETH_ADDRESS} | ETH_Price={eth_price_usd}")
 
@@ -480,22 +545,22 @@ class OracleHunter:
         # 1. Fetch ETH Price First (The Anchor)
         eth_price = await self.get_eth_price_usd()
 
+        # 2. Price every target on chain in one batch (Multicall3)
+        chain_quotes = dict(zip(self.targets, self.get_on_chain_prices(
+            w3, eth_price, [(d['base_address'], d['pair_address']) for d in self.targets.values()]
+        )))
+
         for symbol, data in self.targets.items():
             try:
                 print(f"[OMNI-HUNTER] :: Scanning {symbol}...")
                 
-                # 2. Fetch CEX Price for this symbol
+                # 3. Fetch CEX Price for this symbol
                 cex_price = await self.get_cex_price(data['cex_symbol'], data.get('coingecko_id'), data.get('base_address'))
                 if cex_price == 0:
                     continue
                 
-                # 3. Fetch Chain Price (Normalized)
-                chain_price, fee_tier, source = self.get_on_chain_price(
-                    w3, 
-                    eth_price,
-                    token_in=data['base_address'], 
-                    token_out=data['pair_address']
-                )
+                # Chain Price (Normalized, prefetched above)
+                chain_price, fee_tier, source = chain_quotes[symbol]
                 if chain_price == 0:
                     continue
                 
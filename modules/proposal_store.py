@@ -0,0 +1,198 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from modules.vault_archive import VaultArchive, read_record
+
+"""
+PROPOSAL STORE
+==============
+SQLite index over the proposals in the Evidence Vault.
+
+The vault directory holds every record ever written (proposals, sealed
+extractions, legacy mutation files). The ratification ceremony and the
+review console only ever want the few proposals in a given status, so
+the columns they filter and display are kept in one indexed table:
+
+    file | id | type | status | urgency | risk_level | author | timestamp | mtime_ns
+
+The VaultWriter upserts a row for every record it commits and the
+ceremony/console update it when they change a proposal's status, so
+listing PENDING proposals reads only those rows (and their files). A
+vault written before the store existed is backfilled once on first open;
+backfill() is also safe to re-run and only re-reads files whose mtime
+changed. Rows outlive rotation: a proposal rolled into the archive tier
+keeps its row and load() reads it back through read_record(). The store
+never creates the vault directory; readers check for it first.
+"""
+
+STORE_NAME = ".proposals.sqlite"
+PROPOSAL_PREFIX = "prop-"
+DEFAULT_STATUS = "PROPOSED"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS proposals (
+    file TEXT PRIMARY KEY,
+    id TEXT,
+    type TEXT,
+    status TEXT,
+    urgency TEXT,
+    risk_level TEXT,
+    author TEXT,
+    timestamp TEXT,
+    mtime_ns INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS proposals_status ON proposals (status, timestamp);
+CREATE INDEX IF NOT EXISTS proposals_type ON proposals (type, status);
+"""
+
+COLUMNS = ("file", "id", "type", "status", "urgency", "risk_level", "author", "timestamp", "mtime_ns")
+_UPSERT = f"INSERT OR REPLACE INTO proposals ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+
+def is_proposal(record, filename: str = "") -> bool:
+    """
+    Records with a lifecycle status, plus any prop-* file (status-less ones
+    are PROPOSED); mutation events carry event_type instead.
+    """
+    if not isinstance(record, dict):
+        return False
+    return "status" in record or os.path.basename(filename).startswith(PROPOSAL_PREFIX)
+
+
+class ProposalStore:
+    def __init__(self, vault_path: str = "evidence/proposals", db_path: Optional[str] = None):
+        self.vault_path = vault_path
+        self.db_path = db_path or os.path.join(vault_path, STORE_NAME)
+        fresh = not os.path.exists(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        if fresh:
+            self.backfill()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ProposalStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- Maintenance ---
+
+    def _row(self, filename: str, record: Dict, mtime_ns: int):
+        return (
+            os.path.basename(filename), record.get("id"), record.get("type"), record.get("status", DEFAULT_STATUS),
+            record.get("urgency"), record.get("risk_level"), record.get("author"),
+            record.get("timestamp"), mtime_ns,
+        )
+
+    def _mtime(self, filename: str) -> int:
+        try:
+            return os.stat(os.path.join(self.vault_path, os.path.basename(filename))).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def record(self, filename: str, record: Dict) -> None:
+        """Upserts the row for one proposal file (call after writing it)."""
+        self.record_many([(filename, record)])
+
+    def record_many(self, items: Iterable) -> int:
+        """Upserts (filename, record) pairs in one transaction; non-proposals are skipped."""
+        rows = [self._row(f, r, self._mtime(f)) for f, r in items if is_proposal(r, f)]
+        if rows:
+            with self._lock, self.conn:
+                self.conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def backfill(self) -> int:
+        """
+        Indexes vault files that are new or changed since they were last
+        indexed and drops rows whose file is in neither tier. Returns rows
+        written.
+        """
+        known = {r["file"]: r["mtime_ns"] for r in self.conn.execute("SELECT file, mtime_ns FROM proposals")}
+        rows, seen = [], set()
+        with os.scandir(self.vault_path) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or entry.name.startswith("."):
+                    continue
+                seen.add(entry.name)
+                mtime = entry.stat().st_mtime_ns
+                if known.get(entry.name) == mtime:
+                    continue
+                try:
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if is_proposal(data, entry.name):
+                    rows.append(self._row(entry.name, data, mtime))
+        missing = [name for name in known if name not in seen]
+        archived = VaultArchive(self.vault_path).archived() if missing else {}
+        gone = [(name,) for name in missing if name not in archived]
+        with self._lock, self.conn:
+            self.conn.executemany(_UPSERT, rows)
+            self.conn.executemany("DELETE FROM proposals WHERE file = ?", gone)
+        return len(rows)
+
+    # --- Queries ---
+
+    def query(self, status: Optional[str] = None, type: Optional[str] = None,
+              exclude_status: Optional[str] = None, prefix: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict]:
+        """Index rows matching every given filter, oldest first."""
+        where, args = [], []
+        if status is not None:
+            where.append("status = ?")
+            args.append(status)
+        if exclude_status is not None:
+            where.append("status IS NOT ?")
+            args.append(exclude_status)
+        if type is not None:
+            where.append("type = ?")
+            args.append(type)
+        if prefix is not None:
+            where.append("substr(file, 1, ?) = ?")
+            args += [len(prefix), prefix]
+        sql = "SELECT * FROM proposals"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY timestamp, file"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(r) for r in self.conn.execute(sql, args)]
+
+    def load(self, status: Optional[str] = None, **filters) -> List[Dict]:
+        """
+        Full proposal bodies for the matching rows (with "_filepath"), read
+        from whichever tier holds them. Rows whose file is in neither are
+        dropped from the index.
+        """
+        proposals, gone = [], []
+        for row in self.query(status=status, **filters):
+            path = os.path.join(self.vault_path, row["file"])
+            try:
+                data = read_record(self.vault_path, row["file"])
+            except FileNotFoundError:
+                gone.append((row["file"],))
+                continue
+            except (OSError, ValueError):
+                continue
+            data["_filepath"] = path
+            proposals.append(data)
+        if gone:
+            with self._lock, self.conn:
+                self.conn.executemany("DELETE FROM proposals WHERE file = ?", gone)
+        return proposals
+
+    def count(self, status: Optional[str] = None) -> int:
+        if status is None:
+            return self.conn.execute("SELECT COUNT(*) FROM proposals").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM proposals WHERE status = ?", (status,)).fetchone()[0]
@@ -1,41 +1,169 @@
+import asyncio
+import hashlib
 import json
 import os
-import aiofiles
+import time
 from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+try:
+    import aiofiles
+except ImportError:  # optional: fall back to a worker thread for the append
+    aiofiles = None
+
+MUTATION_LOG_DIR = "mutations"
+SEGMENT_PREFIX = "mutations-"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+def traits_digest(traits) -> str:
+    """Stable across processes and runs (unlike hash(), which is salted per process)."""
+    canonical = json.dumps(traits, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
+
+
+def _segments(log_dir: str):
+    try:
+        names = os.listdir(log_dir)
+    except FileNotFoundError:
+        return []
+    return sorted(n for n in names if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX))
+
+
+def _segment_name(index: int) -> str:
+    return f"{SEGMENT_PREFIX}{index:06d}{SEGMENT_SUFFIX}"
+
+
+def iter_mutations(log_dir: str, since: Optional[Tuple[str, int]] = None) -> Iterator[Tuple[Tuple[str, int], Dict]]:
+    """
+    Yields (position, record) for every mutation in log order. `position`
+    is (segment name, byte offset just past the record); pass the last one
+    back as `since` to resume after it. A torn trailing line is not yielded.
+    """
+    for name in _segments(log_dir):
+        if since and name < since[0]:
+            continue
+        offset = since[1] if since and name == since[0] else 0
+        with open(os.path.join(log_dir, name), "rb") as f:
+            f.seek(offset)
+            for line in iter(f.readline, b""):
+                if not line.endswith(b"\n"):
+                    break  # being written
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                yield (name, offset), record
+
 
 class Scribe:
-    def __init__(self, vault_path="evidence/proposals"):
+    """
+    Buffers mutation records in memory and flushes them as one append to a
+    rotating JSONL log (<vault>/mutations/mutations-NNNNNN.jsonl) when
+    `batch_size` records are pending or `flush_interval_sec` has passed.
+    A segment rolls over once it reaches `max_segment_bytes`. A failed
+    append puts its batch back at the front of the buffer for the next
+    flush. Read the log back with iter_mutations().
+    """
+
+    def __init__(self, vault_path="evidence/proposals", log_dir=None, batch_size=256,
+                 flush_interval_sec=5.0, max_segment_bytes=16 * 1024 * 1024):
         self.vault_path = vault_path
-        os.makedirs(vault_path, exist_ok=True)
+        self.log_dir = log_dir or os.path.join(vault_path, MUTATION_LOG_DIR)
+        os.makedirs(self.log_dir, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.max_segment_bytes = max_segment_bytes
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._flush_lock = asyncio.Lock()
+        self._flusher = None
+        segments = _segments(self.log_dir)
+        self._segment = int(segments[-1][len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) if segments else 1
 
     async def record_mutation(self, clone_id, generation, traits, pnl, outcome):
         """
-        Writes a significant evolutionary event to the Vault.
+        Buffers a significant evolutionary event for the Vault.
         Only records if PnL is non-zero (Signal) or if a Death occurred.
         """
-        timestamp = datetime.utcnow().isoformat()
-        # Unique ID combining clone + microsecond timestamp to avoid collisions
-        filename = f"mutation_{clone_id}_{int(datetime.utcnow().timestamp()*1000)}.json"
-        filepath = os.path.join(self.vault_path, filename)
-
         record = {
             "id": clone_id,
-            "timestamp": timestamp,
+            "timestamp": datetime.utcnow().isoformat(),
             "generation": generation,
             "event_type": outcome,  # EVOLVED, DIED, PROFIT, LOSS, MUTATION_DRIFT
             "pnl": pnl,
             "traits": traits,       # The specific parameters (slippage, etc.)
-            "genetic_hash": hash(str(traits)) # Simple integrity check
+            "genetic_hash": traits_digest(traits)  # Stable integrity check
         }
+        self._buffer.append(record)
+
+        if self._flusher is None:
+            # Idle swarms still get their records out within one interval
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval_sec:
+            await self.flush()
+        return record
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval_sec)
+            if self._buffer:
+                try:
+                    await self.flush()
+                except OSError:
+                    pass  # batch is back in the buffer; retried next interval
 
-        # Async write to avoid hydrostatic lock
-        # Note: aiofiles needs to be installed. If not, fallback to sync write for scaffolding.
+    def _segment_path(self, incoming: int) -> Tuple[str, bool]:
+        """(segment to append to, whether its tail is torn by a failed append)."""
+        path = os.path.join(self.log_dir, _segment_name(self._segment))
         try:
-             async with aiofiles.open(filepath, mode='w') as f:
-                await f.write(json.dumps(record, indent=2))
-        except NameError: 
-             # Fallback if aiofiles isn't imported/installed in environment
-             with open(filepath, 'w') as f:
-                json.dump(record, f, indent=2)
-        
-        return filepath
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            size = 0
+        if size and size + incoming > self.max_segment_bytes:
+            self._segment += 1
+            return os.path.join(self.log_dir, _segment_name(self._segment)), False
+        if not size:
+            return path, False
+        with open(path, "rb") as f:
+            f.seek(size - 1)
+            return path, f.read(1) != b"\n"
+
+    @staticmethod
+    def _append(path: str, data: bytes) -> None:
+        with open(path, "ab") as f:
+            f.write(data)
+
+    async def flush(self):
+        """Writes every buffered record with one append."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return 0
+            batch, self._buffer = self._buffer, []
+            data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in batch).encode()
+            try:
+                path, torn = self._segment_path(len(data))
+                if torn:
+                    data = b"\n" + data  # seal off what the failed append left
+                if aiofiles is not None:
+                    async with aiofiles.open(path, mode="ab") as f:
+                        await f.write(data)
+                else:
+                    await asyncio.to_thread(self._append, path, data)
+            except Exception:  # not on cancellation: the worker thread still finishes the write
+                self._buffer[:0] = batch
+                raise
+            self._last_flush = time.monotonic()
+            return len(batch)
+
+    async def aclose(self):
+        """Stops the interval flusher and writes anything still buffered."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush()
+
+    def read(self, since=None):
+        """Reader for downstream consumers; see iter_mutations()."""
+        return iter_mutations(self.log_dir, since)
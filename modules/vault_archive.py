@@ -0,0 +1,216 @@
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+"""
+VAULT ARCHIVE
+=============
+Cold tier of the Evidence Vault.
+
+Hot records are the per-record JSON files in the vault directory. Older
+records are rolled into compressed, append-only segments instead of being
+deleted, so the HMAC chain and Merkle proofs stay verifiable:
+
+    .archive/segment-000001.jsonl.gz   one {"file", "mtime_ns", "record"} line per record
+    .archive/index.jsonl               one line per sealed segment:
+        {"segment", "name", "count", "files", "mtimes", "bytes_in", "bytes_out",
+         "sha256", "prev", "sealed_at"}
+
+Segments are written to a temp file, fsynced and renamed before their
+index line is appended; only then are the hot files unlinked. Each index
+line carries the sha256 of its segment and of the previous index line, so
+a rewritten segment or a dropped one is detected on read.
+
+read_record() is the tier-transparent lookup used by the verifiers: the
+hot file if present, otherwise the record from its archive segment.
+"""
+
+ARCHIVE_DIR = ".archive"
+INDEX_NAME = "index.jsonl"
+SEGMENT_MAX_RECORDS = 10000
+
+
+def _segment_name(number: int) -> str:
+    return f"segment-{number:06d}.jsonl.gz"
+
+
+def _sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _line_digest(entry: Dict) -> str:
+    return hashlib.sha256(json.dumps(entry, sort_keys=True).encode()).hexdigest()
+
+
+class VaultArchive:
+    def __init__(self, vault_path: str = "evidence/proposals"):
+        self.vault_path = vault_path
+        self.dir = os.path.join(vault_path, ARCHIVE_DIR)
+        self.index_path = os.path.join(self.dir, INDEX_NAME)
+        self._index: Optional[List[Dict]] = None
+        self._index_size = -1
+        self._where: Dict[str, int] = {}          # file -> position in index
+        self._cached: Tuple[Optional[str], Dict[str, Dict]] = (None, {})
+
+    # --- Index ---
+
+    def segments(self) -> List[Dict]:
+        """Sealed segments, oldest first (re-read only when the index grew)."""
+        try:
+            size = os.path.getsize(self.index_path)
+        except FileNotFoundError:
+            size = 0
+        if self._index is None or size != self._index_size:
+            index = []
+            if size:
+                with open(self.index_path, "r") as f:
+                    for line in f:
+                        try:
+                            index.append(json.loads(line))
+                        except ValueError:
+                            break  # torn tail: never sealed
+            self._index, self._index_size = index, size
+            self._where = {name: i for i, seg in enumerate(index) for name in seg["files"]}
+        return self._index
+
+    def archived(self) -> Dict[str, int]:
+        """file -> mtime_ns of every archived record."""
+        out = {}
+        for seg in self.segments():
+            out.update(zip(seg["files"], seg["mtimes"]))
+        return out
+
+    # --- Writing ---
+
+    def _append_index(self, entry: Dict) -> None:
+        with open(self.index_path, "ab+") as f:
+            size = f.seek(0, os.SEEK_END)
+            data = (json.dumps(entry, sort_keys=True) + "\n").encode()
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data  # seal off a torn trailing write
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write_segment(self, items: Iterable[Tuple[str, int, Dict]], bytes_in: int = 0) -> Optional[Dict]:
+        """
+        Seals (filename, mtime_ns, record) items as the next segment and
+        returns its index entry (None if `items` is empty). The hot files
+        are left for the caller to unlink once this returns.
+        """
+        os.makedirs(self.dir, exist_ok=True)
+        index = self.segments()
+        number = (index[-1]["segment"] if index else 0) + 1
+        path = os.path.join(self.dir, _segment_name(number))
+        files, mtimes = [], []
+        with open(path + ".tmp", "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+                for name, mtime_ns, record in items:
+                    gz.write((json.dumps({"file": name, "mtime_ns": mtime_ns, "record": record},
+                                         separators=(",", ":")) + "\n").encode())
+                    files.append(name)
+                    mtimes.append(mtime_ns)
+            raw.flush()
+            os.fsync(raw.fileno())
+        if not files:
+            os.remove(path + ".tmp")
+            return None
+        os.replace(path + ".tmp", path)
+        entry = {
+            "segment": number,
+            "name": _segment_name(number),
+            "count": len(files),
+            "files": files,
+            "mtimes": mtimes,
+            "bytes_in": bytes_in,
+            "bytes_out": os.path.getsize(path),
+            "sha256": _sha256_file(path),
+            "prev": _line_digest(index[-1]) if index else None,
+            "sealed_at": datetime.utcnow().isoformat(),
+        }
+        self._append_index(entry)
+        return entry
+
+    # --- Reading ---
+
+    def _load_segment(self, seg: Dict) -> Dict[str, Dict]:
+        if self._cached[0] == seg["name"]:
+            return self._cached[1]
+        path = os.path.join(self.dir, seg["name"])
+        if _sha256_file(path) != seg["sha256"]:
+            raise ValueError(f"archive segment {seg['name']} does not match its index digest")
+        records = {}
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                item = json.loads(line)
+                records[item["file"]] = item["record"]
+        # Lineage order follows archive order, so one cached segment serves a whole run.
+        self._cached = (seg["name"], records)
+        return records
+
+    def load(self, filename: str) -> Dict:
+        """The archived body of `filename`; FileNotFoundError if it was never archived."""
+        name = os.path.basename(filename)
+        index = self.segments()
+        if name not in self._where:
+            raise FileNotFoundError(name)
+        return self._load_segment(index[self._where[name]])[name]
+
+    def iter_records(self) -> Iterator[Tuple[str, Dict]]:
+        """(filename, record) for every archived record, oldest segment first."""
+        for seg in self.segments():
+            yield from self._load_segment(seg).items()
+
+    def head(self) -> Tuple[int, Optional[str]]:
+        """(segment number, index line digest) of the newest segment; (0, None) when empty."""
+        index = self.segments()
+        return (index[-1]["segment"], _line_digest(index[-1])) if index else (0, None)
+
+    def verify(self, after: int = 0, digest: Optional[str] = None) -> List[str]:
+        """
+        Problems with the archive itself: segment digests and the index chain.
+        Segments up to `after` are skipped while its index line still hashes
+        to `digest` (a head() recorded by an earlier clean run).
+        """
+        index = self.segments()
+        start = 0
+        if after and 0 < after <= len(index) and index[after - 1]["segment"] == after \
+                and _line_digest(index[after - 1]) == digest:
+            start = after
+        problems, prev = [], _line_digest(index[start - 1]) if start else None
+        for seg in index[start:]:
+            if seg.get("prev") != prev:
+                problems.append(f"{seg['name']}: index chain broken")
+            path = os.path.join(self.dir, seg["name"])
+            if not os.path.exists(path):
+                problems.append(f"{seg['name']}: missing")
+            elif _sha256_file(path) != seg["sha256"]:
+                problems.append(f"{seg['name']}: digest mismatch")
+            prev = _line_digest(seg)
+        return problems
+
+
+_ARCHIVES: Dict[str, VaultArchive] = {}
+
+
+def read_record(vault_path: str, filename: str) -> Dict:
+    """A vault record from whichever tier holds it (hot file first)."""
+    try:
+        with open(os.path.join(vault_path, filename), "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        pass
+    key = os.path.abspath(vault_path)
+    archive = _ARCHIVES.get(key)
+    if archive is None:
+        archive = _ARCHIVES[key] = VaultArchive(vault_path)
+    return archive.load(filename)
@@ -0,0 +1,165 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from modules.vault_archive import VaultArchive
+
+"""
+VAULT MANIFEST
+==============
+Append-only ledger of the sealed records in the Evidence Vault.
+
+Each line is one sealed record in lineage order:
+
+    {"seq": 7, "file": "ext-1700000000-ab12.json", "parent_hash": "...", "signature": "...", "ts": "..."}
+
+The tip of the chain is the last line, read with one seek from the end of
+the file, so startup no longer lists and sorts the vault (which also mixes
+mutation records and proposals) and lineage order no longer depends on
+lexicographic filenames.
+"""
+
+MANIFEST_NAME = ".manifest.jsonl"
+GENESIS = "GENESIS"
+
+
+class VaultManifest:
+    def __init__(self, vault_path: str = "evidence/proposals"):
+        self.vault_path = vault_path
+        self.path = os.path.join(vault_path, MANIFEST_NAME)
+        os.makedirs(vault_path, exist_ok=True)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def tip(self, before: Optional[int] = None) -> Optional[Dict]:
+        """
+        Last sealed entry (ending at or before byte offset `before`), or None
+        for an empty vault. O(1) in vault size.
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            if before is not None:
+                end = min(end, before)
+            block = 4096
+            tail = b""
+            pos = end
+            while pos > 0:
+                step = min(block, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+                # Every complete line except a torn trailing write
+                lines = tail.split(b"\n")
+                complete = lines[:-1] if not tail.endswith(b"\n") else lines
+                for line in reversed(complete[1:] if pos > 0 else complete):
+                    entry = self._parse(line)
+                    if entry is not None:
+                        return entry
+            return None
+
+    @staticmethod
+    def _parse(line: bytes) -> Optional[Dict]:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return None
+        return entry if isinstance(entry, dict) and "signature" in entry else None
+
+    def append(self, filename: str, parent_hash: str, signature: str) -> Dict:
+        """Records a sealed record as the new tip (one appended line)."""
+        return self.append_many([(filename, parent_hash, signature)])[-1]
+
+    def append_many(self, records) -> List[Dict]:
+        """Records (filename, parent_hash, signature) tuples in order with one write."""
+        tip = self.tip()
+        seq = tip["seq"] if tip else 0
+        ts = datetime.utcnow().isoformat()
+        entries = []
+        for filename, parent_hash, signature in records:
+            seq += 1
+            entries.append({
+                "seq": seq,
+                "file": os.path.basename(filename),
+                "parent_hash": parent_hash,
+                "signature": signature,
+                "ts": ts,
+            })
+        line = "".join(json.dumps(e, sort_keys=True) + "\n" for e in entries).encode()
+        with open(self.path, "ab+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line  # seal off a torn trailing write
+            f.write(line)
+        return entries
+
+    def entries(self, offset: int = 0) -> Iterator[Dict]:
+        """Entries in lineage order, starting at byte `offset`."""
+        if not self.exists():
+            return
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                entry = self._parse(line)
+                if entry is not None:
+                    yield entry
+
+    def rebuild(self) -> List[Dict]:
+        """
+        One-time migration for vaults sealed before the manifest existed:
+        follows parent_hash links from GENESIS through the signed records,
+        hot and archived (ties broken by timestamp), and writes the manifest
+        in that order.
+        """
+        def records():
+            for name in os.listdir(self.vault_path):
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(self.vault_path, name), "r") as f:
+                        yield name, json.load(f)
+                except (OSError, ValueError):
+                    continue
+            yield from VaultArchive(self.vault_path).iter_records()
+
+        children: Dict[str, List[Dict]] = {}
+        for name, data in records():
+            if not isinstance(data, dict) or "signature" not in data or "parent_hash" not in data:
+                continue  # unsigned mutation records and proposals are not in the chain
+            children.setdefault(data["parent_hash"], []).append(
+                {"file": name, "parent_hash": data["parent_hash"],
+                 "signature": data["signature"], "ts": data.get("timestamp", "")}
+            )
+
+        chain = []
+        parent = GENESIS
+        seen = set()
+        while parent in children and parent not in seen:
+            seen.add(parent)
+            entry = sorted(children[parent], key=lambda e: (e["ts"], e["file"]))[0]
+            entry["seq"] = len(chain) + 1
+            chain.append(entry)
+            parent = entry["signature"]
+
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            for entry in chain:
+                f.write(json.dumps(entry, sort_keys=True) + "\n")
+        os.replace(tmp, self.path)
+        return chain
@@ -0,0 +1,232 @@
+import bisect
+import hashlib
+import hmac
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process serialization only
+    fcntl = None
+
+from modules.vault_archive import read_record
+from modules.vault_manifest import VaultManifest
+
+"""
+VAULT MERKLE CHECKPOINTS
+========================
+Periodic Merkle roots over batches of sealed vault records.
+
+The HMAC chain proves a record only by walking every record before it.
+Every `batch_size` sealed records (in manifest order) get a Merkle tree:
+
+    leaf = sha256(0x00 || canonical record JSON)
+    node = sha256(0x01 || left || right)      (an unpaired node is carried up)
+
+Roots are appended to .merkle/roots.jsonl, each line linking the previous
+root, and the inclusion proof of every record in the batch is stored
+beside it in .merkle/batch_<n>.json. An auditor checks one record with
+its leaf hash and log2(batch_size) node hashes; anyone holding a
+published root can verify a record without the rest of the vault.
+
+Sealing holds an flock on .merkle/update.lock (POSIX), so producers in
+several processes that all call update() after their writes seal each
+batch exactly once.
+"""
+
+MERKLE_DIR = ".merkle"
+ROOTS_NAME = "roots.jsonl"
+STATE_NAME = "state.json"
+LOCK_NAME = "update.lock"
+
+
+def leaf_hash(record: Dict) -> str:
+    """Leaf for one sealed record (the full JSON body, signature included)."""
+    body = json.dumps(record, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(b"\x00" + body).hexdigest()
+
+
+def _node(left: str, right: str) -> str:
+    return hashlib.sha256(b"\x01" + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def build_tree(leaves: Sequence[str]) -> Tuple[str, List[List[Tuple[str, str]]]]:
+    """Root and, per leaf, its proof as [(side, sibling_hash), ...] from the leaf up."""
+    proofs: List[List[Tuple[str, str]]] = [[] for _ in leaves]
+    # Each level holds (hash, leaf indices under it)
+    level = [(h, [i]) for i, h in enumerate(leaves)]
+    while len(level) > 1:
+        nxt = []
+        for j in range(0, len(level) - 1, 2):
+            (lh, li), (rh, ri) = level[j], level[j + 1]
+            for i in li:
+                proofs[i].append(("R", rh))
+            for i in ri:
+                proofs[i].append(("L", lh))
+            nxt.append((_node(lh, rh), li + ri))
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+    return (level[0][0] if level else hashlib.sha256(b"").hexdigest()), proofs
+
+
+def verify_proof(leaf: str, proof: Sequence[Sequence[str]], root: str) -> bool:
+    """O(log n) inclusion check; needs no key and no other records."""
+    h = leaf
+    for side, sibling in proof:
+        h = _node(sibling, h) if side == "L" else _node(h, sibling)
+    return hmac.compare_digest(h, root)
+
+
+class MerkleCheckpointer:
+    def __init__(self, vault_path: str = "evidence/proposals", batch_size: int = 256, root_key: Optional[bytes] = None):
+        self.vault_path = vault_path
+        self.batch_size = batch_size
+        self.root_key = root_key or os.getenv("SENTINEL_ROOT_KEY", "COHERENCE_DEFAULT_SECRET").encode()
+        self.dir = os.path.join(vault_path, MERKLE_DIR)
+        self.manifest = VaultManifest(vault_path)
+        os.makedirs(self.dir, exist_ok=True)
+
+    # --- State ---
+
+    def _state(self) -> Dict:
+        try:
+            with open(os.path.join(self.dir, STATE_NAME), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"batches": 0, "next_seq": 1, "offset": 0, "last_root": None}
+
+    def _save_state(self, state: Dict) -> None:
+        path = os.path.join(self.dir, STATE_NAME)
+        with open(path + ".tmp", "w") as f:
+            json.dump(state, f)
+        os.replace(path + ".tmp", path)
+
+    def roots(self) -> List[Dict]:
+        """Published roots, oldest first."""
+        try:
+            with open(os.path.join(self.dir, ROOTS_NAME), "r") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except OSError:
+            return []
+
+    def _root_mac(self, batch: int, first_seq: int, last_seq: int, root: str, prev: Optional[str]) -> str:
+        msg = f"{batch}:{first_seq}:{last_seq}:{root}:{prev}".encode()
+        return hmac.new(self.root_key, msg, hashlib.sha256).hexdigest()
+
+    # --- Sealing ---
+
+    @contextmanager
+    def _locked(self):
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(os.path.join(self.dir, LOCK_NAME), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
+    def update(self, seal_partial: bool = False) -> List[Dict]:
+        """
+        Seals every complete batch of records appended to the manifest since
+        the last run (and the trailing partial batch if `seal_partial`).
+        Reads only the new manifest entries and their record files.
+        """
+        with self._locked():
+            return self._update(seal_partial)
+
+    def _update(self, seal_partial: bool) -> List[Dict]:
+        state = self._state()
+        pending = []   # (entry, manifest offset just past it)
+        if self.manifest.exists():
+            with open(self.manifest.path, "rb") as f:
+                f.seek(state["offset"])
+                for line in iter(f.readline, b""):
+                    entry = self.manifest._parse(line)
+                    if entry is not None:
+                        pending.append((entry, f.tell()))
+
+        sealed = []
+        while len(pending) >= self.batch_size or (seal_partial and pending):
+            batch, pending = pending[:self.batch_size], pending[self.batch_size:]
+            leaves, files = [], []
+            for entry, _ in batch:
+                leaves.append(leaf_hash(read_record(self.vault_path, entry["file"])))
+                files.append(entry["file"])
+            root, proofs = build_tree(leaves)
+
+            number = state["batches"] + 1
+            first_seq, last_seq = batch[0][0]["seq"], batch[-1][0]["seq"]
+            with open(os.path.join(self.dir, f"batch_{number}.json"), "w") as bf:
+                json.dump({
+                    "batch": number, "first_seq": first_seq, "last_seq": last_seq, "root": root,
+                    "files": files, "leaves": leaves, "proofs": proofs,
+                }, bf)
+            line = {
+                "batch": number, "first_seq": first_seq, "last_seq": last_seq, "root": root,
+                "prev_root": state["last_root"],
+                "sealed_at": datetime.utcnow().isoformat(),
+                "mac": self._root_mac(number, first_seq, last_seq, root, state["last_root"]),
+            }
+            with open(os.path.join(self.dir, ROOTS_NAME), "a") as rf:
+                rf.write(json.dumps(line, sort_keys=True) + "\n")
+
+            state.update(batches=number, next_seq=last_seq + 1, offset=batch[-1][1], last_root=root)
+            self._save_state(state)
+            sealed.append(line)
+        return sealed
+
+    # --- Auditing ---
+
+    def _root_for(self, seq: int) -> Optional[Dict]:
+        roots = self.roots()
+        i = bisect.bisect_right([r["first_seq"] for r in roots], seq) - 1
+        if i < 0 or seq > roots[i]["last_seq"]:
+            return None
+        return roots[i]
+
+    def prove(self, seq: int) -> Optional[Dict]:
+        """Everything an external verifier needs for record `seq`, or None if not yet sealed."""
+        root = self._root_for(seq)
+        if root is None:
+            return None
+        with open(os.path.join(self.dir, f"batch_{root['batch']}.json"), "r") as f:
+            batch = json.load(f)
+        i = seq - batch["first_seq"]
+        return {"seq": seq, "file": batch["files"][i], "leaf": batch["leaves"][i],
+                "proof": batch["proofs"][i], "root": root}
+
+    def audit(self, seq: int) -> Dict:
+        """
+        Checks one record against its batch root: recomputes the leaf from
+        the record file, folds the proof, and checks the root's seal.
+        """
+        proof = self.prove(seq)
+        if proof is None:
+            return {"seq": seq, "status": "unsealed"}
+        root = proof["root"]
+        root_ok = hmac.compare_digest(
+            root["mac"],
+            self._root_mac(root["batch"], root["first_seq"], root["last_seq"], root["root"], root["prev_root"]),
+        )
+        try:
+            leaf = leaf_hash(read_record(self.vault_path, proof["file"]))
+        except (OSError, ValueError):
+            leaf = None
+        included = leaf is not None and verify_proof(leaf, proof["proof"], root["root"])
+        return {
+            "seq": seq,
+            "file": proof["file"],
+            "batch": root["batch"],
+            "status": "ok" if included and root_ok else "compromised",
+            "root_sealed": root_ok,
+            "included": included,
+        }
+
+    def audit_range(self, first_seq: int, last_seq: int) -> List[Dict]:
+        return [self.audit(seq) for seq in range(first_seq, last_seq + 1)]
@@ -0,0 +1,328 @@
+import atexit
+import hashlib
+import hmac
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process serialization only
+    fcntl = None
+
+from modules.proposal_store import ProposalStore
+from modules.vault_manifest import GENESIS, VaultManifest
+
+"""
+VAULT WRITER
+============
+Single writer for the Evidence Vault.
+
+Producers (HoloeconomicSink, Learner, the MCP proposal tools) submit
+records to one queue per vault; mutation events go to the Scribe's own
+batched log instead. A background thread drains it in batches
+and group-commits each batch:
+
+    1. assign monotonic sequence numbers; seal records that ask for it
+       (parent_hash = current tip, HMAC-SHA256 signature) strictly in order
+    2. append the whole batch to .journal/vault.jsonl with one write + fsync
+    3. materialize the per-record JSON files, append the sealed ones to
+       the vault manifest with one write and upsert proposals into the
+       proposal store
+    4. advance .journal/applied.json
+
+Once the journal passes `journal_max_bytes` and the batch is applied it
+is truncated (compact() does the same on demand, e.g. from retention);
+the record files and the manifest are the durable copy from then on. A
+journal shorter than the applied offset was compacted, not lost.
+
+The commit holds an flock on .journal/writer.lock (POSIX), so writers in
+several processes still extend one linear chain. Anything journaled but
+not yet applied when a process died is replayed by the next commit.
+"""
+
+JOURNAL_DIR = ".journal"
+JOURNAL_NAME = "vault.jsonl"
+APPLIED_NAME = "applied.json"
+LOCK_NAME = "writer.lock"
+JOURNAL_MAX_BYTES = 1 << 20
+
+# Body fields added after sealing (excluded from the HMAC, as verify_vault expects)
+UNSIGNED_FIELDS = ("justification", "coherence_score")
+
+
+class _Job:
+    __slots__ = ("filename", "record", "sealed", "extras", "future")
+
+    def __init__(self, filename, record, sealed, extras):
+        self.filename = os.path.basename(filename)
+        self.record = record
+        self.sealed = sealed
+        self.extras = extras or {}
+        self.future = Future()
+
+
+class VaultWriter:
+    def __init__(self, vault_path: str = "evidence/proposals", root_key: Optional[bytes] = None,
+                 batch_max: int = 512, linger_sec: float = 0.002, materialize: bool = True,
+                 journal_max_bytes: int = JOURNAL_MAX_BYTES):
+        self.vault_path = vault_path
+        self.root_key = root_key or os.getenv("SENTINEL_ROOT_KEY", "COHERENCE_DEFAULT_SECRET").encode()
+        self.batch_max = batch_max
+        self.linger_sec = linger_sec
+        self.materialize = materialize
+        self.journal_max_bytes = journal_max_bytes
+        self.dir = os.path.join(vault_path, JOURNAL_DIR)
+        os.makedirs(self.dir, exist_ok=True)
+        self.journal_path = os.path.join(self.dir, JOURNAL_NAME)
+        self.manifest = VaultManifest(vault_path)
+        self._proposals: Optional[ProposalStore] = None
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self.batches = 0
+
+    # --- Producer API ---
+
+    def submit(self, filename: str, record: Dict, sealed: bool = False, extras: Optional[Dict] = None) -> Future:
+        """
+        Queues one record. The future resolves to {"seq", "path"} (plus
+        "parent_hash" and "signature" when sealed) once its batch is durable.
+        """
+        if self._closed:
+            raise RuntimeError("VaultWriter is closed")
+        job = _Job(filename, dict(record), sealed, extras)
+        self._ensure_thread()
+        self._queue.put(job)
+        return job.future
+
+    def write(self, filename: str, record: Dict, sealed: bool = False, extras: Optional[Dict] = None) -> Dict:
+        """Blocking submit()."""
+        return self.submit(filename, record, sealed, extras).result()
+
+    def compact(self) -> int:
+        """
+        Applies anything pending, then truncates the journal. Returns the
+        bytes reclaimed.
+        """
+        with self._locked():
+            applied = self._pending_applied()
+            self._truncate_journal(applied["seq"])
+            return applied["offset"]
+
+    def close(self) -> None:
+        """Commits everything queued and stops the writer thread."""
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._proposals is not None:
+            self._proposals.close()
+            self._proposals = None
+
+    # --- Writer thread ---
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="vault-writer", daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            job = self._queue.get()
+            if job is None:
+                break
+            batch = [job]
+            deadline = time.monotonic() + self.linger_sec
+            while len(batch) < self.batch_max:
+                try:
+                    timeout = deadline - time.monotonic()
+                    nxt = self._queue.get_nowait() if timeout <= 0 else self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stopping = True
+                    break
+                batch.append(nxt)
+            try:
+                results = self._commit(batch)
+            except Exception as e:
+                for j in batch:
+                    j.future.set_exception(e)
+            else:
+                for j, res in zip(batch, results):
+                    j.future.set_result(res)
+
+    @contextmanager
+    def _locked(self):
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(os.path.join(self.dir, LOCK_NAME), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
+    def _applied(self) -> Dict:
+        try:
+            with open(os.path.join(self.dir, APPLIED_NAME), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"seq": 0, "offset": 0}
+
+    def _save_applied(self, seq: int, offset: int) -> None:
+        path = os.path.join(self.dir, APPLIED_NAME)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"seq": seq, "offset": offset}, f)
+        os.replace(path + ".tmp", path)
+
+    @property
+    def proposals(self) -> ProposalStore:
+        if self._proposals is None:
+            self._proposals = ProposalStore(self.vault_path)
+        return self._proposals
+
+    def _apply(self, entries: List[Dict]) -> None:
+        """Materializes record files, extends the manifest and the proposal index (idempotent on replay)."""
+        if self.materialize:
+            for e in entries:
+                with open(os.path.join(self.vault_path, e["file"]), "w") as f:
+                    json.dump(e["record"], f, indent=2)
+            self.proposals.record_many((e["file"], e["record"]) for e in entries)
+        sealed = [e for e in entries if e.get("chain_seq")]
+        if sealed:
+            tip = self.manifest.tip()
+            known = tip["seq"] if tip else 0
+            fresh = [e for e in sealed if e["chain_seq"] > known]
+            if fresh:
+                self.manifest.append_many(
+                    [(e["file"], e["record"]["parent_hash"], e["record"]["signature"]) for e in fresh]
+                )
+
+    def _pending_applied(self) -> Dict:
+        """applied.json, after replaying or reconciling the journal against it."""
+        applied = self._applied()
+        size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+        if size < applied["offset"]:
+            # Truncated by a compaction that died before saving applied.json
+            applied = {"seq": applied["seq"], "offset": 0}
+            self._save_applied(applied["seq"], 0)
+        if size != applied["offset"]:
+            applied = self._recover(applied)
+        return applied
+
+    def _truncate_journal(self, seq: int) -> None:
+        if os.path.exists(self.journal_path):
+            os.truncate(self.journal_path, 0)
+        self._save_applied(seq, 0)
+
+    def _recover(self, applied: Dict) -> Dict:
+        """Applies journal entries a crashed writer made durable but never applied."""
+        entries = []
+        offset = applied["offset"]
+        with open(self.journal_path, "rb") as f:
+            f.seek(offset)
+            for line in iter(f.readline, b""):
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("torn")
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break  # torn tail: never acknowledged, drop it
+                offset = f.tell()
+        if offset != os.path.getsize(self.journal_path):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(offset)
+        self._apply(entries)
+        seq = entries[-1]["seq"] if entries else applied["seq"]
+        self._save_applied(seq, offset)
+        return {"seq": seq, "offset": offset}
+
+    def _commit(self, batch: List[_Job]) -> List[Dict]:
+        with self._locked():
+            applied = self._pending_applied()
+
+            tip = self.manifest.tip()
+            chain_seq = tip["seq"] if tip else 0
+            last_hash = tip["signature"] if tip else GENESIS
+            seq = applied["seq"]
+            entries, results = [], []
+            for job in batch:
+                seq += 1
+                record = job.record
+                entry = {"seq": seq, "file": job.filename, "record": record}
+                result = {"seq": seq, "path": os.path.join(self.vault_path, job.filename)}
+                if job.sealed:
+                    for k in UNSIGNED_FIELDS:
+                        record.pop(k, None)
+                    record["parent_hash"] = last_hash
+                    payload_str = json.dumps(record, sort_keys=True)
+                    signature = hmac.new(self.root_key, payload_str.encode(), hashlib.sha256).hexdigest()
+                    record["signature"] = signature
+                    record.update(job.extras)
+                    chain_seq += 1
+                    entry["chain_seq"] = chain_seq
+                    result.update(parent_hash=last_hash, signature=signature)
+                    last_hash = signature
+                else:
+                    record.update(job.extras)
+                entries.append(entry)
+                results.append(result)
+
+            data = "".join(json.dumps(e, sort_keys=True) + "\n" for e in entries).encode()
+            with open(self.journal_path, "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(entries)
+            offset = applied["offset"] + len(data)
+            self._save_applied(seq, offset)
+            if offset >= self.journal_max_bytes:
+                self._truncate_journal(seq)
+            self.batches += 1
+        return results
+
+    # --- Reader ---
+
+    def iter_journal(self) -> Iterator[Dict]:
+        """Records committed since the journal was last truncated, in sequence order."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return
+
+
+_WRITERS: Dict[str, VaultWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def get_writer(vault_path: str = "evidence/proposals") -> VaultWriter:
+    """The process-wide writer for `vault_path` (one queue per vault)."""
+    key = os.path.abspath(vault_path)
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None or writer._closed:
+            writer = _WRITERS[key] = VaultWriter(vault_path)
+        return writer
+
+
+@atexit.register
+def _close_writers() -> None:
+    for writer in list(_WRITERS.values()):
+        writer.close()
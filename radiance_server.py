@@ -11,6 +11,8 @@ import time
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from modules.vault_writer import get_writer
+
 # --- 1. CONFIGURATION ---
 load_dotenv()
 
@@ -52,6 +54,21 @@ def get_variance_status() -> str:
     except Exception as e:
         return f"ERROR OBSERVING REALITY: {str(e)}"
 
+@mcp.tool()
+def get_watchtower_board() -> str:
+    """
+    OBSERVE the live Watchtower state (The Body's Pulse).
+    Reads the shared-memory status board: last cycle, decision, drift and queue per watched target.
+    """
+    try:
+        from src.watchtower.status_board import DEFAULT_BOARD_PATH, read_board
+        slots = read_board(os.getenv("BLACKGLASS_STATUS_BOARD", DEFAULT_BOARD_PATH))
+        if not slots:
+            return "NO LIVE WATCHTOWER"
+        return json.dumps(slots, indent=2)
+    except Exception as e:
+        return f"ERROR READING STATUS BOARD: {str(e)}"
+
 @mcp.tool()
 def get_compliance_seal() -> str:
     """
@@ -136,11 +153,8 @@ def propose_directive(type: str, content: str, justification: str, urgency: str
         "urgency": urgency
     }
     
-    filepath = os.path.join(EVIDENCE_VAULT, f"{prop_id}.json")
-    
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(proposal, f, indent=2)
+        get_writer(EVIDENCE_VAULT).write(f"{prop_id}.json", proposal)
         return json.dumps({ "proposal_id": prop_id, "status": "QUEUED_FOR_REVIEW" })
     except Exception as e:
         return f"ERROR WRITING PROPOSAL: {str(e)}"
@@ -317,6 +331,7 @@ async def propose_self_optimization() -> dict:
         return {"status": "NO_ACTION", "message": "System is too healthy to optimize."}
     
     proposals = []
+    pending = []
     
     for finding in audit["findings"]:
         f_upper = finding.upper()
@@ -332,7 +347,6 @@ async def propose_self_optimization() -> dict:
             }
             
             # 3. Write to Evidence Vault (The Ballot Box)
-            filename = os.path.join(EVIDENCE_VAULT, f"{prop_id}.json")
             proposal_data = {
                 "id": prop_id,
                 "timestamp": datetime.datetime.utcnow().isoformat(),
@@ -345,11 +359,11 @@ async def propose_self_optimization() -> dict:
                 "urgency": "LOW"
             }
             
-            with open(filename, "w") as f:
-                json.dump(proposal_data, f, indent=2)
-                
+            pending.append(get_writer(EVIDENCE_VAULT).submit(f"{prop_id}.json", proposal_data))
             proposals.append(prop_id)
     
+    for future in pending:
+        future.result()  # one group commit for the whole set
     return {
         "status": "OPTIMIZATION_PROPOSED", 
         "health_score": audit["health_score"],
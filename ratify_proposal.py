@@ -1,10 +1,11 @@
 import json
 import os
-import glob
 import datetime
 import sys
 import time
 
+from modules.proposal_store import ProposalStore
+
 # Configuration
 EVIDENCE_VAULT = os.path.abspath(os.path.join(os.path.dirname(__file__), "evidence/proposals"))
 SOVEREIGN_IDENTITY = "ARCHITECT_OVERRIDE_AUTH_001"
@@ -37,22 +38,22 @@ def check_regency(runtime_config_path):
     except Exception as e:
         return False, f"ERROR: {e}"
 
-def load_proposals():
-    proposals = []
+_STORE = None
+
+def proposal_store():
+    global _STORE
+    if _STORE is None:
+        _STORE = ProposalStore(EVIDENCE_VAULT)
+    return _STORE
+
+def load_proposals(status=None):
+    """
+    Proposals (with "_filepath" for writing back), optionally only those in
+    `status`. Served from the proposal index: only matching files are read.
+    """
     if not os.path.exists(EVIDENCE_VAULT):
         return []
-    
-    files = glob.glob(os.path.join(EVIDENCE_VAULT, "*.json"))
-    
-    for filepath in files:
-        try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-                data["_filepath"] = filepath # Store path for writing back
-                proposals.append(data)
-        except:
-            pass
-    return proposals
+    return proposal_store().load(status=status)
 
 def print_header():
     print("\n" + "═" * 60)
@@ -143,6 +144,7 @@ def ratify_logic(p, decision, mode="ARCHITECT"):
         save_data = p.copy()
         del save_data["_filepath"]
         json.dump(save_data, f, indent=2)
+    proposal_store().record(p["_filepath"], save_data)
     
     time.sleep(1.5)
 
@@ -150,8 +152,7 @@ def ratify_proposals_batch(auto_mode=False, regency_mode=False):
     if not auto_mode:
         print("⚖️  INITIATING RATIFICATION CEREMONY...")
     
-    all_proposals = load_proposals()
-    pending = [p for p in all_proposals if p.get("status") == "PROPOSED"]
+    pending = load_proposals(status="PROPOSED")
     
     if not pending:
         if not auto_mode:
@@ -184,8 +185,7 @@ def interactive_ceremony():
         clear_screen()
         print_header()
         
-        all_proposals = load_proposals()
-        pending = [p for p in all_proposals if p.get("status") == "PROPOSED"]
+        pending = load_proposals(status="PROPOSED")
         
         if not pending:
             print("✨ THE VAULT IS SILENT. No pending proposals.")
@@ -194,9 +194,8 @@ def interactive_ceremony():
             if choice == "Q": break
             if choice == "H":
                 print("\n--- HISTORY ---")
-                for p in all_proposals:
-                    if p.get("status") != "PROPOSED":
-                        print(f"[{p.get('status')}] {p.get('id')} - {p.get('type')}")
+                for p in proposal_store().query(exclude_status="PROPOSED"):
+                    print(f"[{p.get('status')}] {p.get('id')} - {p.get('type')}")
                 input("\nPress Enter to continue...")
             continue
             
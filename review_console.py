@@ -1,41 +1,45 @@
 import os
 import json
-import glob
 import sys
 from colorama import Fore, Style, init
 
+from modules.proposal_store import ProposalStore
+
 init(autoreset=True)
 
 # Path to Evidence Vault
 # Assuming review_console.py is in blackglass-variance-core (same dir as radiance_server.py)
 EVIDENCE_VAULT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../evidence/proposals"))
 
-def list_proposals():
+def list_proposals(status=None):
     print(Fore.CYAN + f"\n>>> SCANNING VAULT: {EVIDENCE_VAULT}")
-    pattern = os.path.join(EVIDENCE_VAULT, "prop-*.json")
-    files = glob.glob(pattern)
+    if not os.path.exists(EVIDENCE_VAULT):
+        print(Fore.YELLOW + "   [EMPTY] No active proposals found.")
+        return
+    with ProposalStore(EVIDENCE_VAULT) as store:
+        rows = store.query(status=status, prefix="prop-")
     
-    if not files:
+    if not rows:
         print(Fore.YELLOW + "   [EMPTY] No active proposals found.")
         return
 
     print(Fore.WHITE + f"{'ID':<40} | {'TYPE':<25} | {'URGENCY':<10} | {'STATUS'}")
     print("-" * 100)
     
-    for fpath in files:
-        try:
-            with open(fpath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            pid = data.get("id", "UNKNOWN")
-            ptype = data.get("type", "UNKNOWN")
-            purgency = data.get("urgency", "NORMAL")
-            pstatus = data.get("status", "PROPOSED")
-            
-            color = Fore.GREEN if pstatus == "PROPOSED" else Fore.DIM
-            print(color + f"{pid:<40} | {ptype:<25} | {purgency:<10} | {pstatus}")
-        except Exception as e:
-            print(Fore.RED + f"!! CORRUPT FILE: {os.path.basename(fpath)}")
+    for row in rows:
+        pid = row["id"] or "UNKNOWN"
+        ptype = row["type"] or "UNKNOWN"
+        purgency = row["urgency"] or "NORMAL"
+        pstatus = row["status"] or "PROPOSED"
+        
+        color = Fore.GREEN if pstatus == "PROPOSED" else Fore.DIM
+        print(color + f"{pid:<40} | {ptype:<25} | {purgency:<10} | {pstatus}")
+    return rows
+
+def reindex():
+    with ProposalStore(EVIDENCE_VAULT) as store:
+        count = store.backfill()
+    print(Fore.GREEN + f">> PROPOSAL INDEX REFRESHED: {count} file(s) re-read")
 
 def read_proposal(prop_id):
     # Allow user to pass just the uuid part or full name
@@ -86,6 +90,8 @@ def approve_proposal(prop_id):
         
         with open(fpath, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
+        with ProposalStore(EVIDENCE_VAULT) as store:
+            store.record(fpath, data)
             
         print(Fore.GREEN + f">> ROYAL ASSENT GRANTED: {prop_id}")
         print(Fore.GREEN + f"   Status: APPROVED | Timestamp: {data['approved_at']}")
@@ -95,13 +101,15 @@ def approve_proposal(prop_id):
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python review_console.py [list | read <id> | approve <id>]")
+        print("Usage: python review_console.py [list [status] | read <id> | approve <id> | reindex]")
         return
 
     command = sys.argv[1].lower()
     
     if command == "list":
-        list_proposals()
+        list_proposals(sys.argv[2].upper() if len(sys.argv) > 2 else None)
+    elif command == "reindex":
+        reindex()
     elif command in ["read", "show"]:
         if len(sys.argv) < 3:
             print(f"Usage: python review_console.py {command} <proposal_id>")
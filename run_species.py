@@ -200,6 +200,8 @@ async def main():
 
     except KeyboardInterrupt:
         print("\n[SENTINEL] :: MANUAL OVERRIDE. SHUTTING DOWN.")
+    finally:
+        await scribe.aclose()  # flush buffered mutations
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,56 +1,143 @@
 import json
 import os
+import math
 from pathlib import Path
 from datetime import datetime
-from statistics import mean, stdev
 import hashlib
 
 EVIDENCE_PATH = Path("evidence/proposals")
 REPORT_PATH = Path("reports/signal_audit_report.md")
+CACHE_PATH = Path("reports/.signal_audit_cache.json")
+CACHE_VERSION = 1
 
-def analyze_proposals():
-    if not EVIDENCE_PATH.exists():
+class RunningStats:
+    """Welford's online mean/variance: one pass, no list of samples."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+def _summarize(raw):
+    """The per-file facts the report needs, from the file's bytes (read once)."""
+    entry = {"digest": hashlib.sha256(raw).hexdigest()[:16]}
+    try:
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("not a JSON object")
+    except ValueError as e:
+        entry["error"] = str(e)
+        return entry
+    entry["pnl"] = data.get("simulated_pnl", 0)
+    entry["latency"] = data.get("execution_latency_ms", 0)
+    if "confidence_score" in data:
+        entry["confidence"] = data["confidence_score"]
+    entry["failed"] = data.get("status") == "failed"
+    entry["blocked"] = bool(data.get("blocked_by_hibernation"))
+    return entry
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+        if cache.get("version") == CACHE_VERSION:
+            return cache["files"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def _save_cache(cache_path, files):
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(exist_ok=True)
+    tmp = cache_path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"version": CACHE_VERSION, "files": files}, f, separators=(",", ":"))
+    os.replace(tmp, cache_path)
+
+def analyze_proposals(evidence_path=EVIDENCE_PATH, cache_path=CACHE_PATH):
+    """
+    Streams the vault once: each file is stat'ed once and read only if its
+    (mtime, size) changed since the cached run; running aggregates are
+    folded from the per-file summaries.
+    """
+    evidence_path = Path(evidence_path)
+    if not evidence_path.exists():
         return {"error": "Evidence path absent"}
-    
-    files = list(EVIDENCE_PATH.glob("*.json"))
-    signals = []
-    
-    for f in files:
-        try:
-            with open(f) as fp:
-                data = json.load(fp)
-                data["_filename"] = f.name
-                data["_hash"] = hashlib.sha256(fp.read().encode()).hexdigest()[:16]
-                signals.append(data)
-        except Exception as e:
-            signals.append({"_filename": f.name, "error": str(e)})
-    
-    if not signals:
+
+    cached = _load_cache(cache_path)
+    files = {}
+    read = 0
+    with os.scandir(evidence_path) as it:
+        for item in it:
+            if not item.name.endswith(".json") or item.name.startswith("."):
+                continue
+            st = item.stat()
+            key = [st.st_mtime_ns, st.st_size]
+            hit = cached.get(item.name)
+            if hit is not None and hit["key"] == key:
+                files[item.name] = hit
+                continue
+            try:
+                with open(item.path, "rb") as fp:
+                    entry = _summarize(fp.read())
+            except OSError as e:
+                entry = {"digest": None, "error": str(e)}
+            entry["key"] = key
+            files[item.name] = entry
+            read += 1
+    if read or len(files) != len(cached):
+        _save_cache(cache_path, files)
+
+    if not files:
         return {"status": "empty", "count": 0}
-    
+
     # Aggregate metrics
-    profitable = [s for s in signals if s.get("simulated_pnl", 0) > 0]
-    failed = [s for s in signals if s.get("status") == "failed"]
-    hibernation_blocked = [s for s in signals if s.get("blocked_by_hibernation")]
-    
-    total_pnl = sum(s.get("simulated_pnl", 0) for s in signals)
-    avg_latency = mean([s.get("execution_latency_ms", 0) for s in signals]) if signals else 0
-    
-    # Confidence variance analysis
-    confidences = [s.get("confidence_score", 0) for s in signals if "confidence_score" in s]
-    conf_variance = stdev(confidences) if len(confidences) > 1 else 0
-    
+    profitable = failed = hibernation_blocked = 0
+    total_pnl = 0.0
+    latency, confidence = RunningStats(), RunningStats()
+    top, top_pnl = None, None
+    integrity = hashlib.sha256()
+    for name in sorted(files):
+        e = files[name]
+        integrity.update(f"{name}:{e['digest']}\n".encode())
+        pnl = e.get("pnl", 0)
+        profitable += pnl > 0
+        failed += e.get("failed", False)
+        hibernation_blocked += e.get("blocked", False)
+        total_pnl += pnl
+        latency.push(e.get("latency", 0))
+        if "confidence" in e:
+            confidence.push(e["confidence"])
+        if top_pnl is None or pnl > top_pnl:
+            top, top_pnl = name, pnl
+
     report = {
         "timestamp": datetime.utcnow().isoformat(),
-        "total_signals": len(signals),
-        "profitable_signals": len(profitable),
-        "failed_executions": len(failed),
-        "hibernation_blocks": len(hibernation_blocked),
+        "total_signals": len(files),
+        "profitable_signals": profitable,
+        "failed_executions": failed,
+        "hibernation_blocks": hibernation_blocked,
         "total_simulated_pnl_eth": round(total_pnl, 6),
-        "avg_latency_ms": round(avg_latency, 2),
-        "confidence_variance": round(conf_variance, 4),
-        "top_performer": max(signals, key=lambda x: x.get("simulated_pnl", 0))._filename if profitable else None,
-        "integrity_hash": hashlib.sha256(str(signals).encode()).hexdigest()[:16]
+        "avg_latency_ms": round(latency.mean, 2),
+        # Sample standard deviation, as this field has always reported
+        "confidence_variance": round(confidence.stdev, 4),
+        "top_performer": top if profitable else None,
+        "integrity_hash": integrity.hexdigest()[:16],
+        "files_read": read,
     }
     
     return report
@@ -1,7 +1,11 @@
 import os
+import sys
 import datetime
 import json
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.watchtower.status_board import DEFAULT_BOARD_PATH, read_board
+
 def audit():
     print("--- BLACKGLASS SOVEREIGN AUDIT (NIGHT 1) ---")
     
@@ -32,6 +36,20 @@ def audit():
             print(f"[SHARD] Final Equity: ${data['final_equity']:.2f}")
             print(f"[SHARD] Locked Status: {data.get('compliance_logs', [])[-1].get('status') if data.get('compliance_logs') else 'UNKNOWN'}")
 
+    # 4. Check Live Watchtowers (shared-memory status board, no file polling)
+    board_path = os.getenv("BLACKGLASS_STATUS_BOARD", DEFAULT_BOARD_PATH)
+    try:
+        slots = read_board(board_path)
+    except OSError as e:
+        print(f"[WATCH] Status board skipped: {e}")
+        slots = None
+    if slots == []:
+        print(f"[WATCH] No live watchtower state at {board_path}.")
+    for slot in slots or []:
+        age = datetime.datetime.now().timestamp() - slot["updated_at"]
+        print(f"[WATCH] {slot['target']}: cycle {slot['cycle']} {slot['decision']} "
+              f"(Drift={slot['drift']:.4f}, Queue={slot['queue_depth']}) {age:.0f}s ago")
+
     print("--- AUDIT COMPLETE ---")
 
 if __name__ == "__main__":
@@ -1,39 +1,110 @@
 import os
+import sys
 import json
 import time
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# Add root directory to path to allow importing modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.vault_archive import SEGMENT_MAX_RECORDS, VaultArchive
+from modules.vault_writer import JOURNAL_DIR, JOURNAL_NAME, VaultWriter
 
 EVIDENCE_PATH = Path("evidence/proposals")
 MAX_FILES = 1000
 RETENTION_HOURS = 24
 
-def rotate():
-    if not EVIDENCE_PATH.exists():
+def _scan(path):
+    """(mtime_ns, name, size) of every hot record, oldest first: one stat per file."""
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and not entry.name.startswith("."):
+                st = entry.stat()
+                entries.append((st.st_mtime_ns, entry.name, st.st_size))
+    entries.sort()
+    return entries
+
+def _compact_journal(evidence_path):
+    """Truncates the writer's journal up to applied.json; returns the bytes reclaimed."""
+    if not (evidence_path / JOURNAL_DIR / JOURNAL_NAME).exists():
+        return 0
+    writer = VaultWriter(str(evidence_path))
+    try:
+        return writer.compact()
+    finally:
+        writer.close()
+
+def rotate(evidence_path=EVIDENCE_PATH, max_files=MAX_FILES, retention_hours=RETENTION_HOURS):
+    """
+    Tiered retention: the newest `max_files` records younger than
+    `retention_hours` stay hot; older ones are rolled into compressed
+    archive segments (modules/vault_archive.py) and only then removed from
+    the hot tier. Pending proposals always stay hot. Nothing is deleted
+    that is not archived, so the vault stays verifiable end to end. The
+    writer's journal is compacted first (its records are already
+    materialized, so it is only crash-recovery state).
+    """
+    evidence_path = Path(evidence_path)
+    if not evidence_path.exists():
         return {"status": "no_op", "reason": "path_absent"}
-    
-    files = sorted(EVIDENCE_PATH.glob("*.json"), key=lambda x: x.stat().st_mtime)
-    deleted = []
-    
-    # Time-based culling
-    cutoff = time.time() - (RETENTION_HOURS * 3600)
-    for f in files:
-        if f.stat().st_mtime < cutoff:
-            f.unlink()
-            deleted.append(f.name)
-    
-    # Count-based culling (retain newest)
-    remaining = sorted(EVIDENCE_PATH.glob("*.json"), key=lambda x: x.stat().st_mtime)
-    if len(remaining) > MAX_FILES:
-        for old_file in remaining[:-MAX_FILES]:
-            old_file.unlink()
-            deleted.append(old_file.name)
-    
+
+    journal_reclaimed = _compact_journal(evidence_path)
+    entries = _scan(evidence_path)
+    cutoff_ns = int((time.time() - retention_hours * 3600) * 1e9)
+    overflow = len(entries) - max_files
+    candidates = [e for i, e in enumerate(entries) if e[0] < cutoff_ns or i < overflow]
+
+    archive = VaultArchive(str(evidence_path))
+    already = archive.archived()
+    archived, kept_pending, segments = [], 0, []
+    bytes_in = bytes_out = 0
+
+    def flush(batch, size):
+        entry = archive.write_segment(((n, m, r) for m, n, r in batch), bytes_in=size)
+        if entry:
+            segments.append(entry["name"])
+            for _, name, _ in batch:
+                os.remove(evidence_path / name)
+                archived.append(name)
+        return entry["bytes_out"] if entry else 0
+
+    batch, batch_bytes = [], 0
+    for mtime_ns, name, size in candidates:
+        path = evidence_path / name
+        if already.get(name) == mtime_ns:
+            path.unlink()  # sealed by an interrupted run; only the unlink was lost
+            archived.append(name)
+            continue
+        try:
+            with open(path, "rb") as f:
+                record = json.loads(f.read())
+        except (OSError, ValueError):
+            continue  # unreadable records stay hot for the verifier to flag
+        if isinstance(record, dict) and record.get("status") == "PROPOSED":
+            kept_pending += 1
+            continue
+        batch.append((mtime_ns, name, record))
+        batch_bytes += size
+        if len(batch) >= SEGMENT_MAX_RECORDS:
+            bytes_in += batch_bytes
+            bytes_out += flush(batch, batch_bytes)
+            batch, batch_bytes = [], 0
+    if batch:
+        bytes_in += batch_bytes
+        bytes_out += flush(batch, batch_bytes)
+
     return {
         "timestamp": datetime.utcnow().isoformat(),
-        "deleted_count": len(deleted),
-        "retained_count": len(remaining) - (len(remaining) - MAX_FILES if len(remaining) > MAX_FILES else 0),
-        "status": "purged" if deleted else "optimal"
+        "archived_count": len(archived),
+        "retained_count": len(entries) - len(archived),
+        "pending_kept_hot": kept_pending,
+        "segments": segments,
+        "bytes_in": bytes_in,
+        "bytes_out": bytes_out,
+        "journal_bytes_reclaimed": journal_reclaimed,
+        "status": "archived" if archived else "optimal"
     }
 
 if __name__ == "__main__":
@@ -21,6 +21,9 @@ def main():
         return
 
     count = learner.scan_vault()
+    patterns = learner.mine_failure_patterns()
+    if patterns:
+        print(f"{Fore.GREEN}Failure miner ranked {patterns} new pattern rule(s) from the full mutation history.")
     
     if count > 0:
         print(f"{Fore.GREEN}Success! Captured {count} new insights into 'evidence/expertise.yaml'.")
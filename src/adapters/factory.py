@@ -0,0 +1,40 @@
+from typing import Any, Dict, Optional
+
+TELEMETRY_MODES = ("mock", "air_node", "prometheus")
+ACTUATION_MODES = ("noop", "k8s", "shard_alpha")
+
+
+def build_telemetry_adapter(mode: str, options: Optional[Dict[str, Any]] = None):
+    """Telemetry adapter for a mode name, or None (mock is built per cycle)."""
+    options = options or {}
+    if mode == "mock":
+        # Mock adapter needs run_dir to generate/read artifacts, and we change
+        # run_dir every cycle, so callers instantiate it per cycle.
+        return None
+    elif mode == "air_node":
+        from src.adapters.telemetry.air_node import AirNodeTelemetryAdapter
+        adapter = AirNodeTelemetryAdapter(**options)
+        print(f"[WATCH] A.I.R. VaultNode: {adapter.base_url}")
+        print(f"[WATCH] Incident window: {adapter.window_sec}s | Saturation: {adapter.saturation_rate} inc/min")
+        return adapter
+    elif mode == "prometheus":
+        from src.adapters.telemetry.prometheus import PrometheusTelemetryAdapter
+        return PrometheusTelemetryAdapter(**options)
+    return None
+
+
+def build_actuation_adapter(mode: str, options: Optional[Dict[str, Any]] = None):
+    """Actuation adapter for a mode name, or None if unknown."""
+    options = options or {}
+    if mode == "noop":
+        from src.adapters.actuation.noop import NoopActuationAdapter
+        return NoopActuationAdapter(**options)
+    elif mode == "k8s":
+        from src.adapters.actuation.k8s import KubernetesActuationAdapter
+        return KubernetesActuationAdapter(**options)
+    elif mode == "shard_alpha":
+        from src.adapters.actuation.shard_alpha import ShardAlphaActuationAdapter
+        adapter = ShardAlphaActuationAdapter(**options)
+        print(f"[WATCH] Shard Alpha Actuation: {adapter.base_url}/interdict")
+        return adapter
+    return None
@@ -534,7 +534,7 @@ if __name__ == "__main__":
     # We use argparse for robust flag handling in Phase 5
     import argparse
     
-    if len(sys.argv) > 1 and sys.argv[1] in ["watch", "simulate", "analyze"]:
+    if len(sys.argv) > 1 and sys.argv[1] in ["watch", "simulate", "analyze", "replay", "sweep", "shards", "tsdb", "index", "blobs"]:
         parser = argparse.ArgumentParser(description="Blackglass Watchtower CLI")
         subparsers = parser.add_subparsers(dest="command", required=True)
         
@@ -548,6 +548,17 @@ if __name__ == "__main__":
         # Integration Adapters
         watch_parser.add_argument("--telemetry", choices=["mock", "prometheus"], default="mock", help="Telemetry Source")
         watch_parser.add_argument("--actuation", choices=["noop", "k8s"], default="noop", help="Actuation Target")
+        watch_parser.add_argument("--prefetch", action="store_true", help="Collect the next window before the tick fires")
+        watch_parser.add_argument("--adaptive", action="store_true", help="Adapt polling cadence to drift/queue pressure")
+        watch_parser.add_argument("--metrics-port", type=int, default=None, help="Serve Prometheus /metrics on this port")
+        watch_parser.add_argument("--log-rotate-sec", type=float, default=None, help="Also rotate watchtower.log after this many seconds")
+        watch_parser.add_argument("--log-compress", action="store_true", help="Gzip rotated watchtower.log files")
+        watch_parser.add_argument("--config", type=str, default=None, help="Hot-reloadable JSON config (thresholds, interval, adapters)")
+        watch_parser.add_argument("--status-board", type=str, default=None, help="Publish live state to this shared-memory status board file")
+        watch_parser.add_argument("--shadow", type=str, default=None, help="Shadow policies (JSON list or path to a JSON file)")
+        watch_parser.add_argument("--tsdb", type=str, default=None, help="Append drift/queue/latency to this time-series store directory")
+        watch_parser.add_argument("--index", type=str, default=None, help="Record every cycle summary in this SQLite evidence index")
+        watch_parser.add_argument("--blobs", type=str, default=None, help="Store cycle artifacts in this content-addressed blob store")
 
         # SIMULATE
         sim_parser = subparsers.add_parser("simulate", help="Run metrics simulation only")
@@ -559,6 +570,70 @@ if __name__ == "__main__":
         analyze_parser = subparsers.add_parser("analyze", help="Analyze existing run directory")
         analyze_parser.add_argument("target_dir", nargs="?", default="runs/cli_simulation", help="Directory to analyze")
 
+        # REPLAY
+        replay_parser = subparsers.add_parser("replay", help="Re-decide archived watch evidence (no sleeps, no actuation)")
+        replay_parser.add_argument("evidence_root", nargs="?", default="evidence", help="Evidence root or a single watch_* session")
+        replay_parser.add_argument("--variance-threshold", type=float, default=None, help="Override recorded variance threshold")
+        replay_parser.add_argument("--queue-threshold", type=float, default=None, help="Override recorded queue threshold")
+        replay_parser.add_argument("--cooldown", type=int, default=3, help="Debounce cooldown in cycles")
+        replay_parser.add_argument("--max-diffs", type=int, default=50, help="Decision diffs to print")
+
+        # SWEEP
+        sweep_parser = subparsers.add_parser("sweep", help="What-if grid over thresholds/cooldowns on archived signals")
+        sweep_parser.add_argument("evidence_root", nargs="?", default="evidence", help="Evidence root or a single watch_* session")
+        sweep_parser.add_argument("--variance", default="0.02:0.3:29", help="Variance thresholds: a,b,c or start:stop:num")
+        sweep_parser.add_argument("--queue", default="30:90:13", help="Queue thresholds: a,b,c or start:stop:num")
+        sweep_parser.add_argument("--cooldown", default="0,1,2,3,5,8", help="Cooldown cycles: a,b,c or start:stop:num")
+        sweep_parser.add_argument("--workers", type=int, default=None, help="Processes for large grids")
+        sweep_parser.add_argument("--top", type=int, default=10, help="Ranked combinations to print")
+
+        # SHARDS
+        shards_parser = subparsers.add_parser("shards", help="Sharded multi-process watchtower with per-shard leases")
+        shards_parser.add_argument("--targets", required=True, help="Comma-separated target names")
+        shards_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+        shards_parser.add_argument("--shards", type=int, default=None, help="Shard count (default: 4 per worker)")
+        shards_parser.add_argument("--cycles", type=int, default=5, help="Cycles per target")
+        shards_parser.add_argument("--interval", type=float, default=5, help="Seconds between cycles")
+        shards_parser.add_argument("--lease-dir", type=str, default=".watchtower_leases", help="Lease/assignment directory")
+        shards_parser.add_argument("--lease-ttl", type=float, default=30.0, help="Heartbeat age before a worker is replaced (must exceed --interval by 1s)")
+        shards_parser.add_argument("--output-dir", type=str, default=None, help="Override evidence directory")
+        shards_parser.add_argument("--telemetry", choices=["mock", "prometheus"], default="mock", help="Telemetry Source")
+        shards_parser.add_argument("--actuation", choices=["noop", "k8s"], default="noop", help="Actuation Target")
+        shards_parser.add_argument("--status-board", type=str, default=None, help="Publish live state to this shared-memory status board file")
+
+        # TSDB
+        tsdb_parser = subparsers.add_parser("tsdb", help="Ingest or query the watchtower time-series store")
+        tsdb_parser.add_argument("action", choices=["ingest", "query", "stats"], help="ingest evidence, query a series, or show sizes")
+        tsdb_parser.add_argument("--store", type=str, default="evidence/tsdb", help="Time-series store directory")
+        tsdb_parser.add_argument("--evidence-root", type=str, default="evidence", help="Evidence root to ingest")
+        tsdb_parser.add_argument("--target", type=str, default="watchtower", help="Series prefix for ingested signals")
+        tsdb_parser.add_argument("--series", type=str, default="watchtower/drift", help="Series to query")
+        tsdb_parser.add_argument("--hours", type=float, default=6, help="Query window ending now")
+        tsdb_parser.add_argument("--step", type=float, default=None, help="Downsample bucket in seconds (raw points if unset)")
+        tsdb_parser.add_argument("--agg", default="mean", help="Downsample aggregate: mean/min/max/sum/count/first/last")
+
+        # INDEX
+        index_parser = subparsers.add_parser("index", help="Backfill or query the SQLite evidence index")
+        index_parser.add_argument("action", choices=["backfill", "query", "aggregate"], help="index evidence, list cycles, or group counts")
+        index_parser.add_argument("--db", type=str, default="evidence/evidence_index.sqlite", help="Evidence index database")
+        index_parser.add_argument("--evidence-root", type=str, default="evidence", help="Evidence root to backfill")
+        index_parser.add_argument("--decision", type=str, default=None, help="Filter: NOOP/MITIGATE/SKIPPED_DEBOUNCE/ERROR/CRASH")
+        index_parser.add_argument("--status", type=str, default=None, help="Filter: OK/INTERDICT_DRIFT/INTERDICT_QUEUE")
+        index_parser.add_argument("--session", type=str, default=None, help="Filter: watch_* session name")
+        index_parser.add_argument("--since", type=str, default=None, help="Filter: ISO timestamp lower bound")
+        index_parser.add_argument("--until", type=str, default=None, help="Filter: ISO timestamp upper bound")
+        index_parser.add_argument("--days", type=float, default=None, help="Filter: only the last N days")
+        index_parser.add_argument("--by", type=str, default="decision", help="Aggregate grouping: session,decision,status,config_version,day")
+        index_parser.add_argument("--limit", type=int, default=100, help="Rows to print for query")
+
+        # BLOBS
+        blobs_parser = subparsers.add_parser("blobs", help="Pack, inspect or read content-addressed evidence blobs")
+        blobs_parser.add_argument("action", choices=["pack", "stats", "cat"], help="move cycle artifacts into the store, show sizes, or print one blob")
+        blobs_parser.add_argument("digest", nargs="?", default=None, help="Blob digest (or blob:<digest>) for cat")
+        blobs_parser.add_argument("--store", type=str, default="evidence/blobs", help="Blob store directory")
+        blobs_parser.add_argument("--evidence-root", type=str, default="evidence", help="Evidence root to pack")
+        blobs_parser.add_argument("--keep", action="store_true", help="Keep the original artifact files when packing")
+
         args = parser.parse_args()
         
         try:
@@ -571,7 +646,18 @@ if __name__ == "__main__":
                     variance_threshold=0.15,
                     output_dir=args.output_dir,
                     telemetry_mode=args.telemetry,
-                    actuation_mode=args.actuation
+                    actuation_mode=args.actuation,
+                    prefetch=args.prefetch,
+                    adaptive_cadence=args.adaptive,
+                    metrics_port=args.metrics_port,
+                    log_rotate_sec=args.log_rotate_sec,
+                    log_compress=args.log_compress,
+                    shadow_policies=args.shadow,
+                    config_path=args.config,
+                    status_board=args.status_board,
+                    tsdb_dir=args.tsdb,
+                    evidence_index=args.index,
+                    blob_store=args.blobs
                     # Seed support would need to be passed down if implemented in watch_variance
                 )
                 print(result)
@@ -602,6 +688,129 @@ if __name__ == "__main__":
                      sys.exit(2)
                 sys.exit(0)
 
+            elif args.command == "replay":
+                print("[CLI] Stage: REPLAY (Decision Regression)")
+                from src.watchtower.replay import load_evidence, replay
+                records = load_evidence(args.evidence_root)
+                print(f"[CLI] Loaded {len(records)} cycles from {args.evidence_root}")
+                res = replay(
+                    records,
+                    variance_threshold=args.variance_threshold,
+                    queue_threshold=args.queue_threshold,
+                    cooldown_cycles=args.cooldown,
+                    max_diffs=args.max_diffs
+                )
+                print(json.dumps(res, indent=2))
+                sys.exit(1 if res["diff_count"] else 0)
+
+            elif args.command == "sweep":
+                print("[CLI] Stage: SWEEP (Threshold What-If)")
+                from src.watchtower.replay import load_evidence
+                from src.watchtower.sweep import SignalSeries, build_grid, parse_axis, rank, sweep
+                series = SignalSeries.from_records(load_evidence(args.evidence_root))
+                grid = build_grid(
+                    parse_axis(args.variance),
+                    parse_axis(args.queue),
+                    parse_axis(args.cooldown).astype(int)
+                )
+                print(f"[CLI] {len(series)} cycles x {len(grid['variance_threshold'])} combinations")
+                rows = rank(sweep(series, grid, workers=args.workers))
+                print(json.dumps(rows[:args.top], indent=2))
+                sys.exit(0)
+
+            elif args.command == "shards":
+                print("[CLI] Stage: SHARDS (Multi-Process Watchtower)")
+                from src.watchtower.shards import ShardSupervisor
+                evidence_dir = args.output_dir or str(
+                    repo_root / "evidence" / f"shards_{time.strftime('%Y%m%d_%H%M%S')}"
+                )
+                try:
+                    supervisor = ShardSupervisor(
+                        targets=[t.strip() for t in args.targets.split(",") if t.strip()],
+                        workers=args.workers,
+                        shards=args.shards or args.workers * 4,
+                        lease_dir=args.lease_dir,
+                        settings={
+                            "evidence_dir": evidence_dir,
+                            "variance_threshold": 0.15,
+                            "iterations": args.cycles,
+                            "interval_sec": args.interval,
+                            "telemetry_mode": args.telemetry,
+                            "actuation_mode": args.actuation,
+                            "status_board": args.status_board
+                        },
+                        lease_ttl_sec=args.lease_ttl
+                    )
+                except (ValueError, OSError) as e:
+                    print(json.dumps({"status": "error", "message": str(e)}, indent=2))
+                    sys.exit(2)
+                res = supervisor.run()
+                print(json.dumps(res, indent=2, default=str))
+                sys.exit(0 if res["status"] == "ok" else 2)
+
+            elif args.command == "tsdb":
+                print(f"[CLI] Stage: TSDB ({args.action.upper()})")
+                from src.watchtower.tsdb import TimeSeriesStore, ingest_evidence
+                store = TimeSeriesStore(args.store)
+                try:
+                    if args.action == "ingest":
+                        res = ingest_evidence(store, args.evidence_root, target=args.target)
+                    elif args.action == "stats":
+                        res = {name: store.stats(name) for name in store.series()}
+                    else:
+                        end = time.time()
+                        start = end - args.hours * 3600
+                        if args.step:
+                            points = store.downsample(args.series, start, end, args.step, args.agg)
+                        else:
+                            points = store.range(args.series, start, end)
+                        res = {"series": args.series, "points": points}
+                finally:
+                    store.close()
+                print(json.dumps(res, indent=2))
+                sys.exit(0)
+
+            elif args.command == "index":
+                print(f"[CLI] Stage: INDEX ({args.action.upper()})")
+                from src.watchtower.evidence_index import EvidenceIndex
+                index = EvidenceIndex(args.db)
+                try:
+                    if args.action == "backfill":
+                        res = index.backfill(args.evidence_root)
+                    else:
+                        filters = {
+                            "decision": args.decision,
+                            "status": args.status,
+                            "session": args.session,
+                            "since": time.time() - args.days * 86400 if args.days else args.since,
+                            "until": args.until
+                        }
+                        if args.action == "query":
+                            res = index.query(limit=args.limit, **filters)
+                        else:
+                            res = index.aggregate(by=args.by, **filters)
+                finally:
+                    index.close()
+                print(json.dumps(res, indent=2))
+                sys.exit(0)
+
+            elif args.command == "blobs":
+                print(f"[CLI] Stage: BLOBS ({args.action.upper()})")
+                from src.watchtower.blobs import BLOB_PREFIX, BlobStore, pack_evidence
+                store = BlobStore(args.store)
+                if args.action == "pack":
+                    res = pack_evidence(store, args.evidence_root, remove=not args.keep)
+                    res.update(store.stats())
+                elif args.action == "stats":
+                    res = store.stats()
+                else:
+                    if not args.digest:
+                        parser.error("blobs cat needs a digest")
+                    digest = args.digest[len(BLOB_PREFIX):] if args.digest.startswith(BLOB_PREFIX) else args.digest
+                    res = store.get_document(digest)
+                print(json.dumps(res, indent=2))
+                sys.exit(0)
+
         except Exception as e:
             print(f"\n[FATAL] Agent terminated during {args.command.upper()}: {e}")
             traceback.print_exc()
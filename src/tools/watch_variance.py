@@ -2,13 +2,26 @@
 import time
 import os
 import json
+import logging
 import datetime
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 from pathlib import Path
 from src.tools.blackglass_sim import run_simulation
 from src.tools.blackglass_analyze import analyze_variance
-from src.tools.recommend_mitigation import recommend_mitigation
+from src.adapters.factory import build_actuation_adapter, build_telemetry_adapter
+from src.watchtower.blobs import BlobStore
+from src.watchtower.cadence import CadenceController
+from src.watchtower.cycle import CycleContext, run_cycle
+from src.watchtower.evidence_index import EvidenceIndex
+from src.watchtower.hot_config import ConfigWatcher, WatchConfig
+from src.watchtower.prefetch import WindowPrefetcher, collect_window
+from src.watchtower.metrics import MetricsServer, WatchtowerMetrics
+from src.watchtower.policy import DetectionPolicy
+from src.watchtower.shadow import ShadowPolicies, load_shadow_config
+from src.watchtower.spans import SpanTimer
+from src.watchtower.structured_log import WatchtowerLog
+from src.watchtower.tsdb import TimeSeriesStore
 
 def watch_variance(
     iterations: int = 5, 
@@ -19,10 +32,78 @@ def watch_variance(
     duration_sec: int = 30,
     output_dir: str = None,
     telemetry_mode: str = "mock",
-    actuation_mode: str = "noop"
+    actuation_mode: str = "noop",
+    prefetch: bool = False,
+    prefetch_margin_sec: float = 0.5,
+    adaptive_cadence: bool = False,
+    min_interval_sec: float = None,
+    max_interval_sec: float = None,
+    stage_timing: bool = True,
+    metrics_port: int = None,
+    metrics_host: str = "127.0.0.1",
+    log_max_bytes: int = 10 * 1024 * 1024,
+    log_rotate_sec: float = None,
+    log_compress: bool = False,
+    shadow_policies=None,
+    config_path: str = None,
+    status_board: str = None,
+    board_target: str = "watchtower",
+    tsdb_dir: str = None,
+    evidence_index: str = None,
+    blob_store: str = None
 ) -> str:
     """
     Enters 'Continuous Mode' to act as a reliability watchtower.
+
+    Args:
+        prefetch: Start collecting the next telemetry window shortly before
+            the tick instead of after it, so analysis latency does not add
+            to detection latency. The polling rate is unchanged.
+        prefetch_margin_sec: Safety margin added to the moving estimate of
+            collection duration when timing the prefetch.
+        adaptive_cadence: Shorten the interval as drift or queue depth
+            approach their thresholds and lengthen it during calm periods.
+            Every cadence change is recorded in the cycle evidence.
+        min_interval_sec: Cadence floor (defaults to interval_sec / 4).
+        max_interval_sec: Cadence ceiling (defaults to interval_sec * 4).
+        stage_timing: Time each stage of the cycle (collect, validate, mercy,
+            evaluate, recommend, actuate, each file write, sleep) into
+            cycle_summary.json "timings_ms" and a rolling histogram. The
+            sleep reported in a summary is the one that preceded the cycle.
+        metrics_port: Serve Prometheus metrics (cycle decisions, stage and
+            actuation latency, drift/queue gauges, debounce suppressions) on
+            http://metrics_host:metrics_port/metrics. None disables it.
+            Implies stage_timing.
+        metrics_host: Bind address for the metrics endpoint.
+        log_max_bytes: Rotate watchtower.log (JSON lines) past this size.
+        log_rotate_sec: Also rotate watchtower.log after this many seconds.
+        log_compress: Gzip rotated log files.
+        shadow_policies: Candidate policies to evaluate in shadow on every
+            cycle (list of dicts, inline JSON or a JSON file path; see
+            src/watchtower/policy.policy_from_config). They never actuate;
+            their would-be decisions go to shadow_decisions.jsonl in the
+            evidence directory.
+        config_path: JSON file overlaying the reloadable settings
+            (variance_threshold, queue_threshold, cooldown_cycles,
+            interval_sec, duration_sec, telemetry_mode/_options,
+            actuation_mode/_options). Checked with one stat() per cycle and
+            swapped in between cycles without losing debounce state; the
+            active version is recorded in cycle_summary.json.
+        status_board: Path of the shared-memory status board to publish
+            each cycle's decision, drift and queue depth to (see
+            src/watchtower/status_board.py). None disables it.
+        board_target: Slot name on the status board.
+        tsdb_dir: Directory of the watchtower time-series store (see
+            src/watchtower/tsdb.py). Each cycle appends
+            <board_target>/drift, /queue and /latency. None disables it.
+        evidence_index: SQLite evidence index to record every cycle
+            summary in as it is written (see src/watchtower/evidence_index.py).
+            None disables it.
+        blob_store: Directory of a content-addressed blob store (see
+            src/watchtower/blobs.py). The analysis, mitigation plan and
+            actuation result go there instead of per-cycle files and the
+            cycle summary references them as "blob:<sha256>", so payloads
+            repeated across an incident are stored once. None keeps files.
     """
     session_id = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     
@@ -37,6 +118,33 @@ def watch_variance(
     if variance_threshold is None:
         variance_threshold = Constitution.STANDARD.DRIFT_LIMIT_SEMANTIC
         print(f"[WATCH] Constitutional Variance Threshold Set: {variance_threshold}V")
+
+    # Reloadable settings: args form the base, the config file overlays them
+    config = WatchConfig(
+        variance_threshold=variance_threshold,
+        queue_threshold=queue_threshold,
+        cooldown_cycles=cooldown_cycles,
+        interval_sec=interval_sec,
+        duration_sec=duration_sec,
+        telemetry_mode=telemetry_mode,
+        actuation_mode=actuation_mode
+    )
+    watcher = None
+    config_error = None
+    if config_path:
+        watcher = ConfigWatcher(config_path, config)
+        config = watcher.poll() or config
+        config_error = watcher.last_error
+        if config_error:
+            print(f"[WATCH] WARN: Ignoring config: {config_error}")
+        print(f"[WATCH] Hot Config: {config_path} (version {config.version})")
+    variance_threshold = config.variance_threshold
+    queue_threshold = config.queue_threshold
+    cooldown_cycles = config.cooldown_cycles
+    interval_sec = config.interval_sec
+    duration_sec = config.duration_sec
+    telemetry_mode = config.telemetry_mode
+    actuation_mode = config.actuation_mode
     
     if output_dir:
         evidence_dir = Path(output_dir)
@@ -52,47 +160,56 @@ def watch_variance(
     print(f"[WATCH] Rules: Variance > {variance_threshold} OR Queue > {queue_threshold}")
     print(f"[WATCH] Telemetry: {telemetry_mode.upper()} | Actuation: {actuation_mode.upper()}")
     
+    def build_telemetry(cfg):
+        adapter = build_telemetry_adapter(cfg.telemetry_mode, cfg.telemetry_options)
+        if adapter is None and cfg.telemetry_mode != "mock":
+            raise ValueError(f"unknown telemetry_mode: {cfg.telemetry_mode}")
+        return adapter
+
+    def build_actuation(cfg):
+        adapter = build_actuation_adapter(cfg.actuation_mode, cfg.actuation_options)
+        if adapter is None:
+            raise ValueError(f"unknown actuation_mode: {cfg.actuation_mode}")
+        return adapter
+
     # Initialize Adapters
-    telemetry_adapter = None
-    if telemetry_mode == "mock":
-        from src.adapters.telemetry.mock import MockTelemetryAdapter
-        # Mock adapter needs run_dir to generate/read artifacts
-        # We'll pass the *current cycle's* dir dynamically or set base?
-        # The Mock adapter currently wraps analyze_variance which takes a run_dir.
-        # Let's instantiate it per cycle or pass None here and handle in loop?
-        # Better: The Mock adapter in our impl expects run_dir in constructor.
-        # But we change run_dir every cycle.
-        # Refactor: We will instantiate inside the loop for Mock, or pass root?
-        # Simplest consistent way: Instantiate in loop for Mock.
-        pass
-    elif telemetry_mode == "air_node":
-        from src.adapters.telemetry.air_node import AirNodeTelemetryAdapter
-        telemetry_adapter = AirNodeTelemetryAdapter()
-        print(f"[WATCH] A.I.R. VaultNode: {telemetry_adapter.base_url}")
-        print(f"[WATCH] Incident window: {telemetry_adapter.window_sec}s | Saturation: {telemetry_adapter.saturation_rate} inc/min")
-    elif telemetry_mode == "prometheus":
-        from src.adapters.telemetry.prometheus import PrometheusTelemetryAdapter
-        telemetry_adapter = PrometheusTelemetryAdapter()
-        
-    actuation_adapter = None
-    if actuation_mode == "noop":
-        from src.adapters.actuation.noop import NoopActuationAdapter
-        actuation_adapter = NoopActuationAdapter()
-    elif actuation_mode == "k8s":
-        from src.adapters.actuation.k8s import KubernetesActuationAdapter
-        actuation_adapter = KubernetesActuationAdapter()
-    elif actuation_mode == "shard_alpha":
-        from src.adapters.actuation.shard_alpha import ShardAlphaActuationAdapter
-        actuation_adapter = ShardAlphaActuationAdapter()
-        print(f"[WATCH] Shard Alpha Actuation: {actuation_adapter.base_url}/interdict")
+    telemetry_adapter = build_telemetry(config)
+    actuation_adapter = build_actuation(config)
+
+    def telemetry_for(cycle_dir):
+        # Mock Mode Special Handling (needs per-cycle dir)
+        if telemetry_mode == "mock":
+            from src.adapters.telemetry.mock import MockTelemetryAdapter
+            return MockTelemetryAdapter(run_dir=str(cycle_dir))
+        return telemetry_adapter
+
+    prefetcher = WindowPrefetcher(margin_sec=prefetch_margin_sec) if prefetch else None
+    if prefetcher:
+        print(f"[WATCH] Prefetch: ON (margin {prefetch_margin_sec}s)")
+
+    cadence = None
+    if adaptive_cadence:
+        cadence = CadenceController(
+            interval_sec, floor_sec=min_interval_sec, ceiling_sec=max_interval_sec
+        )
+        print(f"[WATCH] Adaptive Cadence: {cadence.floor_sec}s..{cadence.ceiling_sec}s")
+
+    metrics = None
+    metrics_server = None
+    if metrics_port is not None:
+        metrics = WatchtowerMetrics()
+        metrics.interval.set(interval_sec)
+
+    spans = SpanTimer(
+        enabled=stage_timing or metrics is not None,
+        sink=metrics.observe_stage if metrics else None
+    )
+    slept_ns = 0
 
     interdictions = []
-    last_interdiction_cycle = -999
-    last_interdiction_status = None
-    
-    # Init Log
-    with open(log_file, "a") as f:
-        f.write(f"--- Session {session_id} Start ---\n")
+    policy = DetectionPolicy(variance_threshold, queue_threshold, cooldown_cycles)
+    shadow = None
+    shadow_configs = load_shadow_config(shadow_policies) if shadow_policies else []
     
     # Pre-flight Checklist (Only for Mock mode if it relies on external tools)
     if telemetry_mode == "mock" and not os.getenv("BLACKGLASS_REPO_PATH"):
@@ -112,12 +229,85 @@ def watch_variance(
         except Exception as e:
             return f"[WATCH] FATAL: Lock check failed: {e}"
     
+    log = None
+    board = None
+    board_slot = None
+    tsdb = None
+    index = None
+    blobs = BlobStore(blob_store) if blob_store else None
+
     try:
         lock_file.touch()
         print(f"[WATCH] Lock acquired: {lock_file}")
 
+        # Init Log (background writer owns the file handle and rotation)
+        log = WatchtowerLog(
+            log_file,
+            max_bytes=log_max_bytes,
+            rotate_interval_sec=log_rotate_sec,
+            compress=log_compress
+        )
+        log.event("session_start", session=session_id, evidence_dir=str(evidence_dir))
+
+        if status_board:
+            from src.watchtower.status_board import StatusBoard
+            try:
+                board = StatusBoard(status_board)
+                board_slot = board.slot(board_target)
+                print(f"[WATCH] Status Board: {status_board} (slot '{board_target}')")
+            except OSError as e:
+                print(f"[WATCH] WARN: Status board unavailable: {e}")
+
+        if tsdb_dir:
+            tsdb = TimeSeriesStore(tsdb_dir)
+            print(f"[WATCH] Time-Series Store: {tsdb_dir}")
+
+        if evidence_index:
+            index = EvidenceIndex(evidence_index)
+            print(f"[WATCH] Evidence Index: {evidence_index}")
+
+        if blobs:
+            print(f"[WATCH] Blob Store: {blob_store}")
+
+        if shadow_configs:
+            shadow = ShadowPolicies(shadow_configs, policy, evidence_dir / "shadow_decisions.jsonl")
+            print(f"[WATCH] Shadow Policies: {', '.join(p.name for p in shadow.policies)}")
+
+        if metrics:
+            try:
+                metrics_server = MetricsServer(metrics.registry, metrics_host, metrics_port).start()
+                print(f"[WATCH] Metrics: http://{metrics_host}:{metrics_server.port}/metrics")
+            except OSError as e:
+                print(f"[WATCH] WARN: Metrics endpoint unavailable: {e}")
+
+        cycle_ctx = CycleContext(
+            session=evidence_dir.name,
+            log=log,
+            spans=spans,
+            telemetry_for=telemetry_for,
+            actuation_adapter=actuation_adapter,
+            actuation_mode=actuation_mode,
+            duration_sec=duration_sec,
+            interval_sec=interval_sec,
+            config_version=config.version,
+            prefetcher=prefetcher,
+            cadence=cadence,
+            shadow=shadow,
+            metrics=metrics,
+            board_slot=board_slot,
+            tsdb=tsdb,
+            tsdb_target=board_target,
+            index=index,
+            blobs=blobs
+        )
+
         for i in range(iterations):
             cycle_idx = i + 1
+            spans.end_cycle()
+            if slept_ns:
+                # The sleep leading into this cycle is reported with it
+                spans.record("sleep", slept_ns)
+                slept_ns = 0
             cycle_dir = evidence_dir / f"cycle_{cycle_idx}"
             cycle_dir.mkdir(parents=True, exist_ok=True)
             
@@ -125,16 +315,54 @@ def watch_variance(
             if os.path.exists(".stop"):
                 return "[WATCH] Halted by .stop file."
             
-            # Log Rotation
-            if Path(log_file).exists() and Path(log_file).stat().st_size > 10 * 1024 * 1024:
-                Path(log_file).rename(f"watchtower_{session_id}.log")
-                with open(log_file, "w") as f: f.write("--- Log Rotated ---\n")
+            # Hot Reload (between cycles only; one stat() when unchanged)
+            if watcher:
+                new_config = watcher.poll()
+                if new_config:
+                    changes = config.diff(new_config)
+                    try:
+                        # Build the new adapters first; nothing is swapped unless they all succeed
+                        new_telemetry, new_actuation = telemetry_adapter, actuation_adapter
+                        if "telemetry_mode" in changes or "telemetry_options" in changes:
+                            new_telemetry = build_telemetry(new_config)
+                        if "actuation_mode" in changes or "actuation_options" in changes:
+                            new_actuation = build_actuation(new_config)
+                    except Exception as e:
+                        watcher.reject(config, f"version {new_config.version} rejected: {e}")
+                        new_config = None
+                    else:
+                        config = new_config
+                        telemetry_adapter, actuation_adapter = new_telemetry, new_actuation
+                        telemetry_mode, actuation_mode = config.telemetry_mode, config.actuation_mode
+                        variance_threshold = policy.variance_threshold = config.variance_threshold
+                        queue_threshold = policy.queue_threshold = config.queue_threshold
+                        cooldown_cycles = policy.cooldown_cycles = config.cooldown_cycles
+                        if shadow:
+                            shadow.inherit(policy)
+                        duration_sec = config.duration_sec
+                        if "interval_sec" in changes:
+                            interval_sec = config.interval_sec
+                            if cadence:
+                                cadence = CadenceController(
+                                    interval_sec, floor_sec=min_interval_sec, ceiling_sec=max_interval_sec
+                                )
+                            if metrics:
+                                metrics.interval.set(interval_sec)
+                        cycle_ctx.actuation_adapter, cycle_ctx.actuation_mode = actuation_adapter, actuation_mode
+                        cycle_ctx.duration_sec, cycle_ctx.interval_sec = duration_sec, interval_sec
+                        cycle_ctx.cadence, cycle_ctx.config_version = cadence, config.version
+                        log.console(f"    -> [CONFIG] Reloaded version {config.version}: {', '.join(changes) or 'no changes'}")
+                        log.event("config_reload", version=config.version, changes={k: v[1] for k, v in changes.items()})
+                if not new_config and watcher.last_error and watcher.last_error != config_error:
+                    log.console(f"    -> [CONFIG] WARN: Keeping version {config.version}: {watcher.last_error}")
+                    log.event("config_rejected", level=logging.WARNING, version=config.version, reason=watcher.last_error)
+                config_error = watcher.last_error
 
             timestamp_iso = datetime.datetime.now().isoformat()
-            print(f"[WATCH] Cycle {cycle_idx}/{iterations}...")
+            log.console(f"[WATCH] Cycle {cycle_idx}/{iterations}...")
             
             # Runtime Heartbeat
-            with open("watchtower_runtime.json", "w") as f:
+            with spans.span("write.heartbeat"), open("watchtower_runtime.json", "w") as f:
                 json.dump({
                     "session": session_id,
                     "cycle": cycle_idx,
@@ -142,164 +370,49 @@ def watch_variance(
                     "status": "RUNNING"
                 }, f)
             
-            summary_written = False
-            decision = "UNKNOWN"
-            
-            try:
-                # 1. Collect & Analyze (via Telemetry Adapter)
-                print("    -> Analyzing Variance...")
-                
-                # Mock Mode Special Handling (needs per-cycle dir)
-                current_telemetry = telemetry_adapter
-                if telemetry_mode == "mock":
-                    from src.adapters.telemetry.mock import MockTelemetryAdapter
-                    current_telemetry = MockTelemetryAdapter(run_dir=str(cycle_dir))
-                
-                try:
-                    t_start = time.time()
-                    analysis = current_telemetry.get_window(duration_sec=duration_sec)
-                    latency = time.time() - t_start
-                except Exception as e:
-                    print(f"[ERROR] Logic Crash: {e}")
-                    analysis = {"status": "crash", "message": str(e)}
+            result = run_cycle(cycle_ctx, policy, cycle_idx, cycle_dir, timestamp_iso)
+            if result.halt:
+                # Fail Closed
+                return f"[WATCH] HALTED BY MERCY PROTOCOL: {result.halt}"
+            if result.decision == "MITIGATE":
+                interdictions.append(f"Cycle {cycle_idx}: {result.status}")
+            if result.sleep_sec is None:
+                continue # ERROR/CRASH: try next cycle
 
-                # 3. Fail Closed / Schema Validation
-                is_valid = (
-                    analysis.get("status") == "ok" and 
-                    "variance_detected" in analysis
+            t_sleep = time.monotonic_ns()
+            if prefetcher and cycle_idx < iterations:
+                next_dir = evidence_dir / f"cycle_{cycle_idx + 1}"
+                next_dir.mkdir(parents=True, exist_ok=True)
+                next_telemetry = telemetry_for(next_dir)
+                prefetcher.sleep_until_tick(
+                    result.sleep_sec,
+                    cycle_idx + 1,
+                    lambda: collect_window(next_telemetry, duration_sec)
                 )
-                
-                if not is_valid:
-                    # FAIL CLOSED
-                    error_msg = f"Analysis Failed: {analysis.get('message', 'Unknown Schema Error')}"
-                    print(f"[ERROR] {error_msg}")
-                    with open(log_file, "a") as f: f.write(f"[{timestamp_iso}] Cycle={cycle_idx} ERROR {error_msg}\n")
-                    
-                    decision = "ERROR"
-                    with open(cycle_dir / "cycle_summary.json", "w") as f:
-                        json.dump({
-                            "cycle": cycle_idx,
-                            "decision": "ERROR",
-                            "reason": error_msg,
-                            "input_error": analysis
-                        }, f, indent=2)
-                    summary_written = True
-                    continue 
-
-                # 4. Extract Signals (Typed)
-                drift = float(analysis["variance_detected"])
-                queue_depth = int(analysis["queue_depth"])
-                
-                # --- MERCY PROTOCOL CHECK (Article IV) ---
-                mercy_status = Constitution.MERCY.evaluate_integrity(latency, drift)
-                if "LOCKED" in mercy_status:
-                    signal = Constitution.MERCY.declare_distress()
-                    # Fail Closed
-                    return f"[WATCH] HALTED BY MERCY PROTOCOL: {mercy_status}"
-                
-                # Write Analysis Artifact
-                with open(cycle_dir / "analysis.json", "w") as f:
-                    json.dump(analysis, f, indent=2)
-
-                # 5. Evaluate & Assert Causality
-                breach_drift = drift > variance_threshold
-                breach_queue = queue_depth > queue_threshold
-                should_interdict = breach_drift or breach_queue
-                
-                decision = "NOOP"
-                mitigation_plan = {}
-                actuation_result = {}
-                status_tag = "OK"
-
-                if should_interdict:
-                    status_tag = "INTERDICT_DRIFT" if breach_drift else "INTERDICT_QUEUE"
-                    decision = "MITIGATE"
-                    
-                    # Debounce
-                    is_repeat = (status_tag == last_interdiction_status) and \
-                                (cycle_idx - last_interdiction_cycle <= cooldown_cycles)
-                    
-                    if is_repeat:
-                        decision = "SKIPPED_DEBOUNCE"
-                        print(f"    -> [DEBOUNCE] {status_tag} persists (Cycle {last_interdiction_cycle})")
-                    else:
-                        print(f"    -> [DETECTED] {status_tag} (Drift={drift:.4f}, Queue={queue_depth})")
-                        last_interdiction_cycle = cycle_idx
-                        last_interdiction_status = status_tag
-                        
-                        # Generate Mitigation
-                        mitigation_plan = recommend_mitigation(analysis)
-                        
-                        # CAUSALITY ASSERTION
-                        if not mitigation_plan:
-                             crasher = f"VIOLATION: Thresholds breached but recommend_mitigation returned empty plan!"
-                             print(f"[FATAL] {crasher}")
-                             raise RuntimeError(crasher)
-
-                        # Persist Plan
-                        with open(cycle_dir / "mitigation_plan.json", "w") as f:
-                            json.dump(mitigation_plan, f, indent=2)
-                            
-                        # ACTUATION (via Adapter)
-                        print(f"    -> Actuating via {actuation_mode.upper()}...")
-                        actuation_result = actuation_adapter.apply(mitigation_plan)
-                        
-                        with open(cycle_dir / "actuation_result.json", "w") as f:
-                            json.dump(actuation_result, f, indent=2)
-                            
-                        interdictions.append(f"Cycle {cycle_idx}: {status_tag}")
-
-                else:
-                     print(f"    -> OK (Drift={drift:.4f}, Queue={queue_depth})")
-
-                # 6. Cycle Summary (The Truth)
-                summary = {
-                    "cycle": cycle_idx,
-                    "timestamp": timestamp_iso,
-                    "decision": decision,
-                    "signals": {
-                        "variance_detected": drift,
-                        "queue_depth": queue_depth
-                    },
-                    "thresholds": {
-                        "variance": variance_threshold,
-                        "queue": queue_threshold
-                    },
-                    "artifacts": {
-                        "analysis": "analysis.json",
-                        "mitigation": "mitigation_plan.json" if decision == "MITIGATE" else None,
-                        "actuation": "actuation_result.json" if decision == "MITIGATE" else None
-                    }
-                }
-                with open(cycle_dir / "cycle_summary.json", "w") as f:
-                    json.dump(summary, f, indent=2)
-                summary_written = True
-
-                # Log Line
-                log_line = f"[{timestamp_iso}] Cycle={cycle_idx} Status={status_tag} Decision={decision} Drift={drift:.4f} Queue={queue_depth}"
-                with open(log_file, "a") as f: f.write(log_line + "\n")
-                
-                time.sleep(interval_sec)
-
-            except Exception as e:
-                # CATASTROPHIC FAILURE TRAP
-                print(f"[FATAL] Cycle {cycle_idx} crashed: {e}")
-                import traceback
-                traceback.print_exc()
-                
-                if not summary_written:
-                    with open(cycle_dir / "cycle_summary.json", "w") as f:
-                        json.dump({
-                            "cycle": cycle_idx,
-                            "decision": "CRASH",
-                            "reason": str(e),
-                            "traceback": traceback.format_exc()
-                        }, f, indent=2)
-                continue # Try next cycle
+            else:
+                time.sleep(result.sleep_sec)
+            slept_ns = time.monotonic_ns() - t_sleep
 
+        if shadow:
+            for name, stats in shadow.summary().items():
+                print(f"[WATCH] Shadow '{name}': {stats['decisions']} ({stats['disagreements']} disagreements)")
         return f"Watchtower session complete. {len(interdictions)} interdictions."
         
     finally:
+        if log:
+            log.close()
+        if prefetcher:
+            prefetcher.close()
+        if shadow:
+            shadow.close()
+        if board:
+            board.close()
+        if tsdb:
+            tsdb.close()
+        if index:
+            index.close()
+        if metrics_server:
+            metrics_server.stop()
         if lock_file.exists():
             lock_file.unlink()
 
@@ -0,0 +1,33 @@
+from .cadence import CadenceController
+from .hot_config import ConfigWatcher, WatchConfig
+from .metrics import MetricsRegistry, MetricsServer, WatchtowerMetrics
+from .policy import CusumPolicy, DetectionPolicy, Verdict, policy_from_config
+from .prefetch import WindowPrefetcher, collect_window
+from .replay import CycleRecord, load_evidence, replay
+from .shadow import ShadowPolicies, load_shadow_config
+from .spans import RollingHistogram, SpanTimer
+from .structured_log import RotatingJsonlHandler, WatchtowerLog
+
+__all__ = [
+    "CadenceController",
+    "ConfigWatcher",
+    "WatchConfig",
+    "MetricsRegistry",
+    "MetricsServer",
+    "WatchtowerMetrics",
+    "CusumPolicy",
+    "DetectionPolicy",
+    "Verdict",
+    "policy_from_config",
+    "WindowPrefetcher",
+    "collect_window",
+    "CycleRecord",
+    "load_evidence",
+    "replay",
+    "ShadowPolicies",
+    "load_shadow_config",
+    "RollingHistogram",
+    "SpanTimer",
+    "RotatingJsonlHandler",
+    "WatchtowerLog",
+]
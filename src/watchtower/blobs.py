@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+from .replay import _cycle_no, session_dirs
+
+BLOB_PREFIX = "blob:"
+# Large sub-documents that repeat verbatim from cycle to cycle during an
+# incident; each is stored once and referenced from its parent document.
+SHARED_KEYS = ("features", "hypotheses", "recommended_actions")
+
+
+def _canonical(obj: Any) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
+class BlobStore:
+    """
+    Content-addressed evidence blobs: sha256 of the canonical JSON ->
+    zlib-compressed object at <root>/objects/<2 hex>/<62 hex>.z. Writing
+    a blob that already exists costs one stat, so identical payloads are
+    stored once however often a cycle produces them.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.written = 0
+        self.deduplicated = 0
+
+    def _path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / f"{digest[2:]}.z"
+
+    def put_bytes(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            self.deduplicated += 1
+            return digest
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(zlib.compress(data, 6))
+        os.replace(tmp, path)   # concurrent writers of one digest write identical bytes
+        self.written += 1
+        return digest
+
+    def get_bytes(self, digest: str) -> bytes:
+        with open(self._path(digest), "rb") as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"blob {digest} is corrupt")
+        return data
+
+    def put_document(self, doc: Dict[str, Any], shared: Sequence[str] = SHARED_KEYS) -> str:
+        """
+        Stores `doc` with each non-empty `shared` key split out into its own
+        blob ({"$blob": digest} in its place). Returns the document digest.
+        """
+        doc = dict(doc)
+        for key in shared:
+            value = doc.get(key)
+            if isinstance(value, (dict, list)) and value:
+                doc[key] = {"$blob": self.put_bytes(_canonical(value))}
+        return self.put_bytes(_canonical(doc))
+
+    def get_document(self, digest: str) -> Dict[str, Any]:
+        doc = json.loads(self.get_bytes(digest))
+        for key, value in doc.items():
+            if isinstance(value, dict) and set(value) == {"$blob"}:
+                doc[key] = json.loads(self.get_bytes(value["$blob"]))
+        return doc
+
+    def stats(self) -> Dict[str, int]:
+        objects = stored = 0
+        for path in self.objects.glob("*/*.z"):
+            objects += 1
+            stored += path.stat().st_size
+        return {"objects": objects, "stored_bytes": stored,
+                "written": self.written, "deduplicated": self.deduplicated}
+
+
+def artifact_ref(digest: str) -> str:
+    return BLOB_PREFIX + digest
+
+
+def read_artifact(cycle_dir: Union[str, Path], ref: Optional[str], store: Optional[BlobStore] = None):
+    """An artifact named in a cycle summary: a blob reference or a file in the cycle directory."""
+    if not ref:
+        return None
+    if ref.startswith(BLOB_PREFIX):
+        if store is None:
+            raise ValueError(f"{ref} needs a blob store")
+        return store.get_document(ref[len(BLOB_PREFIX):])
+    with open(Path(cycle_dir) / ref, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def pack_evidence(store: BlobStore, root: str, remove: bool = True) -> Dict[str, int]:
+    """
+    Moves existing cycle artifacts (analysis, mitigation plan, actuation
+    result) into the blob store and points each cycle_summary.json at the
+    blobs. Cycles already packed are skipped. Returns byte and count totals.
+    """
+    totals = {"cycles": 0, "artifacts": 0, "bytes_before": 0}
+    written = store.written
+    for session in session_dirs(root):
+        for cycle_dir in sorted(session.glob("cycle_*"), key=_cycle_no):
+            summary_path = cycle_dir / "cycle_summary.json"
+            try:
+                with open(summary_path, "r", encoding="utf-8") as f:
+                    summary = json.load(f)
+            except (OSError, ValueError):
+                continue
+            artifacts = dict(summary.get("artifacts") or {})
+            packed = []
+            for name, ref in artifacts.items():
+                if not ref or ref.startswith(BLOB_PREFIX):
+                    continue
+                path = cycle_dir / ref
+                try:
+                    raw = path.read_bytes()
+                    doc = json.loads(raw)
+                except (OSError, ValueError):
+                    continue
+                artifacts[name] = artifact_ref(store.put_document(doc))
+                totals["bytes_before"] += len(raw)
+                packed.append(path)
+            if not packed:
+                continue
+            summary["artifacts"] = artifacts
+            tmp = summary_path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(summary, f, indent=2)
+            os.replace(tmp, summary_path)
+            if remove:
+                for path in packed:
+                    path.unlink()
+            totals["cycles"] += 1
+            totals["artifacts"] += len(packed)
+    totals["blobs_written"] = store.written - written
+    return totals
@@ -0,0 +1,87 @@
+from typing import Any, Dict, Optional
+
+
+class CadenceController:
+    """
+    Adapts the watchtower polling interval to how close the system is to
+    interdiction.
+
+    Pressure is the larger of drift/variance_threshold and
+    queue_depth/queue_threshold (1.0 == on the threshold). The interval halves
+    when pressure is hot or climbing, and stretches by `backoff` after
+    `calm_cycles` consecutive calm cycles. It never leaves [floor, ceiling].
+    """
+
+    def __init__(
+        self,
+        base_interval_sec: float,
+        floor_sec: Optional[float] = None,
+        ceiling_sec: Optional[float] = None,
+        hot_ratio: float = 0.8,
+        calm_ratio: float = 0.5,
+        calm_cycles: int = 3,
+        backoff: float = 1.5,
+    ):
+        self.floor_sec = floor_sec if floor_sec is not None else base_interval_sec / 4
+        self.ceiling_sec = ceiling_sec if ceiling_sec is not None else base_interval_sec * 4
+        self.interval_sec = min(max(base_interval_sec, self.floor_sec), self.ceiling_sec)
+        self.hot_ratio = hot_ratio
+        self.calm_ratio = calm_ratio
+        self.calm_cycles = calm_cycles
+        self.backoff = backoff
+        self.last_pressure: Optional[float] = None
+        self._calm_streak = 0
+
+    @staticmethod
+    def pressure(drift: float, queue_depth: int, variance_threshold: float, queue_threshold: int) -> float:
+        """Normalized proximity to the nearest threshold (1.0 == breach)."""
+        drift_ratio = drift / variance_threshold if variance_threshold > 0 else 0.0
+        queue_ratio = queue_depth / queue_threshold if queue_threshold > 0 else 0.0
+        return max(drift_ratio, queue_ratio)
+
+    def update(
+        self,
+        drift: float,
+        queue_depth: int,
+        variance_threshold: float,
+        queue_threshold: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Feeds one cycle's signals into the controller.
+
+        Returns:
+            A cadence change record ({from_sec, to_sec, reason, pressure}) if
+            the interval moved, otherwise None.
+        """
+        pressure = self.pressure(drift, queue_depth, variance_threshold, queue_threshold)
+        rising = self.last_pressure is not None and pressure > self.last_pressure
+        self.last_pressure = pressure
+
+        previous = self.interval_sec
+        reason = None
+
+        if pressure >= self.hot_ratio:
+            self._calm_streak = 0
+            self.interval_sec = max(self.floor_sec, previous / 2)
+            reason = "HOT"
+        elif rising and pressure >= self.calm_ratio:
+            self._calm_streak = 0
+            self.interval_sec = max(self.floor_sec, previous / 2)
+            reason = "RISING"
+        elif pressure < self.calm_ratio and not rising:
+            self._calm_streak += 1
+            if self._calm_streak >= self.calm_cycles:
+                self._calm_streak = 0
+                self.interval_sec = min(self.ceiling_sec, previous * self.backoff)
+                reason = "CALM"
+        else:
+            self._calm_streak = 0
+
+        if self.interval_sec == previous:
+            return None
+        return {
+            "from_sec": round(previous, 3),
+            "to_sec": round(self.interval_sec, 3),
+            "reason": reason,
+            "pressure": round(pressure, 4),
+        }
@@ -0,0 +1,296 @@
+import datetime
+import json
+import logging
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from src.tools.recommend_mitigation import recommend_mitigation
+
+from .blobs import BlobStore, artifact_ref
+from .cadence import CadenceController
+from .evidence_index import EvidenceIndex
+from .metrics import WatchtowerMetrics
+from .policy import DetectionPolicy
+from .prefetch import WindowPrefetcher, collect_window
+from .shadow import ShadowPolicies
+from .spans import SpanTimer
+from .structured_log import WatchtowerLog
+from .tsdb import TimeSeriesStore
+
+ARTIFACT_FILES = {"analysis": "analysis.json", "mitigation": "mitigation_plan.json",
+                  "actuation": "actuation_result.json"}
+
+
+@dataclass
+class CycleContext:
+    """
+    What one target's cycles collect through, act through and write to.
+
+    watch_variance keeps one for its session; a shard worker keeps one per
+    target it owns. The loop swaps adapters, durations and the config
+    version in place on a hot reload. Optional sinks left as None are off.
+    """
+    session: str                                  # evidence index session name
+    log: WatchtowerLog
+    spans: SpanTimer
+    telemetry_for: Callable[[Path], Any]          # cycle_dir -> telemetry adapter
+    actuation_adapter: Any
+    actuation_mode: str = "noop"
+    duration_sec: int = 30
+    interval_sec: float = 5
+    config_version: str = "args"
+    prefetcher: Optional[WindowPrefetcher] = None
+    cadence: Optional[CadenceController] = None
+    shadow: Optional[ShadowPolicies] = None
+    metrics: Optional[WatchtowerMetrics] = None
+    board_slot: Any = None
+    tsdb: Optional[TimeSeriesStore] = None
+    tsdb_target: str = "watchtower"
+    index: Optional[EvidenceIndex] = None
+    blobs: Optional[BlobStore] = None
+    summary_extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class CycleResult(NamedTuple):
+    decision: str                     # NOOP/MITIGATE/SKIPPED_DEBOUNCE/ERROR/CRASH/HALT
+    status: Optional[str]             # detection status; None unless thresholds were evaluated
+    sleep_sec: Optional[float]        # interval to the next tick; None after ERROR/CRASH/HALT
+    halt: Optional[str] = None        # Mercy lock reason on HALT
+
+
+def _write_artifact(ctx: CycleContext, cycle_dir: Path, name: str, doc: Dict[str, Any]) -> str:
+    """Persists one cycle artifact; returns the reference for the summary."""
+    if ctx.blobs:
+        return artifact_ref(ctx.blobs.put_document(doc))
+    with open(cycle_dir / ARTIFACT_FILES[name], "w") as f:
+        json.dump(doc, f, indent=2)
+    return ARTIFACT_FILES[name]
+
+
+def _write_summary(ctx: CycleContext, cycle_dir: Path, summary: Dict[str, Any]) -> None:
+    with ctx.spans.span("write.cycle_summary"), open(cycle_dir / "cycle_summary.json", "w") as f:
+        json.dump(summary, f, indent=2)
+    if ctx.index:
+        with ctx.spans.span("write.index"):
+            try:
+                ctx.index.record(ctx.session, cycle_dir, summary)
+            except Exception as e:  # the index is derived data; never fail a cycle over it
+                ctx.log.event("index_record_failed", level=logging.WARNING,
+                              cycle=summary.get("cycle"), reason=str(e))
+
+
+def run_cycle(ctx: CycleContext, policy: DetectionPolicy, cycle_idx: int, cycle_dir: Path,
+              timestamp_iso: str) -> CycleResult:
+    """
+    One watchtower cycle: collect (or take the prefetched window), fail
+    closed on a bad analysis, Mercy check, thresholds + debounce, shadow
+    policies, recommend, actuate, cadence, then cycle_summary.json and
+    every enabled sink. A crash is trapped and recorded as a CRASH summary.
+    The caller owns the sleep to the next tick.
+    """
+    from constitution import Constitution
+
+    log, spans, metrics, board_slot = ctx.log, ctx.spans, ctx.metrics, ctx.board_slot
+    summary_written = False
+    try:
+        # 1. Collect & Analyze (via Telemetry Adapter)
+        with spans.span("collect"):
+            collected = ctx.prefetcher.take(cycle_idx) if ctx.prefetcher else None
+            prefetched = collected is not None
+            if prefetched:
+                log.console("    -> Analyzing Variance (prefetched)...")
+            else:
+                log.console("    -> Analyzing Variance...")
+                collected = collect_window(ctx.telemetry_for(cycle_dir), ctx.duration_sec)
+        analysis, latency = collected
+        if ctx.prefetcher:
+            ctx.prefetcher.observe(latency)
+
+        # 3. Fail Closed / Schema Validation
+        with spans.span("validate"):
+            is_valid = (
+                analysis.get("status") == "ok" and
+                "variance_detected" in analysis
+            )
+
+        if not is_valid:
+            # FAIL CLOSED
+            error_msg = f"Analysis Failed: {analysis.get('message', 'Unknown Schema Error')}"
+            log.console(f"[ERROR] {error_msg}")
+            with spans.span("write.log"):
+                log.event("cycle", level=logging.ERROR, ts=timestamp_iso, cycle=cycle_idx, decision="ERROR", reason=error_msg)
+            if metrics:
+                metrics.cycles.inc("ERROR")
+            if board_slot:
+                board_slot.publish(cycle_idx, "ERROR")
+            summary = {
+                "cycle": cycle_idx,
+                **ctx.summary_extra,
+                "timestamp": timestamp_iso,
+                "decision": "ERROR",
+                "reason": error_msg,
+                "input_error": analysis,
+                "config_version": ctx.config_version,
+                "timings_ms": spans.cycle_ms()
+            }
+            _write_summary(ctx, cycle_dir, summary)
+            return CycleResult("ERROR", None, None)
+
+        # 4. Extract Signals (Typed)
+        drift = float(analysis["variance_detected"])
+        queue_depth = int(analysis["queue_depth"])
+        if metrics:
+            metrics.drift.set(drift)
+            metrics.queue.set(queue_depth)
+
+        # --- MERCY PROTOCOL CHECK (Article IV) ---
+        with spans.span("mercy"):
+            mercy_status = Constitution.MERCY.evaluate_integrity(latency, drift)
+        if "LOCKED" in mercy_status:
+            Constitution.MERCY.declare_distress()
+            if board_slot:
+                board_slot.publish(cycle_idx, "HALT", drift=drift, queue_depth=queue_depth)
+            # Fail Closed
+            return CycleResult("HALT", None, None, mercy_status)
+
+        # Write Analysis Artifact
+        artifacts = {"analysis": None, "mitigation": None, "actuation": None}
+        with spans.span("write.analysis"):
+            artifacts["analysis"] = _write_artifact(ctx, cycle_dir, "analysis", analysis)
+
+        # 5. Evaluate & Assert Causality
+        with spans.span("evaluate"):
+            # Thresholds + Debounce
+            verdict = policy.evaluate(cycle_idx, drift, queue_depth)
+            status_tag, decision = verdict.status, verdict.decision
+
+        if ctx.shadow:
+            with spans.span("shadow"):
+                ctx.shadow.evaluate(cycle_idx, drift, queue_depth, decision)
+
+        if status_tag != "OK":
+            if decision == "SKIPPED_DEBOUNCE":
+                if metrics:
+                    metrics.debounce_suppressions.inc(status_tag)
+                log.console(f"    -> [DEBOUNCE] {status_tag} persists (Cycle {verdict.repeat_of})")
+            else:
+                log.console(f"    -> [DETECTED] {status_tag} (Drift={drift:.4f}, Queue={queue_depth})")
+
+                # Generate Mitigation
+                with spans.span("recommend"):
+                    mitigation_plan = recommend_mitigation(analysis)
+
+                # CAUSALITY ASSERTION
+                if not mitigation_plan:
+                    crasher = "VIOLATION: Thresholds breached but recommend_mitigation returned empty plan!"
+                    log.console(f"[FATAL] {crasher}")
+                    raise RuntimeError(crasher)
+
+                # Persist Plan
+                with spans.span("write.mitigation_plan"):
+                    artifacts["mitigation"] = _write_artifact(ctx, cycle_dir, "mitigation", mitigation_plan)
+
+                # ACTUATION (via Adapter)
+                log.console(f"    -> Actuating via {ctx.actuation_mode.upper()}...")
+                with spans.span("actuate"):
+                    actuation_result = ctx.actuation_adapter.apply(mitigation_plan)
+
+                with spans.span("write.actuation_result"):
+                    artifacts["actuation"] = _write_artifact(ctx, cycle_dir, "actuation", actuation_result)
+        else:
+            log.console(f"    -> OK (Drift={drift:.4f}, Queue={queue_depth})")
+
+        # Adaptive Cadence
+        sleep_sec = ctx.interval_sec
+        cadence_change = None
+        if ctx.cadence:
+            cadence_change = ctx.cadence.update(drift, queue_depth, policy.variance_threshold, policy.queue_threshold)
+            sleep_sec = ctx.cadence.interval_sec
+            if metrics:
+                metrics.interval.set(sleep_sec)
+            if cadence_change:
+                log.console(f"    -> [CADENCE] {cadence_change['reason']}: {cadence_change['from_sec']}s -> {cadence_change['to_sec']}s")
+
+        # 6. Cycle Summary (The Truth)
+        summary = {
+            "cycle": cycle_idx,
+            **ctx.summary_extra,
+            "timestamp": timestamp_iso,
+            "decision": decision,
+            "status": status_tag,
+            "signals": {
+                "variance_detected": drift,
+                "queue_depth": queue_depth
+            },
+            "thresholds": {
+                "variance": policy.variance_threshold,
+                "queue": policy.queue_threshold
+            },
+            "config_version": ctx.config_version,
+            "collection": {
+                "latency_sec": round(latency, 4),
+                "prefetched": prefetched
+            },
+            "cadence": {
+                "interval_sec": sleep_sec,
+                "change": cadence_change
+            },
+            "artifacts": artifacts,
+            "timings_ms": spans.cycle_ms()
+        }
+        _write_summary(ctx, cycle_dir, summary)
+        summary_written = True
+        if metrics:
+            metrics.cycles.inc(decision)
+        if board_slot:
+            with spans.span("write.board"):
+                board_slot.publish(cycle_idx, decision, status_tag, drift, queue_depth)
+        if ctx.tsdb:
+            with spans.span("write.tsdb"):
+                ts = datetime.datetime.fromisoformat(timestamp_iso).timestamp()
+                try:
+                    ctx.tsdb.append(f"{ctx.tsdb_target}/drift", ts, drift)
+                    ctx.tsdb.append(f"{ctx.tsdb_target}/queue", ts, queue_depth)
+                    ctx.tsdb.append(f"{ctx.tsdb_target}/latency", ts, latency)
+                except ValueError as e:
+                    # Wall clock stepped backwards: drop the point, keep the cycle.
+                    log.event("tsdb_point_dropped", level=logging.WARNING, cycle=cycle_idx, reason=str(e))
+                ctx.tsdb.flush()
+
+        # Log Line
+        with spans.span("write.log"):
+            log.event(
+                "cycle",
+                ts=timestamp_iso,
+                cycle=cycle_idx,
+                status=status_tag,
+                decision=decision,
+                drift=round(drift, 4),
+                queue=queue_depth,
+                cadence=cadence_change
+            )
+        return CycleResult(decision, status_tag, sleep_sec)
+
+    except Exception as e:
+        # CATASTROPHIC FAILURE TRAP
+        log.console(f"[FATAL] Cycle {cycle_idx} crashed: {e}\n{traceback.format_exc()}", level=logging.ERROR)
+        log.event("cycle", level=logging.ERROR, cycle=cycle_idx, decision="CRASH", reason=str(e))
+
+        if not summary_written:
+            if metrics:
+                metrics.cycles.inc("CRASH")
+            if board_slot:
+                board_slot.publish(cycle_idx, "CRASH")
+            summary = {
+                "cycle": cycle_idx,
+                **ctx.summary_extra,
+                "timestamp": timestamp_iso,
+                "decision": "CRASH",
+                "reason": str(e),
+                "traceback": traceback.format_exc(),
+                "timings_ms": spans.cycle_ms()
+            }
+            _write_summary(ctx, cycle_dir, summary)
+        return CycleResult("CRASH", None, None)
@@ -0,0 +1,240 @@
+import datetime
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .blobs import BLOB_PREFIX
+from .replay import _cycle_no, session_dirs
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cycles (
+    session TEXT NOT NULL,
+    cycle INTEGER NOT NULL,
+    ts REAL,
+    timestamp TEXT,
+    decision TEXT NOT NULL,
+    status TEXT,
+    drift REAL,
+    queue_depth REAL,
+    latency_sec REAL,
+    variance_threshold REAL,
+    queue_threshold REAL,
+    config_version TEXT,
+    analysis TEXT,
+    mitigation TEXT,
+    actuation TEXT,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (session, cycle)
+);
+CREATE INDEX IF NOT EXISTS cycles_ts ON cycles (ts);
+CREATE INDEX IF NOT EXISTS cycles_decision ON cycles (decision, status, ts);
+"""
+
+_COLUMNS = ("session", "cycle", "ts", "timestamp", "decision", "status", "drift", "queue_depth",
+            "latency_sec", "variance_threshold", "queue_threshold", "config_version",
+            "analysis", "mitigation", "actuation", "path", "mtime_ns")
+_INSERT = f"INSERT OR REPLACE INTO cycles ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+# Grouping keys accepted by aggregate(); "day" buckets ts by UTC date.
+_GROUPS = {"session": "session", "decision": "decision", "status": "status",
+           "config_version": "config_version", "day": "date(ts, 'unixepoch')"}
+
+
+def _epoch(value: Union[None, float, str]) -> Optional[float]:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return datetime.datetime.fromisoformat(value).timestamp()
+
+
+def derive_status(summary: Dict[str, Any]) -> Optional[str]:
+    """
+    The cycle's detection status. Summaries written before `status` was
+    recorded get it re-derived from signals and thresholds (drift wins,
+    as in DetectionPolicy); ERROR/CRASH cycles have none.
+    """
+    if "status" in summary:
+        return summary["status"]
+    signals, thresholds = summary.get("signals"), summary.get("thresholds")
+    if not signals or not thresholds:
+        return None
+    drift, queue = signals.get("variance_detected"), signals.get("queue_depth")
+    if drift is not None and thresholds.get("variance") is not None and drift > thresholds["variance"]:
+        return "INTERDICT_DRIFT"
+    if queue is not None and thresholds.get("queue") is not None and queue > thresholds["queue"]:
+        return "INTERDICT_QUEUE"
+    return "OK"
+
+
+def _row(session: str, cycle_dir: Path, summary: Dict[str, Any], mtime_ns: int) -> tuple:
+    signals = summary.get("signals") or {}
+    thresholds = summary.get("thresholds") or {}
+    artifacts = summary.get("artifacts") or {}
+    timestamp = summary.get("timestamp")
+    try:
+        ts = _epoch(timestamp)
+    except (TypeError, ValueError):
+        ts = None
+
+    def artifact(name: str) -> Optional[str]:
+        ref = artifacts.get(name)
+        if not ref or ref.startswith(BLOB_PREFIX):
+            return ref  # blob references are already location-independent
+        return str(cycle_dir / ref)
+
+    return (
+        session, int(summary.get("cycle", -1)), ts, timestamp,
+        summary.get("decision", "UNKNOWN"), derive_status(summary),
+        signals.get("variance_detected"), signals.get("queue_depth"),
+        (summary.get("collection") or {}).get("latency_sec"),
+        thresholds.get("variance"), thresholds.get("queue"), summary.get("config_version"),
+        artifact("analysis"), artifact("mitigation"), artifact("actuation"),
+        str(cycle_dir), mtime_ns,
+    )
+
+
+def _sessions(root: str) -> List[Tuple[str, Path]]:
+    """
+    (session name, directory) for every watch session under `root` plus
+    each target of a sharded run, named "shards_<ts>/<target>".
+    """
+    root = Path(root)
+    found = [(p.name, p) for p in session_dirs(str(root))]
+    runs = [root] if root.name.startswith("shards_") else sorted(root.glob("shards_*"))
+    for run in runs:
+        for target in sorted(p for p in run.iterdir() if p.is_dir()):
+            if any(target.glob("cycle_*/cycle_summary.json")):
+                found.append((f"{run.name}/{target.name}", target))
+    return found
+
+
+class EvidenceIndex:
+    """
+    SQLite index over watchtower cycle summaries.
+
+    One row per (session, cycle) with timestamp, decision, status, signals,
+    thresholds, config version and artifact paths, indexed by time and by
+    (decision, status, time). The live loop records each cycle as its
+    summary is written; `backfill()` indexes existing evidence and skips
+    summaries whose mtime has not changed since they were indexed.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def record(self, session: str, cycle_dir: Union[str, Path], summary: Dict[str, Any]) -> None:
+        """Indexes one just-written cycle summary."""
+        cycle_dir = Path(cycle_dir)
+        try:
+            mtime_ns = os.stat(cycle_dir / "cycle_summary.json").st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        with self._db:
+            self._db.execute(_INSERT, _row(session, cycle_dir, summary, mtime_ns))
+
+    def backfill(self, root: str) -> Dict[str, int]:
+        """
+        Indexes every watch session and sharded-run target under `root`;
+        unchanged summaries are skipped.
+        """
+        scanned = indexed = 0
+        for session, session_dir in _sessions(root):
+            known = dict(self._db.execute(
+                "SELECT cycle, mtime_ns FROM cycles WHERE session = ?", (session,)
+            ).fetchall())
+            rows = []
+            with os.scandir(session_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith("cycle_") or not entry.is_dir():
+                        continue
+                    cycle_dir = Path(entry.path)
+                    path = cycle_dir / "cycle_summary.json"
+                    try:
+                        mtime_ns = path.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    scanned += 1
+                    if known.get(_cycle_no(cycle_dir)) == mtime_ns:
+                        continue
+                    try:
+                        with open(path, "r", encoding="utf-8") as f:
+                            summary = json.load(f)
+                    except (OSError, ValueError):
+                        continue
+                    rows.append(_row(session, cycle_dir, summary, mtime_ns))
+            if rows:
+                with self._db:
+                    self._db.executemany(_INSERT, rows)
+                indexed += len(rows)
+        return {"scanned": scanned, "indexed": indexed, "total": self.count()}
+
+    @staticmethod
+    def _where(decision=None, status=None, session=None, since=None, until=None):
+        clauses, params = [], []
+        for column, value in (("decision", decision), ("status", status), ("session", session)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            clauses.append("ts <= ?")
+            params.append(_epoch(until))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM cycles").fetchone()[0]
+
+    def query(
+        self,
+        decision: str = None,
+        status: str = None,
+        session: str = None,
+        since: Union[float, str] = None,
+        until: Union[float, str] = None,
+        limit: int = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Cycles matching every given filter, oldest first. `since`/`until`
+        are epoch seconds or ISO timestamps.
+        """
+        where, params = self._where(decision, status, session, since, until)
+        sql = f"SELECT * FROM cycles{where} ORDER BY ts, session, cycle"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [dict(r) for r in self._db.execute(sql, params)]
+
+    def aggregate(self, by: Sequence[str] = ("decision",), **filters) -> List[Dict[str, Any]]:
+        """
+        Cycle counts and drift/queue aggregates grouped by any of session,
+        decision, status, config_version or day; takes the query() filters.
+        """
+        if isinstance(by, str):
+            by = [b.strip() for b in by.split(",") if b.strip()]
+        unknown = [b for b in by if b not in _GROUPS]
+        if unknown:
+            raise ValueError(f"Cannot group by {unknown}; choose from {sorted(_GROUPS)}")
+        keys = [f"{_GROUPS[b]} AS {b}" for b in by]
+        where, params = self._where(**filters)
+        sql = (
+            f"SELECT {', '.join(keys + ['COUNT(*) AS cycles'])}, "
+            "AVG(drift) AS mean_drift, MAX(drift) AS max_drift, MAX(queue_depth) AS max_queue, "
+            "MIN(ts) AS first_ts, MAX(ts) AS last_ts "
+            f"FROM cycles{where}"
+        )
+        if by:
+            sql += f" GROUP BY {', '.join(by)} ORDER BY {', '.join(by)}"
+        return [dict(r) for r in self._db.execute(sql, params)]
+
+    def close(self) -> None:
+        self._db.close()
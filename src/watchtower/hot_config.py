@@ -0,0 +1,131 @@
+import dataclasses
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from src.adapters.factory import ACTUATION_MODES, TELEMETRY_MODES
+
+
+@dataclass(frozen=True)
+class WatchConfig:
+    """
+    One immutable snapshot of the reloadable watchtower settings.
+
+    The loop holds a single reference and swaps it between cycles, so a
+    cycle always sees one consistent version.
+    """
+    variance_threshold: float
+    queue_threshold: int = 50
+    cooldown_cycles: int = 3
+    interval_sec: float = 5
+    duration_sec: int = 30
+    telemetry_mode: str = "mock"
+    telemetry_options: Dict[str, Any] = field(default_factory=dict)
+    actuation_mode: str = "noop"
+    actuation_options: Dict[str, Any] = field(default_factory=dict)
+    version: str = "args"
+
+    def diff(self, other: "WatchConfig") -> Dict[str, Tuple[Any, Any]]:
+        """Fields (except version) that differ, as {name: (old, new)}."""
+        changes = {}
+        for f in dataclasses.fields(self):
+            if f.name == "version":
+                continue
+            old, new = getattr(self, f.name), getattr(other, f.name)
+            if old != new:
+                changes[f.name] = (old, new)
+        return changes
+
+
+_NUMERIC = {"variance_threshold": float, "queue_threshold": int, "cooldown_cycles": int,
+            "interval_sec": float, "duration_sec": int}
+_MODES = {"telemetry_mode": TELEMETRY_MODES, "actuation_mode": ACTUATION_MODES}
+_OPTIONS = ("telemetry_options", "actuation_options")
+
+
+def parse_config(raw: Dict[str, Any], base: WatchConfig, version: str) -> WatchConfig:
+    """
+    Validates a config document and overlays it on `base`.
+
+    Keys are the WatchConfig field names; unset keys keep the base value.
+    Raises ValueError on unknown keys, bad types or unknown adapter modes so
+    a typo never reaches the running loop. Adapter options are only checked
+    for shape here; the loop builds the adapters before committing a version.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("config must be a JSON object")
+    values = {}
+    for key, value in raw.items():
+        if key in _NUMERIC:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{key} must be a number")
+            values[key] = _NUMERIC[key](value)
+        elif key in _MODES:
+            if value not in _MODES[key]:
+                raise ValueError(f"{key} must be one of {', '.join(_MODES[key])}")
+            values[key] = value
+        elif key in _OPTIONS:
+            if not isinstance(value, dict):
+                raise ValueError(f"{key} must be an object")
+            values[key] = value
+        else:
+            raise ValueError(f"unknown config key: {key}")
+    if values.get("interval_sec", base.interval_sec) <= 0:
+        raise ValueError("interval_sec must be positive")
+    return dataclasses.replace(base, version=version, **values)
+
+
+class ConfigWatcher:
+    """
+    Polls a JSON config file for changes with one stat() per call.
+
+    `poll()` returns a new WatchConfig when the file's (mtime, size) moved
+    and its content hash changed, otherwise None. A file that fails to parse
+    or validate is reported once via `last_error` and the current config
+    stays in force until the file changes again.
+    """
+
+    def __init__(self, path: str, base: WatchConfig):
+        self.path = path
+        self.base = base
+        self.current = base
+        self.last_error: Optional[str] = None
+        self._stat_key: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
+
+    def poll(self) -> Optional[WatchConfig]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._stat_key:
+            return None
+        self._stat_key = key
+
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            self.last_error = str(e)
+            return None
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        if digest == self._digest:
+            return None  # touched but unchanged
+        self._digest = digest
+
+        try:
+            config = parse_config(json.loads(data), self.base, digest)
+        except ValueError as e:  # json.JSONDecodeError is a ValueError
+            self.last_error = f"{self.path}: {e}"
+            return None
+        self.last_error = None
+        self.current = config
+        return config
+
+    def reject(self, keep: WatchConfig, reason: str) -> None:
+        """Reverts to `keep` when the caller could not apply the polled version."""
+        self.current = keep
+        self.last_error = f"{self.path}: {reason}"
@@ -0,0 +1,217 @@
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .spans import STAGE_BUCKETS_MS
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Stage latency buckets in seconds, shared with the SpanTimer histograms.
+STAGE_BUCKETS_SEC: Tuple[float, ...] = tuple(b / 1000 for b in STAGE_BUCKETS_MS)
+
+DECISIONS = ("NOOP", "MITIGATE", "SKIPPED_DEBOUNCE", "ERROR", "CRASH")
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{v}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, val in list(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, key)} {_fmt(val)}")
+        return lines
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        self._values[labelvalues] = float(value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float], labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets) if buckets[-1] == float("inf") else tuple(buckets) + (float("inf"),)
+        # label key -> [per-bucket counts..., sum, count]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        # label key -> pre-rendered sample prefixes (buckets..., sum, count)
+        self._prefixes: Dict[Tuple[str, ...], List[str]] = {}
+
+    def _add_series(self, key: Tuple[str, ...]) -> List[float]:
+        base = _labels(self.labelnames, key)
+        le_labels = [_labels(self.labelnames, key, 'le="%s"' % _fmt(b)) for b in self.buckets]
+        self._prefixes[key] = [f"{self.name}_bucket{le} " for le in le_labels] + [
+            f"{self.name}_sum{base} ",
+            f"{self.name}_count{base} ",
+        ]
+        series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+        return series
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        series = self._series.get(labelvalues)
+        if series is None:
+            series = self._add_series(labelvalues)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def count(self, *labelvalues: str) -> int:
+        series = self._series.get(labelvalues)
+        return int(series[-1]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        n = len(self.buckets)
+        for key, series in list(self._series.items()):
+            snapshot = list(series)
+            prefixes = self._prefixes[key]
+            cumulative = 0
+            for i in range(n):
+                cumulative += snapshot[i]
+                lines.append(prefixes[i] + str(cumulative))
+            lines.append(prefixes[n] + _fmt(snapshot[-2]))
+            lines.append(prefixes[n + 1] + str(int(snapshot[-1])))
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Minimal in-process Prometheus registry.
+
+    Updates are plain dict/list writes from the detection loop (no locks);
+    scrapes render from a copy of each series, so a scrape can never stall
+    the loop. A scrape may straddle one update, which Prometheus tolerates.
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float], labelnames: Sequence[str] = ()) -> Histogram:
+        return self.register(Histogram(name, help, buckets, labelnames))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class WatchtowerMetrics:
+    """The watchtower's metric set, pre-registered on one registry."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.cycles = r.counter("watchtower_cycles_total", "Watchtower cycles by decision.", ("decision",))
+        self.stage_seconds = r.histogram(
+            "watchtower_stage_duration_seconds", "Wall time per cycle stage.", STAGE_BUCKETS_SEC, ("stage",)
+        )
+        self.drift = r.gauge("watchtower_drift", "Last observed variance_detected V(t).")
+        self.queue = r.gauge("watchtower_queue_depth", "Last observed queue depth.")
+        self.actuation_seconds = r.histogram(
+            "watchtower_actuation_latency_seconds", "Actuation adapter apply() latency.", STAGE_BUCKETS_SEC
+        )
+        self.debounce_suppressions = r.counter(
+            "watchtower_debounce_suppressions_total", "Interdictions suppressed by the cooldown.", ("status",)
+        )
+        self.interval = r.gauge("watchtower_interval_seconds", "Current polling interval.")
+        for decision in DECISIONS:
+            self.cycles.inc(decision, amount=0)
+
+    def observe_stage(self, stage: str, elapsed_ns: int) -> None:
+        """SpanTimer sink: feeds stage and actuation latency histograms."""
+        seconds = elapsed_ns / 1e9
+        self.stage_seconds.observe(seconds, stage)
+        if stage == "actuate":
+            self.actuation_seconds.observe(seconds)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = None
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes must not write to the watchtower's stdout
+
+
+class MetricsServer:
+    """Serves a registry on http://host:port/metrics from a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464):
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="watch-metrics", daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def start(self) -> "MetricsServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
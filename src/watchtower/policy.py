@@ -0,0 +1,155 @@
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class Verdict(NamedTuple):
+    status: str          # OK | INTERDICT_DRIFT | INTERDICT_QUEUE
+    decision: str        # NOOP | MITIGATE | SKIPPED_DEBOUNCE
+    repeat_of: Optional[int]  # cycle of the interdiction being debounced
+
+
+_OK = Verdict("OK", "NOOP", None)
+
+
+class DetectionPolicy:
+    """
+    Threshold + debounce decision rule of the watchtower, with its state.
+
+    An interdiction is raised when drift exceeds `variance_threshold` or
+    queue depth exceeds `queue_threshold` (drift wins when both breach).
+    A repeat of the last interdiction's status within `cooldown_cycles`
+    cycles of it is downgraded to SKIPPED_DEBOUNCE and does not reset the
+    cooldown.
+
+    The live loop, the replay engine and shadow policies all decide through
+    this class, so they cannot drift apart.
+    """
+
+    __slots__ = (
+        "name", "variance_threshold", "queue_threshold", "cooldown_cycles",
+        "last_cycle", "last_status",
+    )
+
+    def __init__(
+        self,
+        variance_threshold: float,
+        queue_threshold: float = 50,
+        cooldown_cycles: int = 3,
+        name: str = "active",
+    ):
+        self.name = name
+        self.variance_threshold = variance_threshold
+        self.queue_threshold = queue_threshold
+        self.cooldown_cycles = cooldown_cycles
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets debounce history (new session)."""
+        self.last_cycle = -999
+        self.last_status: Optional[str] = None
+
+    def evaluate(self, cycle: int, drift: float, queue_depth: float) -> Verdict:
+        """Decides one cycle and updates the debounce state."""
+        if drift > self.variance_threshold:
+            status = "INTERDICT_DRIFT"
+        elif queue_depth > self.queue_threshold:
+            status = "INTERDICT_QUEUE"
+        else:
+            return _OK
+        return self._debounce(cycle, status)
+
+    def _debounce(self, cycle: int, status: str) -> Verdict:
+        if status == self.last_status and cycle - self.last_cycle <= self.cooldown_cycles:
+            return Verdict(status, "SKIPPED_DEBOUNCE", self.last_cycle)
+        self.last_cycle = cycle
+        self.last_status = status
+        return Verdict(status, "MITIGATE", None)
+
+    def describe(self) -> dict:
+        return {
+            "name": self.name,
+            "variance_threshold": self.variance_threshold,
+            "queue_threshold": self.queue_threshold,
+            "cooldown_cycles": self.cooldown_cycles,
+        }
+
+
+class CusumPolicy(DetectionPolicy):
+    """
+    Change-point trigger: one-sided CUSUM on drift instead of a fixed level.
+
+    The score accumulates `drift - target - k` (floored at zero) and raises
+    INTERDICT_DRIFT once it exceeds `h`, then restarts. Sustained small
+    shifts trip it before a level threshold would; single spikes do not.
+    Queue breaches and debounce behave as in DetectionPolicy.
+    """
+
+    __slots__ = ("target", "k", "h", "score")
+
+    def __init__(
+        self,
+        target: float = 0.0,
+        k: float = 0.02,
+        h: float = 0.1,
+        queue_threshold: float = 50,
+        cooldown_cycles: int = 3,
+        name: str = "cusum",
+    ):
+        self.target = target
+        self.k = k
+        self.h = h
+        super().__init__(float("inf"), queue_threshold, cooldown_cycles, name)
+
+    def reset(self) -> None:
+        super().reset()
+        self.score = 0.0
+
+    def evaluate(self, cycle: int, drift: float, queue_depth: float) -> Verdict:
+        self.score = max(0.0, self.score + drift - self.target - self.k)
+        if self.score > self.h:
+            self.score = 0.0
+            status = "INTERDICT_DRIFT"
+        elif queue_depth > self.queue_threshold:
+            status = "INTERDICT_QUEUE"
+        else:
+            return _OK
+        return self._debounce(cycle, status)
+
+    def describe(self) -> dict:
+        return {
+            "name": self.name,
+            "type": "cusum",
+            "target": self.target,
+            "k": self.k,
+            "h": self.h,
+            "queue_threshold": self.queue_threshold,
+            "cooldown_cycles": self.cooldown_cycles,
+        }
+
+
+def policy_from_config(config: Dict[str, Any], defaults: DetectionPolicy) -> DetectionPolicy:
+    """
+    Builds a policy from a config dict; unset fields inherit from `defaults`.
+
+    {"name": "tight", "variance_threshold": 0.1, "cooldown_cycles": 5}
+    {"name": "cp", "type": "cusum", "k": 0.02, "h": 0.1}
+    """
+    kind = config.get("type", "threshold")
+    queue_threshold = config.get("queue_threshold", defaults.queue_threshold)
+    cooldown_cycles = config.get("cooldown_cycles", defaults.cooldown_cycles)
+    if kind == "threshold":
+        return DetectionPolicy(
+            config.get("variance_threshold", defaults.variance_threshold),
+            queue_threshold,
+            cooldown_cycles,
+            name=config.get("name", "threshold"),
+        )
+    if kind == "cusum":
+        return CusumPolicy(
+            target=config.get("target", 0.0),
+            k=config.get("k", 0.02),
+            h=config.get("h", 0.1),
+            queue_threshold=queue_threshold,
+            cooldown_cycles=cooldown_cycles,
+            name=config.get("name", "cusum"),
+        )
+    raise ValueError(f"Unknown policy type: {kind}")
@@ -0,0 +1,83 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Collection result as consumed by the watchtower loop: (analysis, latency_sec)
+Collected = Tuple[Dict[str, Any], float]
+
+
+def collect_window(adapter: Any, duration_sec: int) -> Collected:
+    """
+    Runs one telemetry collection and times it.
+
+    Adapter exceptions are folded into a crash payload so the caller's
+    fail-closed schema check handles them like any other bad window; it
+    also logs them, so nothing is printed here (this runs on the prefetch
+    thread too).
+    """
+    t_start = time.time()
+    try:
+        analysis = adapter.get_window(duration_sec=duration_sec)
+    except Exception as e:
+        analysis = {"status": "crash", "message": f"Logic Crash: {e}", "error_type": type(e).__name__}
+    return analysis, time.time() - t_start
+
+
+class WindowPrefetcher:
+    """
+    Starts collecting the next telemetry window shortly before the tick.
+
+    The lead time is a moving estimate of collection duration plus a safety
+    margin, so the window is normally ready the moment the interval elapses.
+    The polling rate is unchanged: exactly one collection runs per cycle.
+    """
+
+    def __init__(self, margin_sec: float = 0.5, smoothing: float = 0.2):
+        self.margin_sec = margin_sec
+        self.smoothing = smoothing
+        self.estimate_sec: Optional[float] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="watch-prefetch")
+        self._pending: Optional[Tuple[int, Future]] = None
+
+    def observe(self, duration_sec: float) -> None:
+        """Feeds one measured collection duration into the moving estimate."""
+        if self.estimate_sec is None:
+            self.estimate_sec = duration_sec
+        else:
+            self.estimate_sec = (self.estimate_sec * (1 - self.smoothing)) + (duration_sec * self.smoothing)
+
+    def lead_time(self) -> float:
+        """Seconds before the tick at which the next collection should start."""
+        return (self.estimate_sec or 0.0) + self.margin_sec
+
+    def sleep_until_tick(self, interval_sec: float, cycle_idx: int, fetch: Callable[[], Collected]) -> None:
+        """
+        Sleeps for interval_sec, launching fetch for cycle_idx once the
+        remaining time drops to the lead time.
+        """
+        deadline = time.monotonic() + interval_sec
+        idle = interval_sec - self.lead_time()
+        if idle > 0:
+            time.sleep(idle)
+        self._pending = (cycle_idx, self._executor.submit(fetch))
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def take(self, cycle_idx: int) -> Optional[Collected]:
+        """
+        Returns the prefetched window for cycle_idx, waiting for it if the
+        collection is still in flight. Returns None if nothing was prefetched.
+        """
+        if self._pending is None or self._pending[0] != cycle_idx:
+            return None
+        _, future = self._pending
+        self._pending = None
+        return future.result()
+
+    def close(self) -> None:
+        """Abandons any in-flight collection and stops the worker thread."""
+        if self._pending is not None:
+            self._pending[1].cancel()
+            self._pending = None
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,179 @@
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from src.tools.recommend_mitigation import recommend_mitigation
+
+from .policy import DetectionPolicy
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+class CycleRecord(NamedTuple):
+    """One archived watchtower cycle, reduced to what the decision needs."""
+    session: str
+    cycle: int
+    decision: str                       # as recorded
+    drift: Optional[float]              # None for ERROR/CRASH cycles
+    queue_depth: Optional[int]
+    latency_sec: float
+    variance_threshold: Optional[float]
+    queue_threshold: Optional[float]
+
+
+def _cycle_no(path: Path) -> int:
+    try:
+        return int(path.name.split("_", 1)[1])
+    except (IndexError, ValueError):
+        return -1
+
+
+def session_dirs(root: str) -> List[Path]:
+    """Watch sessions under `root` (or `root` itself if it is a session)."""
+    root = Path(root)
+    if any(root.glob("cycle_*/cycle_summary.json")):
+        return [root]
+    return sorted(p for p in root.glob("watch_*") if p.is_dir())
+
+
+def iter_session(session_dir: Path) -> Iterator[CycleRecord]:
+    """Yields a session's cycles in cycle order from their cycle_summary.json."""
+    cycles = sorted(
+        (p for p in session_dir.glob("cycle_*") if _cycle_no(p) >= 0),
+        key=_cycle_no,
+    )
+    for cycle_dir in cycles:
+        try:
+            with open(cycle_dir / "cycle_summary.json", "r", encoding="utf-8") as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            continue  # cycle interrupted before its summary was written
+        signals = summary.get("signals") or {}
+        thresholds = summary.get("thresholds") or {}
+        drift = signals.get("variance_detected")
+        queue_depth = signals.get("queue_depth")
+        yield CycleRecord(
+            session=session_dir.name,
+            cycle=int(summary.get("cycle", _cycle_no(cycle_dir))),
+            decision=summary.get("decision", "UNKNOWN"),
+            drift=None if drift is None else float(drift),
+            queue_depth=None if queue_depth is None else int(queue_depth),
+            latency_sec=float((summary.get("collection") or {}).get("latency_sec", 0.0)),
+            variance_threshold=thresholds.get("variance"),
+            queue_threshold=thresholds.get("queue"),
+        )
+
+
+def load_evidence(root: str) -> List[CycleRecord]:
+    """Loads every archived cycle under an evidence root, session by session."""
+    records: List[CycleRecord] = []
+    for session_dir in session_dirs(root):
+        records.extend(iter_session(session_dir))
+    return records
+
+
+def replay(
+    records: Iterable[CycleRecord],
+    variance_threshold: Optional[float] = None,
+    queue_threshold: Optional[float] = None,
+    cooldown_cycles: int = 3,
+    max_diffs: int = 1000,
+) -> Dict[str, Any]:
+    """
+    Re-decides archived cycles with the live watchtower's logic.
+
+    Each cycle goes through the Mercy check, DetectionPolicy (thresholds +
+    debounce) and, for fresh interdictions, recommend_mitigation with the
+    causality assertion -- exactly as in watch_variance, minus telemetry,
+    sleeps, actuation and file writes. Debounce state resets per session.
+
+    Thresholds default to the ones recorded with each cycle; pass values to
+    ask "what would this policy have done". ERROR/CRASH cycles without
+    signals are passed through unchanged. A Mercy lock halts the rest of
+    its session, as it would live.
+
+    Returns:
+        Report with decision counts, the diff against recorded decisions
+        (capped at `max_diffs` entries) and replay throughput.
+    """
+    if str(_REPO_ROOT) not in sys.path:
+        sys.path.append(str(_REPO_ROOT))
+    from constitution import Constitution
+    evaluate_integrity = Constitution.MERCY.evaluate_integrity
+
+    policy = DetectionPolicy(
+        variance_threshold if variance_threshold is not None else 0.0,
+        queue_threshold if queue_threshold is not None else 0,
+        cooldown_cycles,
+        name="replay",
+    )
+    replayed: Counter = Counter()
+    recorded: Counter = Counter()
+    diffs: List[Dict[str, Any]] = []
+    diff_count = 0
+    cycles = 0
+    sessions = 0
+    session = None
+    halted = False
+
+    t0 = time.perf_counter()
+    for rec in records:
+        cycles += 1
+        recorded[rec.decision] += 1
+        if rec.session != session:
+            session = rec.session
+            sessions += 1
+            halted = False
+            policy.reset()
+
+        if halted:
+            decision = "HALTED"
+        elif rec.drift is None:
+            decision = rec.decision
+        elif "LOCKED" in evaluate_integrity(rec.latency_sec, rec.drift):
+            decision = "HALT"
+            halted = True
+        else:
+            if variance_threshold is None:
+                policy.variance_threshold = rec.variance_threshold
+            if queue_threshold is None:
+                policy.queue_threshold = rec.queue_threshold
+            decision = policy.evaluate(rec.cycle, rec.drift, rec.queue_depth).decision
+            if decision == "MITIGATE" and not recommend_mitigation(
+                {"variance_detected": rec.drift, "queue_depth": rec.queue_depth}
+            ):
+                decision = "CRASH"  # causality violation raises in the live loop
+
+        replayed[decision] += 1
+        if decision != rec.decision:
+            diff_count += 1
+            if len(diffs) < max_diffs:
+                diffs.append({
+                    "session": rec.session,
+                    "cycle": rec.cycle,
+                    "recorded": rec.decision,
+                    "replayed": decision,
+                    "drift": rec.drift,
+                    "queue_depth": rec.queue_depth,
+                })
+    elapsed = time.perf_counter() - t0
+
+    return {
+        "status": "ok",
+        "policy": {
+            "variance_threshold": variance_threshold if variance_threshold is not None else "recorded",
+            "queue_threshold": queue_threshold if queue_threshold is not None else "recorded",
+            "cooldown_cycles": cooldown_cycles,
+        },
+        "sessions": sessions,
+        "cycles": cycles,
+        "recorded": dict(recorded),
+        "replayed": dict(replayed),
+        "diff_count": diff_count,
+        "diffs": diffs,
+        "elapsed_sec": round(elapsed, 6),
+        "cycles_per_sec": round(cycles / elapsed) if elapsed > 0 else None,
+    }
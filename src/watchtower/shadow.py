@@ -0,0 +1,89 @@
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+
+from .policy import DetectionPolicy, policy_from_config
+
+# One-letter decision codes keep the side log small.
+_CODES = {"NOOP": "N", "MITIGATE": "M", "SKIPPED_DEBOUNCE": "S"}
+
+
+def load_shadow_config(spec: Union[str, Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Accepts a list of policy dicts, inline JSON, or a path to a JSON file."""
+    if not isinstance(spec, str):
+        return list(spec)
+    text = spec.strip()
+    if not text.startswith("["):
+        text = Path(spec).read_text(encoding="utf-8")
+    return json.loads(text)
+
+
+class ShadowPolicies:
+    """
+    Candidate detection policies evaluated alongside the active one.
+
+    Each live cycle, every shadow policy decides on the already-computed
+    drift and queue depth (no extra telemetry) and keeps its own debounce
+    state. Nothing is ever actuated. Would-be decisions are appended to a
+    compact JSON-lines side log, one line per cycle:
+
+        {"c":4,"a":"M","s":{"tight":"M","cusum":"N"}}
+
+    with N=NOOP, M=MITIGATE, S=SKIPPED_DEBOUNCE for the active (a) and each
+    shadow (s) policy.
+    """
+
+    def __init__(self, configs: Sequence[Dict[str, Any]], active: DetectionPolicy, log_path: str):
+        self.configs = list(configs)
+        self.policies = [policy_from_config(c, active) for c in self.configs]
+        names = [p.name for p in self.policies]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Shadow policy names must be unique: {names}")
+        self.log_path = Path(log_path)
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        self._log.write(json.dumps({"policies": [p.describe() for p in self.policies]}) + "\n")
+        self.counts = {p.name: Counter() for p in self.policies}
+        self.disagreements = Counter()
+
+    def inherit(self, active: DetectionPolicy) -> None:
+        """
+        Re-applies the active policy's thresholds to every field a shadow
+        config leaves unset (after a config reload). Debounce state is kept;
+        the side log gets a fresh policies line.
+        """
+        for config, policy in zip(self.configs, self.policies):
+            fields = ["queue_threshold", "cooldown_cycles"]
+            if config.get("type", "threshold") == "threshold":
+                fields.append("variance_threshold")
+            for field in fields:
+                if field not in config:
+                    setattr(policy, field, getattr(active, field))
+        self._log.write(json.dumps({"policies": [p.describe() for p in self.policies]}) + "\n")
+        self._log.flush()
+
+    def evaluate(self, cycle: int, drift: float, queue_depth: float, active_decision: str) -> Dict[str, str]:
+        """Decides the cycle for every shadow policy and logs the result."""
+        decisions = {}
+        for policy in self.policies:
+            decision = policy.evaluate(cycle, drift, queue_depth).decision
+            decisions[policy.name] = decision
+            self.counts[policy.name][decision] += 1
+            if decision != active_decision:
+                self.disagreements[policy.name] += 1
+        self._log.write(json.dumps(
+            {"c": cycle, "a": _CODES.get(active_decision, active_decision),
+             "s": {name: _CODES[d] for name, d in decisions.items()}},
+            separators=(",", ":"),
+        ) + "\n")
+        self._log.flush()
+        return decisions
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {"decisions": dict(counts), "disagreements": self.disagreements[name]}
+            for name, counts in self.counts.items()
+        }
+
+    def close(self) -> None:
+        self._log.close()
@@ -0,0 +1,520 @@
+import datetime
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import traceback
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:  # Windows: leases need flock, so sharding is unavailable
+    fcntl = None
+
+from src.adapters.factory import build_actuation_adapter, build_telemetry_adapter
+
+from .blobs import BlobStore
+from .cycle import CycleContext, run_cycle
+from .evidence_index import EvidenceIndex
+from .hot_config import ConfigWatcher, WatchConfig
+from .metrics import MetricsServer, WatchtowerMetrics
+from .policy import DetectionPolicy
+from .shadow import ShadowPolicies, load_shadow_config
+from .spans import SpanTimer
+from .structured_log import WatchtowerLog
+from .tsdb import TimeSeriesStore
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+ASSIGNMENT_FILE = "assignment.json"
+# Slack on top of the tick interval before a lease counts as stale
+LEASE_TTL_MARGIN_SEC = 1.0
+
+
+def shard_of(target: str, n_shards: int) -> int:
+    """Stable shard index for a target name (same on every host and run)."""
+    return zlib.crc32(target.encode("utf-8")) % n_shards
+
+
+def _write_json_atomic(path: Path, payload: Dict[str, Any]) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+
+
+class ShardLease:
+    """
+    Exclusive, renewable lease on one shard: `shard_NNN.lease` in lease_dir.
+
+    Exclusivity comes from a non-blocking fcntl.flock held on the open file,
+    so the kernel drops it the moment the owning process dies. The file body
+    is a heartbeat (owner, pid, renewed_at) plus the shard's carried state,
+    which lets the next owner resume debounce where the last one stopped.
+    """
+
+    def __init__(self, lease_dir: str, shard: int, owner: str):
+        self.path = Path(lease_dir) / f"shard_{shard:03d}.lease"
+        self.shard = shard
+        self.owner = owner
+        self.state: Dict[str, Any] = {}
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()   # the worker's heartbeat thread renews too
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        """Takes the lease if free; loads the previous owner's state."""
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        previous = self.read(self.path) or {}
+        self.state = previous.get("state") or {}
+        self.renew()
+        return True
+
+    def _write(self, pid: Optional[int]) -> None:
+        data = json.dumps({
+            "shard": self.shard,
+            "owner": self.owner,
+            "pid": pid,
+            "renewed_at": time.time(),
+            "state": self.state,
+        }).encode("utf-8")
+        os.ftruncate(self._fd, 0)
+        os.pwrite(self._fd, data, 0)
+
+    def renew(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """Heartbeat: rewrites the lease body in place."""
+        with self._lock:
+            if state is not None:
+                self.state = state
+            if self._fd is not None:
+                self._write(os.getpid())
+
+    def release(self) -> None:
+        """Drops the lease; the body keeps the state but names no live owner."""
+        with self._lock:
+            if self._fd is None:
+                return
+            self._write(None)
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+    @staticmethod
+    def read(path: Path) -> Optional[Dict[str, Any]]:
+        """Lease body, or None if missing or caught mid-rewrite."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.loads(f.read() or "null")
+        except (OSError, ValueError):
+            return None
+
+
+def watch_target_cycle(target: str, cycle_idx: int, policy: DetectionPolicy, ctx: Dict[str, Any]) -> str:
+    """
+    One watchtower cycle for one target: the shared run_cycle (see
+    cycle.py) with the target's own evidence directory, index session,
+    board slot, series and shadow policies. Returns the decision.
+    """
+    cycle_ctx = ctx["targets"].get(target)
+    if cycle_ctx is None:
+        cycle_ctx = ctx["targets"][target] = _target_context(target, policy, ctx)
+    cycle_ctx.summary_extra = {"target": target, "shard": ctx["shard"], "worker": ctx["worker"]}
+    cycle_dir = Path(ctx["evidence_dir"]) / target / f"cycle_{cycle_idx}"
+    cycle_dir.mkdir(parents=True, exist_ok=True)
+    ctx["spans"].end_cycle()
+    ctx["log"].console(f"[SHARD] {target} cycle {cycle_idx}...")
+    return run_cycle(cycle_ctx, policy, cycle_idx, cycle_dir, datetime.datetime.now().isoformat()).decision
+
+
+def _target_context(target: str, policy: DetectionPolicy, ctx: Dict[str, Any]) -> CycleContext:
+    def telemetry_for(cycle_dir: Path) -> Any:
+        if ctx["telemetry_mode"] == "mock":
+            from src.adapters.telemetry.mock import MockTelemetryAdapter
+            return MockTelemetryAdapter(run_dir=str(cycle_dir))
+        return ctx["telemetry_adapter"]
+
+    target_dir = Path(ctx["evidence_dir"]) / target
+    shadow = None
+    if ctx["shadow_configs"]:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        shadow = ShadowPolicies(ctx["shadow_configs"], policy, target_dir / "shadow_decisions.jsonl")
+        ctx["closing"].append(shadow)
+    return CycleContext(
+        session=f"{Path(ctx['evidence_dir']).name}/{target}",
+        log=ctx["log"],
+        spans=ctx["spans"],
+        telemetry_for=telemetry_for,
+        actuation_adapter=ctx["actuation_adapter"],
+        actuation_mode=ctx["config"].actuation_mode,
+        duration_sec=ctx["config"].duration_sec,
+        interval_sec=ctx["config"].interval_sec,
+        config_version=ctx["config"].version,
+        shadow=shadow,
+        metrics=ctx["metrics"],
+        board_slot=ctx["board"].slot(target) if ctx["board"] else None,
+        tsdb=ctx["tsdb"],
+        tsdb_target=target,
+        index=ctx["index"],
+        blobs=ctx["blobs"],
+    )
+
+
+def _worker_context(worker_id: int, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-worker services shared by every target the worker runs."""
+    evidence_dir = Path(settings["evidence_dir"])
+    evidence_dir.mkdir(parents=True, exist_ok=True)
+    config = WatchConfig(
+        variance_threshold=settings["variance_threshold"],
+        queue_threshold=settings.get("queue_threshold", 50),
+        cooldown_cycles=settings.get("cooldown_cycles", 3),
+        interval_sec=settings.get("interval_sec", 5),
+        duration_sec=settings.get("duration_sec", 30),
+        telemetry_mode=settings.get("telemetry_mode", "mock"),
+        actuation_mode=settings.get("actuation_mode", "noop"),
+    )
+    watcher = None
+    if settings.get("config_path"):
+        watcher = ConfigWatcher(settings["config_path"], config)
+        config = watcher.poll() or config
+    metrics = metrics_server = None
+    if settings.get("metrics_port") is not None:
+        metrics = WatchtowerMetrics()
+        metrics.interval.set(config.interval_sec)
+        try:
+            metrics_server = MetricsServer(metrics.registry, settings.get("metrics_host", "127.0.0.1"),
+                                           settings["metrics_port"] + worker_id).start()
+        except OSError as e:
+            print(f"[SHARD] worker-{worker_id} WARN: Metrics endpoint unavailable: {e}")
+    board = None
+    if settings.get("status_board"):
+        from .status_board import StatusBoard
+        try:
+            board = StatusBoard(settings["status_board"])
+        except OSError as e:
+            print(f"[SHARD] worker-{worker_id} WARN: Status board unavailable: {e}")
+    shadow = settings.get("shadow_policies")
+    return {
+        "evidence_dir": str(evidence_dir),
+        "worker": worker_id,
+        "config": config,
+        "watcher": watcher,
+        "telemetry_mode": config.telemetry_mode,
+        "telemetry_adapter": build_telemetry_adapter(config.telemetry_mode, config.telemetry_options),
+        "actuation_adapter": build_actuation_adapter(config.actuation_mode, config.actuation_options),
+        "log": WatchtowerLog(str(evidence_dir / f"watchtower.worker-{worker_id}.log")),
+        "spans": SpanTimer(enabled=settings.get("stage_timing", True) or metrics is not None,
+                           sink=metrics.observe_stage if metrics else None),
+        "metrics": metrics,
+        "metrics_server": metrics_server,
+        "board": board,
+        "tsdb": TimeSeriesStore(settings["tsdb_dir"]) if settings.get("tsdb_dir") else None,
+        "index": EvidenceIndex(settings["evidence_index"]) if settings.get("evidence_index") else None,
+        "blobs": BlobStore(settings["blob_store"]) if settings.get("blob_store") else None,
+        "shadow_configs": load_shadow_config(shadow) if shadow else [],
+        "targets": {},
+        "closing": [],
+    }
+
+
+def _reload(ctx: Dict[str, Any], policies: Dict[str, DetectionPolicy]) -> None:
+    """
+    Applies a new config version between ticks: thresholds, duration and
+    adapters. The tick interval is fixed by the supervisor (lease TTL).
+    """
+    watcher, config = ctx["watcher"], ctx["config"]
+    new_config = watcher.poll()
+    if not new_config:
+        return
+    changes = config.diff(new_config)
+    try:
+        telemetry, actuation = ctx["telemetry_adapter"], ctx["actuation_adapter"]
+        if "telemetry_mode" in changes or "telemetry_options" in changes:
+            telemetry = build_telemetry_adapter(new_config.telemetry_mode, new_config.telemetry_options)
+            if telemetry is None and new_config.telemetry_mode != "mock":
+                raise ValueError(f"unknown telemetry_mode: {new_config.telemetry_mode}")
+        if "actuation_mode" in changes or "actuation_options" in changes:
+            actuation = build_actuation_adapter(new_config.actuation_mode, new_config.actuation_options)
+            if actuation is None:
+                raise ValueError(f"unknown actuation_mode: {new_config.actuation_mode}")
+    except Exception as e:
+        watcher.reject(config, f"version {new_config.version} rejected: {e}")
+        ctx["log"].event("config_rejected", level=logging.WARNING, version=config.version, reason=watcher.last_error)
+        return
+    ctx.update(config=new_config, telemetry_mode=new_config.telemetry_mode,
+               telemetry_adapter=telemetry, actuation_adapter=actuation)
+    for policy in policies.values():
+        policy.variance_threshold = new_config.variance_threshold
+        policy.queue_threshold = new_config.queue_threshold
+        policy.cooldown_cycles = new_config.cooldown_cycles
+    for target, cycle_ctx in ctx["targets"].items():
+        cycle_ctx.actuation_adapter, cycle_ctx.actuation_mode = actuation, new_config.actuation_mode
+        cycle_ctx.duration_sec, cycle_ctx.config_version = new_config.duration_sec, new_config.version
+        if cycle_ctx.shadow and target in policies:
+            cycle_ctx.shadow.inherit(policies[target])
+    ctx["log"].event("config_reload", version=new_config.version, changes={k: v[1] for k, v in changes.items()})
+
+
+def run_worker(
+    worker_id: int,
+    lease_dir: str,
+    n_shards: int,
+    targets: Sequence[str],
+    settings: Dict[str, Any],
+    cycle_fn: Callable[[str, int, DetectionPolicy, Dict[str, Any]], str] = watch_target_cycle,
+) -> None:
+    """
+    Worker process body: follows the supervisor's assignment file, holds a
+    lease per assigned shard, and runs one cycle per target of each held
+    shard per tick. Leases are renewed after each shard's cycles and every
+    `heartbeat_sec` by a heartbeat thread, so a slow collect or actuation
+    does not look like a hung worker, and released on exit.
+
+    Optional settings enable the same features as watch_variance: config_path,
+    shadow_policies, evidence_index, tsdb_dir, blob_store, status_board,
+    stage_timing and metrics_port (served on metrics_port + worker_id).
+    """
+    if str(_REPO_ROOT) not in sys.path:
+        sys.path.append(str(_REPO_ROOT))
+    owner = f"worker-{worker_id}@{os.uname().nodename}:{os.getpid()}"
+    lease_dir = Path(lease_dir)
+    by_shard: Dict[int, List[str]] = {}
+    for target in targets:
+        by_shard.setdefault(shard_of(target, n_shards), []).append(target)
+
+    ctx = _worker_context(worker_id, settings)
+    leases: Dict[int, ShardLease] = {}
+    policies: Dict[str, DetectionPolicy] = {}
+    assignment_key = None
+    mine: List[int] = []
+    deadline = time.monotonic() + settings["run_sec"] if settings.get("run_sec") else None
+
+    def new_policy(saved: Optional[Dict[str, Any]]) -> DetectionPolicy:
+        config = ctx["config"]
+        policy = DetectionPolicy(config.variance_threshold, config.queue_threshold, config.cooldown_cycles)
+        if saved:
+            policy.last_cycle, policy.last_status = saved["last_cycle"], saved["last_status"]
+        return policy
+
+    stop_heartbeat = threading.Event()
+
+    def heartbeat() -> None:
+        while not stop_heartbeat.wait(settings.get("heartbeat_sec", 1.0)):
+            for lease in tuple(leases.values()):
+                lease.renew()
+
+    heartbeat_thread = threading.Thread(target=heartbeat, name=f"lease-heartbeat-{worker_id}", daemon=True)
+    heartbeat_thread.start()
+    try:
+        for _ in range(settings.get("iterations", 5)):
+            if os.path.exists(lease_dir / "stop"):
+                break
+            tick = time.monotonic()
+
+            # Follow the assignment (cheap stat; re-read only when it moved)
+            try:
+                st = os.stat(lease_dir / ASSIGNMENT_FILE)
+                key = (st.st_mtime_ns, st.st_size)
+                if key != assignment_key:
+                    with open(lease_dir / ASSIGNMENT_FILE, "r", encoding="utf-8") as f:
+                        assignment = json.load(f)["shards"]
+                    mine = sorted(int(s) for s, w in assignment.items() if w == worker_id)
+                    assignment_key = key
+            except (OSError, ValueError, KeyError):
+                pass
+            if ctx["watcher"]:
+                _reload(ctx, policies)
+
+            for shard in [s for s in leases if s not in mine]:
+                leases.pop(shard).release()
+            for shard in mine:
+                if shard in leases:
+                    continue
+                lease = ShardLease(lease_dir, shard, owner)
+                if lease.acquire():  # else: previous owner still draining, retry next tick
+                    leases[shard] = lease
+                    for target in by_shard.get(shard, []):
+                        policies[target] = new_policy(lease.state.get(target))
+
+            for shard, lease in leases.items():
+                ctx["shard"] = shard
+                state = dict(lease.state)
+                for target in by_shard.get(shard, []):
+                    saved = state.get(target) or {}
+                    if saved.get("halted"):
+                        continue
+                    cycle_idx = saved.get("cycle", 0) + 1
+                    policy = policies[target]
+                    try:
+                        decision = cycle_fn(target, cycle_idx, policy, ctx)
+                    except Exception as e:
+                        decision = "CRASH"
+                        print(f"[SHARD] {target} cycle {cycle_idx} crashed: {e}\n{traceback.format_exc()}")
+                    state[target] = {
+                        "cycle": cycle_idx,
+                        "last_cycle": policy.last_cycle,
+                        "last_status": policy.last_status,
+                        "halted": decision == "HALT",
+                    }
+                lease.renew(state)
+
+            if deadline and time.monotonic() >= deadline:
+                break
+            time.sleep(max(0.0, tick + settings.get("interval_sec", 5) - time.monotonic()))
+    finally:
+        stop_heartbeat.set()
+        heartbeat_thread.join()
+        for lease in leases.values():
+            lease.release()
+        for closeable in ctx["closing"]:
+            closeable.close()
+        for name in ("board", "tsdb", "index", "log"):
+            if ctx[name]:
+                ctx[name].close()
+        if ctx["metrics_server"]:
+            ctx["metrics_server"].stop()
+
+
+class ShardSupervisor:
+    """
+    Spawns N worker processes, spreads shards across them, and moves the
+    shards of a worker that dies (non-zero exit) or stops heartbeating
+    (lease older than `lease_ttl_sec`, the worker is then killed) to the
+    surviving workers. A supervisor.lock flock keeps one supervisor per
+    lease directory.
+
+    Workers heartbeat every lease_ttl_sec / 3 from a background thread, so
+    a long cycle does not make a live worker look stale; a stale lease
+    means the process is stopped or wedged. The TTL must still exceed the
+    tick interval by LEASE_TTL_MARGIN_SEC.
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[str],
+        workers: int,
+        shards: int,
+        lease_dir: str,
+        settings: Dict[str, Any],
+        lease_ttl_sec: float = 30.0,
+        poll_sec: float = 1.0,
+        cycle_fn: Callable[[str, int, DetectionPolicy, Dict[str, Any]], str] = watch_target_cycle,
+    ):
+        if fcntl is None:
+            raise OSError("Sharded watchtower needs POSIX flock leases; unavailable on this platform")
+        self.targets = list(targets)
+        self.n_workers = workers
+        self.n_shards = shards
+        self.lease_dir = Path(lease_dir)
+        interval = settings.get("interval_sec", 5)
+        if lease_ttl_sec <= interval + LEASE_TTL_MARGIN_SEC:
+            raise ValueError(
+                f"lease_ttl_sec ({lease_ttl_sec}) must exceed interval_sec ({interval}) "
+                f"by more than {LEASE_TTL_MARGIN_SEC}s"
+            )
+        self.settings = dict(settings, heartbeat_sec=min(interval, lease_ttl_sec / 3))
+        self.lease_ttl_sec = lease_ttl_sec
+        self.poll_sec = poll_sec
+        self.cycle_fn = cycle_fn
+        self.assignment: Dict[int, int] = {}
+        self.reassignments: List[Dict[str, Any]] = []
+        self._procs: Dict[int, multiprocessing.Process] = {}
+        self._epoch = 0
+
+    def _publish(self) -> None:
+        self._epoch += 1
+        _write_json_atomic(self.lease_dir / ASSIGNMENT_FILE, {
+            "epoch": self._epoch,
+            "shards": {str(s): w for s, w in sorted(self.assignment.items())},
+        })
+
+    def _rebalance(self, dead: int, reason: str) -> None:
+        survivors = [w for w, p in self._procs.items() if w != dead and p.exitcode is None]
+        orphaned = sorted(s for s, w in self.assignment.items() if w == dead)
+        if not survivors:
+            return
+        load = {w: sum(1 for v in self.assignment.values() if v == w) for w in survivors}
+        for shard in orphaned:
+            target = min(survivors, key=lambda w: (load[w], w))
+            self.assignment[shard] = target
+            load[target] += 1
+        self.reassignments.append({"worker": dead, "reason": reason, "shards": orphaned, "at": time.time()})
+        print(f"[SUPERVISOR] worker-{dead} {reason}; moved shards {orphaned}")
+        self._publish()
+
+    def _stale_workers(self) -> List[int]:
+        now = time.time()
+        stale = set()
+        for shard, worker in self.assignment.items():
+            if self._procs[worker].exitcode is not None:
+                continue  # already gone; a non-zero exit is handled by run()
+            body = ShardLease.read(self.lease_dir / f"shard_{shard:03d}.lease")
+            if body and body.get("pid") == self._procs[worker].pid:
+                if now - body.get("renewed_at", now) > self.lease_ttl_sec:
+                    stale.add(worker)
+        return sorted(stale)
+
+    def run(self) -> Dict[str, Any]:
+        """Runs the workers to completion; returns a session summary."""
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        lock_fd = os.open(self.lease_dir / "supervisor.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(lock_fd)
+            return {"status": "error", "message": f"Supervisor already active in {self.lease_dir}"}
+
+        try:
+            self.assignment = {s: s % self.n_workers for s in range(self.n_shards)}
+            self._publish()
+            for worker_id in range(self.n_workers):
+                proc = multiprocessing.Process(
+                    target=run_worker,
+                    args=(worker_id, str(self.lease_dir), self.n_shards, self.targets, self.settings, self.cycle_fn),
+                    name=f"watch-shard-{worker_id}",
+                )
+                proc.start()
+                self._procs[worker_id] = proc
+            print(f"[SUPERVISOR] {self.n_workers} workers / {self.n_shards} shards / {len(self.targets)} targets")
+
+            handled = set()
+            while any(p.exitcode is None for p in self._procs.values()):
+                time.sleep(self.poll_sec)
+                for worker_id in self._stale_workers():
+                    if worker_id not in handled:
+                        self._procs[worker_id].kill()
+                        self._procs[worker_id].join()
+                        handled.add(worker_id)
+                        self._rebalance(worker_id, "missed heartbeat")
+                for worker_id, proc in self._procs.items():
+                    if worker_id not in handled and proc.exitcode not in (None, 0):
+                        handled.add(worker_id)
+                        self._rebalance(worker_id, f"exited with code {proc.exitcode}")
+
+            return {
+                "status": "ok",
+                "workers": {w: p.exitcode for w, p in self._procs.items()},
+                "assignment": dict(self.assignment),
+                "reassignments": self.reassignments,
+            }
+        finally:
+            for proc in self._procs.values():
+                if proc.exitcode is None:
+                    proc.kill()
+                    proc.join()
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
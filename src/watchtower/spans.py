@@ -0,0 +1,137 @@
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +Inf).
+STAGE_BUCKETS_MS: Tuple[float, ...] = (
+    0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0, 5000.0, 10000.0, float("inf")
+)
+_BUCKETS_NS: Tuple[float, ...] = tuple(b * 1_000_000 for b in STAGE_BUCKETS_MS)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_timer", "_name", "_start")
+
+    def __init__(self, timer: "SpanTimer", name: str):
+        self._timer = timer
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.monotonic_ns()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self._timer.record(self._name, time.monotonic_ns() - self._start)
+        return False
+
+
+class RollingHistogram:
+    """Fixed-bucket histogram over the most recent `window` samples."""
+
+    __slots__ = ("counts", "_recent", "total", "sum_ns")
+
+    def __init__(self, window: int):
+        self.counts: List[int] = [0] * len(_BUCKETS_NS)
+        self._recent: Deque[Tuple[int, int]] = deque(maxlen=window)
+        self.total = 0      # lifetime sample count
+        self.sum_ns = 0     # lifetime sum
+
+    def add(self, elapsed_ns: int) -> None:
+        idx = bisect_left(_BUCKETS_NS, elapsed_ns)
+        if len(self._recent) == self._recent.maxlen:
+            evicted_idx, _ = self._recent[0]
+            self.counts[evicted_idx] -= 1
+        self._recent.append((idx, elapsed_ns))
+        self.counts[idx] += 1
+        self.total += 1
+        self.sum_ns += elapsed_ns
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q-th percentile (0-100) of the rolling window, in milliseconds."""
+        if not self._recent:
+            return None
+        ordered = sorted(ns for _, ns in self._recent)
+        rank = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[rank] / 1_000_000
+
+
+class SpanTimer:
+    """
+    Per-stage wall-clock timer for the watchtower hot path.
+
+    Spans use the monotonic nanosecond clock. Span objects are cached per
+    stage name, and a disabled timer hands out one shared no-op span, so
+    neither mode allocates on the hot path after warm-up.
+
+    Durations accumulate into the current cycle (see `cycle_ms`) until
+    `end_cycle` is called, and into a rolling histogram per stage. An
+    optional `sink(stage, elapsed_ns)` receives every sample as well.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        window: int = 256,
+        sink: Optional[Callable[[str, int], None]] = None,
+    ):
+        self.enabled = enabled
+        self.window = window
+        self.sink = sink
+        self.histograms: Dict[str, RollingHistogram] = {}
+        self._cycle: Dict[str, int] = {}
+        self._spans: Dict[str, _Span] = {}
+
+    def span(self, name: str):
+        """Context manager timing one stage."""
+        if not self.enabled:
+            return _NULL_SPAN
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, name)
+        return span
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """Adds an externally measured duration for a stage."""
+        if not self.enabled:
+            return
+        self._cycle[name] = self._cycle.get(name, 0) + elapsed_ns
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = RollingHistogram(self.window)
+        hist.add(elapsed_ns)
+        if self.sink is not None:
+            self.sink(name, elapsed_ns)
+
+    def cycle_ms(self) -> Dict[str, float]:
+        """Stage durations (ms) accumulated so far in the current cycle."""
+        return {name: round(ns / 1_000_000, 3) for name, ns in self._cycle.items()}
+
+    def end_cycle(self) -> None:
+        """Starts a new per-cycle accumulation. Histograms are untouched."""
+        self._cycle.clear()
+
+    def histogram_summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """p50/p90/p99 (ms) per stage over the rolling window."""
+        return {
+            name: {
+                "p50": hist.percentile(50),
+                "p90": hist.percentile(90),
+                "p99": hist.percentile(99),
+            }
+            for name, hist in self.histograms.items()
+        }
@@ -0,0 +1,203 @@
+import mmap
+import os
+import struct
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no status board (slot claims need flock)
+    fcntl = None
+
+_SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+DEFAULT_BOARD_PATH = os.path.join(_SHM_DIR, "blackglass_watchtower.board")
+
+MAGIC = b"BGSB"
+LAYOUT_VERSION = 1
+
+# Header: magic, layout version, slot count, slot size, created_at
+_HEADER = struct.Struct("<4sHxxIId")
+HEADER_SIZE = 64
+
+# Slot: seq (u64) followed by the payload below; 128 bytes per slot
+_SEQ = struct.Struct("<Q")
+_PAYLOAD = struct.Struct("<48sQBB6xdqddI4x")
+SLOT_SIZE = 128
+_NAME_BYTES = 48
+
+DECISIONS = ("UNKNOWN", "NOOP", "MITIGATE", "SKIPPED_DEBOUNCE", "ERROR", "CRASH", "HALT")
+STATUSES = ("UNKNOWN", "OK", "INTERDICT_DRIFT", "INTERDICT_QUEUE")
+_DECISION_CODE = {d: i for i, d in enumerate(DECISIONS)}
+_STATUS_CODE = {s: i for i, s in enumerate(STATUSES)}
+
+
+class BoardSlot:
+    """Writer handle for one target's slot. One writer per slot."""
+
+    __slots__ = ("_mm", "_offset", "_name", "_seq", "started_at")
+
+    def __init__(self, mm: mmap.mmap, offset: int, name: bytes):
+        self._mm = mm
+        self._offset = offset
+        self._name = name
+        self._seq = _SEQ.unpack_from(mm, offset)[0] & ~1
+        self.started_at = time.time()
+
+    def publish(self, cycle: int, decision: str, status: str = "UNKNOWN",
+                drift: float = float("nan"), queue_depth: int = -1) -> None:
+        """
+        Seqlock write: seq goes odd, the payload is packed straight into the
+        mapping (one copy), then seq goes even again.
+        """
+        mm, off = self._mm, self._offset
+        self._seq += 1
+        _SEQ.pack_into(mm, off, self._seq)
+        _PAYLOAD.pack_into(
+            mm, off + 8, self._name, cycle,
+            _DECISION_CODE.get(decision, 0), _STATUS_CODE.get(status, 0),
+            drift, queue_depth, self.started_at, time.time(), os.getpid(),
+        )
+        self._seq += 1
+        _SEQ.pack_into(mm, off, self._seq)
+
+
+class StatusBoard:
+    """
+    Fixed-layout shared-memory status board for live watchtower state.
+
+    A file-backed mmap (under /dev/shm where available) holds a 64-byte
+    header and `slots` 128-byte slots, one per watched target, each with
+    last cycle, decision, status, drift, queue depth, start/update times
+    and writer pid. Writers update their slot in place under a per-slot
+    sequence counter. Readers in any process map the same file and read
+    lock-free with the seqlock protocol: retry while the counter is odd or
+    changed across the read.
+
+    Only claiming a new slot takes a (brief) flock on the file.
+    """
+
+    def __init__(self, path: str = DEFAULT_BOARD_PATH, slots: int = 256, create: bool = True):
+        if fcntl is None:
+            raise OSError("Status board needs POSIX flock; unavailable on this platform")
+        self.path = path
+        flags = os.O_RDWR | (os.O_CREAT if create else 0)
+        self._fd = os.open(path, flags, 0o644)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                size = os.fstat(self._fd).st_size
+                if size == 0:
+                    if not create:
+                        raise FileNotFoundError(f"Status board not initialized: {path}")
+                    os.ftruncate(self._fd, HEADER_SIZE + slots * SLOT_SIZE)
+                    header = _HEADER.pack(MAGIC, LAYOUT_VERSION, slots, SLOT_SIZE, time.time())
+                    os.pwrite(self._fd, header, 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._mm = mmap.mmap(self._fd, 0)
+        except Exception:
+            os.close(self._fd)
+            raise
+        magic, version, self.slots, slot_size, self.created_at = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION or slot_size != SLOT_SIZE:
+            self.close()
+            raise ValueError(f"Incompatible status board layout in {path}")
+        self._writers: Dict[str, BoardSlot] = {}
+
+    def _offset(self, index: int) -> int:
+        return HEADER_SIZE + index * SLOT_SIZE
+
+    def _name_at(self, index: int) -> bytes:
+        off = self._offset(index) + 8
+        return self._mm[off:off + _NAME_BYTES]
+
+    def slot(self, target: str) -> BoardSlot:
+        """Claims (or re-attaches to) the slot for `target`."""
+        writer = self._writers.get(target)
+        if writer is not None:
+            return writer
+        name = target.encode("utf-8")[:_NAME_BYTES].ljust(_NAME_BYTES, b"\0")
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            free = None
+            for i in range(self.slots):
+                current = self._name_at(i)
+                if current == name:
+                    free = i
+                    break
+                if free is None and current == b"\0" * _NAME_BYTES:
+                    free = i
+            if free is None:
+                raise RuntimeError(f"Status board full ({self.slots} slots): {self.path}")
+            off = self._offset(free)
+            if self._name_at(free) != name:
+                self._mm[off + 8:off + 8 + _NAME_BYTES] = name
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        writer = self._writers[target] = BoardSlot(self._mm, off, name)
+        return writer
+
+    def _read_slot(self, index: int, retries: int = 1000) -> Optional[Dict[str, Any]]:
+        mm, off = self._mm, self._offset(index)
+        for _ in range(retries):
+            seq1 = _SEQ.unpack_from(mm, off)[0]
+            if seq1 & 1:
+                continue
+            fields = _PAYLOAD.unpack_from(mm, off + 8)
+            if _SEQ.unpack_from(mm, off)[0] != seq1:
+                continue
+            if seq1 == 0:
+                return None  # claimed, nothing published yet
+            name, cycle, decision, status, drift, queue_depth, started_at, updated_at, pid = fields
+            return {
+                "target": name.rstrip(b"\0").decode("utf-8", "replace"),
+                "cycle": cycle,
+                "decision": DECISIONS[decision] if decision < len(DECISIONS) else "UNKNOWN",
+                "status": STATUSES[status] if status < len(STATUSES) else "UNKNOWN",
+                "drift": drift,
+                "queue_depth": queue_depth,
+                "started_at": started_at,
+                "updated_at": updated_at,
+                "pid": pid,
+                "seq": seq1,
+            }
+        return None
+
+    def read(self, target: str) -> Optional[Dict[str, Any]]:
+        """Consistent snapshot of one target's slot, or None."""
+        name = target.encode("utf-8")[:_NAME_BYTES].ljust(_NAME_BYTES, b"\0")
+        for i in range(self.slots):
+            if self._name_at(i) == name:
+                return self._read_slot(i)
+        return None
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Consistent per-slot snapshots of every published target."""
+        rows = []
+        for i in range(self.slots):
+            if self._name_at(i)[:1] == b"\0":
+                continue
+            row = self._read_slot(i)
+            if row:
+                rows.append(row)
+        return rows
+
+    def close(self) -> None:
+        self._writers.clear()
+        try:
+            self._mm.close()
+        except (AttributeError, BufferError):
+            pass
+        os.close(self._fd)
+
+
+def read_board(path: str = DEFAULT_BOARD_PATH) -> List[Dict[str, Any]]:
+    """One-shot reader for consumers; [] if no watchtower has published."""
+    if not os.path.exists(path):
+        return []
+    board = StatusBoard(path, create=False)
+    try:
+        return board.snapshot()
+    finally:
+        board.close()
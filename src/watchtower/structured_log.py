@@ -0,0 +1,179 @@
+import datetime
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Optional
+
+_SINK_FILE = "file"
+_SINK_CONSOLE = "console"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, msg plus any structured fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "msg": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", None) or {})
+        return json.dumps(payload, default=str)
+
+
+class _SinkFilter(logging.Filter):
+    def __init__(self, sink: str):
+        super().__init__()
+        self.sink = sink
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, "sink", _SINK_FILE) == self.sink
+
+
+class RotatingJsonlHandler(logging.Handler):
+    """
+    Appends to one long-lived file handle and rotates on size or age.
+
+    The byte count is tracked in memory, so deciding whether to rotate costs
+    no stat() call. Rotated files are renamed to `<name>.<YYYYmmdd_HHMMSS>`,
+    optionally gzip-compressed, and pruned to `backup_count`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        rotate_interval_sec: Optional[float] = None,
+        compress: bool = False,
+        backup_count: int = 10,
+    ):
+        super().__init__()
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.rotate_interval_sec = rotate_interval_sec
+        self.compress = compress
+        self.backup_count = backup_count
+        self._open()
+
+    def _open(self) -> None:
+        self._stream = open(self.path, "ab")
+        self._size = self._stream.tell()
+        self._opened_at = time.time()
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self.max_bytes and self._size > 0 and self._size + incoming > self.max_bytes:
+            return True
+        if self.rotate_interval_sec and time.time() - self._opened_at >= self.rotate_interval_sec:
+            return self._size > 0
+        return False
+
+    def rotate(self) -> Path:
+        """Closes the current file, archives it and reopens a fresh one."""
+        self._stream.close()
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        rotated = self.path.with_name(f"{self.path.name}.{stamp}")
+        n = 1
+        while rotated.exists() or rotated.with_name(rotated.name + ".gz").exists():
+            rotated = self.path.with_name(f"{self.path.name}.{stamp}_{n}")
+            n += 1
+        os.replace(self.path, rotated)
+        if self.compress:
+            with open(rotated, "rb") as src, gzip.open(f"{rotated}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
+            rotated = rotated.with_name(rotated.name + ".gz")
+        self._prune()
+        self._open()
+        return rotated
+
+    def _prune(self) -> None:
+        if self.backup_count <= 0:
+            return
+        backups = sorted(self.path.parent.glob(f"{self.path.name}.*"))
+        for old in backups[:-self.backup_count]:
+            old.unlink()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = (self.format(record) + "\n").encode("utf-8")
+            if self._should_rotate(len(data)):
+                self.rotate()
+            self._stream.write(data)
+            self._stream.flush()
+            self._size += len(data)
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            super().close()
+
+
+class WatchtowerLog:
+    """
+    Queue-backed logger for the watchtower loop.
+
+    The loop only enqueues records; a background listener thread owns the
+    JSON-lines file (see RotatingJsonlHandler) and the console stream, so
+    neither disk I/O nor a slow terminal can stall a cycle.
+
+    `event()` writes a structured record to the log file. `console()` replaces
+    print() for operator-facing progress lines.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        rotate_interval_sec: Optional[float] = None,
+        compress: bool = False,
+        backup_count: int = 10,
+        console_stream: Any = None,
+    ):
+        self._queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+        self.file_handler = RotatingJsonlHandler(
+            path,
+            max_bytes=max_bytes,
+            rotate_interval_sec=rotate_interval_sec,
+            compress=compress,
+            backup_count=backup_count,
+        )
+        self.file_handler.setFormatter(JsonLinesFormatter())
+        self.file_handler.addFilter(_SinkFilter(_SINK_FILE))
+
+        console = logging.StreamHandler(console_stream or sys.stdout)
+        console.setFormatter(logging.Formatter("%(message)s"))
+        console.addFilter(_SinkFilter(_SINK_CONSOLE))
+
+        # Not registered with logging.getLogger(): it goes away with this instance
+        self._logger = logging.Logger("watchtower", logging.DEBUG)
+        self._logger.propagate = False
+        self._queue_handler = QueueHandler(self._queue)
+        self._logger.addHandler(self._queue_handler)
+
+        self._listener = QueueListener(self._queue, self.file_handler, console)
+        self._listener.start()
+
+    def event(self, msg: str, level: int = logging.INFO, **fields: Any) -> None:
+        """Queues a structured record for the log file."""
+        self._logger.log(level, msg, extra={"sink": _SINK_FILE, "fields": fields})
+
+    def console(self, msg: str, level: int = logging.INFO) -> None:
+        """Queues an operator-facing line for stdout."""
+        self._logger.log(level, msg, extra={"sink": _SINK_CONSOLE})
+
+    def close(self) -> None:
+        """Drains the queue, then closes the file handle."""
+        self._listener.stop()
+        self._logger.removeHandler(self._queue_handler)
+        self.file_handler.close()
@@ -0,0 +1,242 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .replay import CycleRecord
+
+# Ground truth for time-to-detect: a cycle is part of an incident when it
+# crosses the floor at which recommend_mitigation produces evidence.
+INCIDENT_DRIFT = 0.05
+INCIDENT_QUEUE = 50
+
+_OK, _DRIFT, _QUEUE = 0, 1, 2
+_NEVER = np.iinfo(np.int64).min // 2
+
+
+class SignalSeries:
+    """Historical drift/queue signals as flat arrays (ERROR/CRASH cycles dropped)."""
+
+    def __init__(
+        self,
+        cycle: np.ndarray,
+        drift: np.ndarray,
+        queue_depth: np.ndarray,
+        session_start: np.ndarray,
+    ):
+        self.cycle = np.asarray(cycle, dtype=np.int64)
+        self.drift = np.asarray(drift, dtype=np.float64)
+        self.queue_depth = np.asarray(queue_depth, dtype=np.float64)
+        self.session_start = np.asarray(session_start, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.cycle)
+
+    @classmethod
+    def from_records(cls, records: Iterable[CycleRecord]) -> "SignalSeries":
+        cycle, drift, queue, start = [], [], [], []
+        session = None
+        for rec in records:
+            if rec.drift is None:
+                continue
+            cycle.append(rec.cycle)
+            drift.append(rec.drift)
+            queue.append(rec.queue_depth)
+            start.append(rec.session != session)
+            session = rec.session
+        return cls(np.array(cycle), np.array(drift), np.array(queue), np.array(start))
+
+    def incidents(self, drift_floor: float = INCIDENT_DRIFT, queue_floor: float = INCIDENT_QUEUE) -> np.ndarray:
+        return (self.drift > drift_floor) | (self.queue_depth > queue_floor)
+
+
+def parse_axis(spec: str) -> np.ndarray:
+    """Grid axis from "a,b,c" or a linspace "start:stop:num"."""
+    if ":" in spec:
+        start, stop, num = spec.split(":")
+        return np.linspace(float(start), float(stop), int(num))
+    return np.array([float(x) for x in spec.split(",") if x.strip()])
+
+
+def build_grid(
+    variance_thresholds: Sequence[float],
+    queue_thresholds: Sequence[float],
+    cooldowns: Sequence[int],
+) -> Dict[str, np.ndarray]:
+    """Cartesian product of the three axes as flat, aligned arrays."""
+    v, q, c = np.meshgrid(
+        np.asarray(variance_thresholds, dtype=np.float64),
+        np.asarray(queue_thresholds, dtype=np.float64),
+        np.asarray(cooldowns, dtype=np.int64),
+        indexing="ij",
+    )
+    return {"variance_threshold": v.ravel(), "queue_threshold": q.ravel(), "cooldown_cycles": c.ravel()}
+
+
+def _evaluate_chunk(
+    series: SignalSeries,
+    incidents: np.ndarray,
+    vthr: np.ndarray,
+    qthr: np.ndarray,
+    cooldown: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Runs every policy of the chunk through the series at once.
+
+    Time is walked sequentially (debounce is stateful); each step is a
+    handful of vector operations across all policies, reproducing
+    DetectionPolicy.evaluate exactly.
+    """
+    g = len(vthr)
+    last_status = np.zeros(g, dtype=np.int8)
+    last_cycle = np.full(g, _NEVER, dtype=np.int64)
+    last_episode = np.full(g, -1, dtype=np.int64)   # episode of the last mitigation
+    detected = np.zeros(g, dtype=bool)              # current episode already detected
+
+    interdictions = np.zeros(g, dtype=np.int64)
+    suppressed = np.zeros(g, dtype=np.int64)
+    false_positives = np.zeros(g, dtype=np.int64)
+    refires = np.zeros(g, dtype=np.int64)
+    detections = np.zeros(g, dtype=np.int64)
+    ttd_sum = np.zeros(g, dtype=np.int64)
+    ttd_max = np.zeros(g, dtype=np.int64)
+
+    episodes = 0
+    onset = 0
+    in_episode = False
+    status = np.empty(g, dtype=np.int8)
+
+    for t in range(len(series)):
+        cyc = int(series.cycle[t])
+        if series.session_start[t]:
+            last_status[:] = _OK
+            last_cycle[:] = _NEVER
+            in_episode = False
+        if incidents[t]:
+            if not in_episode:
+                episodes += 1
+                onset = cyc
+                in_episode = True
+                detected[:] = False
+        else:
+            in_episode = False
+
+        breach_drift = series.drift[t] > vthr
+        breach_queue = series.queue_depth[t] > qthr
+        status[:] = _OK
+        status[breach_queue] = _QUEUE
+        status[breach_drift] = _DRIFT
+        fired = status != _OK
+        if not fired.any():
+            continue
+
+        repeat = fired & (status == last_status) & (cyc - last_cycle <= cooldown)
+        mitigate = fired & ~repeat
+        suppressed += repeat
+        interdictions += mitigate
+        last_status[mitigate] = status[mitigate]
+        last_cycle[mitigate] = cyc
+
+        if in_episode:
+            refires += mitigate & (last_episode == episodes)
+            first = mitigate & ~detected
+            detections += first
+            ttd_sum += first * (cyc - onset)
+            np.maximum(ttd_max, np.where(first, cyc - onset, 0), out=ttd_max)
+            detected |= first
+            last_episode[mitigate] = episodes
+        else:
+            false_positives += mitigate
+
+    return {
+        "episodes": np.full(g, episodes, dtype=np.int64),
+        "interdictions": interdictions,
+        "suppressed": suppressed,
+        "false_positives": false_positives,
+        "refires": refires,
+        "detections": detections,
+        "ttd_sum": ttd_sum,
+        "ttd_max": ttd_max,
+    }
+
+
+def sweep(
+    series: SignalSeries,
+    grid: Dict[str, np.ndarray],
+    incidents: Optional[np.ndarray] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 4096,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluates every threshold/cooldown combination of `grid` over `series`.
+
+    Args:
+        series: Historical signals (see SignalSeries.from_records).
+        grid: Output of build_grid.
+        incidents: Per-cycle ground truth for time-to-detect. Defaults to
+            drift > INCIDENT_DRIFT or queue > INCIDENT_QUEUE.
+        workers: Processes for large grids. Defaults to the CPU count;
+            grids of one chunk or fewer always run in-process.
+        chunk_size: Policies per vectorized pass.
+
+    Returns:
+        One row per combination: interdictions, debounce suppressions,
+        detected/missed incident episodes, mean/max time-to-detect (cycles),
+        false positives and flap rate (share of interdictions that re-fire
+        during an episode already mitigated by the same policy).
+    """
+    if incidents is None:
+        incidents = series.incidents()
+    vthr = grid["variance_threshold"]
+    qthr = grid["queue_threshold"]
+    cooldown = grid["cooldown_cycles"]
+    bounds = [(i, min(i + chunk_size, len(vthr))) for i in range(0, len(vthr), chunk_size)]
+
+    workers = workers or os.cpu_count() or 1
+    if len(bounds) <= 1 or workers <= 1:
+        parts = [_evaluate_chunk(series, incidents, vthr[a:b], qthr[a:b], cooldown[a:b]) for a, b in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+            futures = [
+                pool.submit(_evaluate_chunk, series, incidents, vthr[a:b], qthr[a:b], cooldown[a:b])
+                for a, b in bounds
+            ]
+            parts = [f.result() for f in futures]
+
+    if not parts:
+        return []
+    out = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+    interdictions = out["interdictions"]
+    detections = out["detections"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ttd_mean = np.where(detections > 0, out["ttd_sum"] / np.maximum(detections, 1), np.nan)
+        flap_rate = np.where(interdictions > 0, out["refires"] / np.maximum(interdictions, 1), 0.0)
+
+    rows = []
+    for i in range(len(vthr)):
+        rows.append({
+            "variance_threshold": float(vthr[i]),
+            "queue_threshold": float(qthr[i]),
+            "cooldown_cycles": int(cooldown[i]),
+            "interdictions": int(interdictions[i]),
+            "suppressed": int(out["suppressed"][i]),
+            "episodes": int(out["episodes"][i]),
+            "detected": int(detections[i]),
+            "missed": int(out["episodes"][i] - detections[i]),
+            "ttd_mean_cycles": None if np.isnan(ttd_mean[i]) else round(float(ttd_mean[i]), 3),
+            "ttd_max_cycles": int(out["ttd_max"][i]),
+            "false_positives": int(out["false_positives"][i]),
+            "flap_rate": round(float(flap_rate[i]), 4),
+        })
+    return rows
+
+
+def rank(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fewest misses, then fastest detection, then fewest actuations."""
+    return sorted(rows, key=lambda r: (
+        r["missed"],
+        r["ttd_mean_cycles"] if r["ttd_mean_cycles"] is not None else float("inf"),
+        r["false_positives"],
+        r["interdictions"],
+    ))
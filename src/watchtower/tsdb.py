@@ -0,0 +1,543 @@
+import datetime
+import json
+import os
+import re
+import struct
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_F64 = struct.Struct(">d")
+_U64 = struct.Struct(">Q")
+_HEAD = struct.Struct("<qd")            # WAL point: ts_ms, value
+# Time index entry: t_min, t_max, offset, length, count, sum, min, max, first, last
+_INDEX = struct.Struct("<qqQIIddddd")
+
+# Rollup row: bucket start, count, sum, min, max, first, last
+_ROLLUP = struct.Struct("<qIddddd")
+
+AGGREGATES = ("mean", "min", "max", "sum", "count", "first", "last")
+ROLLUP_TIERS_SEC = (300, 3600)
+
+
+# --- Gorilla chunk codec ---------------------------------------------------
+
+class _BitWriter:
+    __slots__ = ("buf", "acc", "n")
+
+    def __init__(self):
+        self.buf = bytearray()
+        self.acc = 0
+        self.n = 0
+
+    def write(self, value: int, nbits: int) -> None:
+        self.acc = (self.acc << nbits) | (value & ((1 << nbits) - 1))
+        self.n += nbits
+        if self.n >= 64:
+            keep = self.n & 7
+            self.buf += (self.acc >> keep).to_bytes((self.n - keep) >> 3, "big")
+            self.acc &= (1 << keep) - 1
+            self.n = keep
+
+    def getvalue(self) -> bytes:
+        pad = (-self.n) & 7
+        tail = (self.acc << pad).to_bytes((self.n + pad) >> 3, "big") if self.n else b""
+        return bytes(self.buf) + tail
+
+
+class _BitReader:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes):
+        self.data = data + b"\0" * 9
+        self.pos = 0
+
+    def read(self, nbits: int) -> int:
+        pos = self.pos
+        byte = pos >> 3
+        window = int.from_bytes(self.data[byte:byte + 9], "big")   # 72 bits
+        self.pos = pos + nbits
+        return (window >> (72 - (pos & 7) - nbits)) & ((1 << nbits) - 1)
+
+    def bit(self) -> int:
+        pos = self.pos
+        self.pos = pos + 1
+        return (self.data[pos >> 3] >> (7 - (pos & 7))) & 1
+
+
+def _signed(value: int, nbits: int) -> int:
+    return value - (1 << nbits) if value >> (nbits - 1) else value
+
+
+def encode_chunk(timestamps: Sequence[int], values: Sequence[float]) -> bytes:
+    """
+    Gorilla encoding: the first point raw, then delta-of-delta timestamps
+    in variable-width buckets and values XORed with their predecessor,
+    reusing the previous leading/trailing-zero window when it fits.
+    """
+    w = _BitWriter()
+    t_prev = timestamps[0]
+    v_prev = _U64.unpack(_F64.pack(values[0]))[0]
+    w.write(t_prev, 64)
+    w.write(v_prev, 64)
+    delta_prev = 0
+    lead_prev, trail_prev = 65, 0
+
+    for i in range(1, len(timestamps)):
+        t = timestamps[i]
+        delta = t - t_prev
+        dod = delta - delta_prev
+        if dod == 0:
+            w.write(0, 1)
+        elif -64 <= dod <= 63:
+            w.write(0b10, 2)
+            w.write(dod, 7)
+        elif -256 <= dod <= 255:
+            w.write(0b110, 3)
+            w.write(dod, 9)
+        elif -2048 <= dod <= 2047:
+            w.write(0b1110, 4)
+            w.write(dod, 12)
+        else:
+            w.write(0b1111, 4)
+            w.write(dod, 64)
+        t_prev, delta_prev = t, delta
+
+        v = _U64.unpack(_F64.pack(values[i]))[0]
+        x = v ^ v_prev
+        v_prev = v
+        if x == 0:
+            w.write(0, 1)
+            continue
+        lead = min(64 - x.bit_length(), 31)
+        trail = (x & -x).bit_length() - 1
+        if lead >= lead_prev and trail >= trail_prev:
+            w.write(0b10, 2)
+            w.write(x >> trail_prev, 64 - lead_prev - trail_prev)
+        else:
+            sig = 64 - lead - trail
+            w.write(0b11, 2)
+            w.write(lead, 5)
+            w.write(sig - 1, 6)
+            w.write(x >> trail, sig)
+            lead_prev, trail_prev = lead, trail
+    return w.getvalue()
+
+
+def decode_chunk(payload: bytes, count: int) -> Tuple[List[int], List[float]]:
+    r = _BitReader(payload)
+    t = r.read(64)
+    v = r.read(64)
+    timestamps = [t]
+    bits = [v]
+    delta = 0
+    lead, trail = 0, 0
+    for _ in range(count - 1):
+        if not r.bit():
+            dod = 0
+        elif not r.bit():
+            dod = _signed(r.read(7), 7)
+        elif not r.bit():
+            dod = _signed(r.read(9), 9)
+        elif not r.bit():
+            dod = _signed(r.read(12), 12)
+        else:
+            dod = _signed(r.read(64), 64)
+        delta += dod
+        t += delta
+        timestamps.append(t)
+
+        if r.bit():
+            if r.bit():
+                lead = r.read(5)
+                sig = r.read(6) + 1
+                trail = 64 - lead - sig
+            v ^= r.read(64 - lead - trail) << trail
+        bits.append(v)
+    unpack, pack = _F64.unpack, _U64.pack
+    return timestamps, [unpack(pack(b))[0] for b in bits]
+
+
+# --- Store -----------------------------------------------------------------
+
+class _Rollup:
+    """
+    Epoch-aligned pre-aggregates at one resolution (rollup_<sec>s.dat).
+
+    A row is written when its bucket closes; the open bucket lives in
+    memory and is rebuilt from raw points on open.
+    """
+
+    def __init__(self, path: Path, res_ms: int):
+        self.path = path
+        self.res_ms = res_ms
+        self.starts: List[int] = []
+        self.rows: List[tuple] = []
+        self._loaded = False
+        self.last_start: Optional[int] = None
+        if path.exists():
+            size = path.stat().st_size
+            size -= size % _ROLLUP.size
+            if size:
+                with open(path, "rb") as f:
+                    f.seek(size - _ROLLUP.size)
+                    self.last_start = _ROLLUP.unpack(f.read(_ROLLUP.size))[0]
+                os.truncate(path, size)   # drop a torn trailing row
+        self.open_start: Optional[int] = None
+        self.acc: Optional[List[float]] = None
+        self._file = open(path, "ab")
+
+    def add(self, ts: int, v: float) -> None:
+        start = ts - ts % self.res_ms
+        if start != self.open_start:
+            self._emit()
+            self.open_start = start
+            self.acc = [1, v, v, v, v, v]
+            return
+        acc = self.acc
+        acc[0] += 1
+        acc[1] += v
+        if v < acc[2]:
+            acc[2] = v
+        if v > acc[3]:
+            acc[3] = v
+        acc[5] = v
+
+    def _emit(self) -> None:
+        if self.open_start is None:
+            return
+        row = (self.open_start, *self.acc)
+        self._file.write(_ROLLUP.pack(*row))
+        self.last_start = self.open_start
+        if self._loaded:
+            self.starts.append(self.open_start)
+            self.rows.append(row)
+
+    def load(self) -> None:
+        if self._loaded:
+            return
+        self._file.flush()
+        raw = self.path.read_bytes()
+        self.rows = list(_ROLLUP.iter_unpack(raw[:len(raw) - len(raw) % _ROLLUP.size]))
+        self.starts = [r[0] for r in self.rows]
+        self._loaded = True
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _Series:
+    """One series on disk: chunks.dat (payloads), index.dat (time index), head.dat (WAL)."""
+
+    def __init__(self, path: Path, chunk_points: int, tiers_sec: Sequence[int] = ROLLUP_TIERS_SEC):
+        self.path = path
+        self.chunk_points = chunk_points
+        path.mkdir(parents=True, exist_ok=True)
+        self.index: List[tuple] = []
+        idx_file = path / "index.dat"
+        if idx_file.exists():
+            raw = idx_file.read_bytes()
+            usable = len(raw) - len(raw) % _INDEX.size   # drop a torn trailing entry
+            self.index = [e for e in _INDEX.iter_unpack(raw[:usable])]
+        self.t_min = [e[0] for e in self.index]
+        self.t_max = [e[1] for e in self.index]
+
+        self.head_ts: List[int] = []
+        self.head_vals: List[float] = []
+        head_file = path / "head.dat"
+        if head_file.exists():
+            raw = head_file.read_bytes()
+            raw = raw[:len(raw) - len(raw) % _HEAD.size]
+            if self.index:
+                # A crash between indexing a chunk and truncating the head
+                # leaves exactly that chunk's points at the front of the head.
+                ts, vals = self.read_chunk(len(self.index) - 1)
+                sealed = b"".join(_HEAD.pack(t, v) for t, v in zip(ts, vals))
+                if raw.startswith(sealed):
+                    raw = raw[len(sealed):]
+            for ts, val in _HEAD.iter_unpack(raw):
+                self.head_ts.append(ts)
+                self.head_vals.append(val)
+        self._chunks = open(path / "chunks.dat", "ab")
+        self._index = open(idx_file, "ab")
+        self._head = open(head_file, "ab")
+        if len(self.head_ts) * _HEAD.size != self._head.tell():
+            self._rewrite_head()
+
+        self.rollups = [_Rollup(path / f"rollup_{sec}s.dat", sec * 1000) for sec in tiers_sec]
+        for tier in self.rollups:
+            # Re-aggregate everything after the last persisted row (the open
+            # bucket, plus any rows lost to a crash).
+            since = tier.last_start + tier.res_ms if tier.last_start is not None else None
+            for ts, v in self._points_since(since):
+                tier.add(ts, v)
+
+    def _points_since(self, since: Optional[int]):
+        lo = since if since is not None else -(1 << 62)
+        for i in range(bisect_left(self.t_max, lo), len(self.index)):
+            ts, vals = self.read_chunk(i)
+            a = bisect_left(ts, lo)
+            yield from zip(ts[a:], vals[a:])
+        a = bisect_left(self.head_ts, lo)
+        yield from zip(self.head_ts[a:], self.head_vals[a:])
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        if self.head_ts:
+            return self.head_ts[-1]
+        return self.t_max[-1] if self.t_max else None
+
+    def _rewrite_head(self) -> None:
+        self._head.close()
+        with open(self.path / "head.dat", "wb") as f:
+            f.write(b"".join(_HEAD.pack(t, v) for t, v in zip(self.head_ts, self.head_vals)))
+        self._head = open(self.path / "head.dat", "ab")
+
+    def append(self, ts: int, value: float) -> None:
+        last = self.last_ts
+        if last is not None and ts < last:
+            raise ValueError(f"Out-of-order point for {self.path.name}: {ts} < {last}")
+        self.head_ts.append(ts)
+        self.head_vals.append(value)
+        self._head.write(_HEAD.pack(ts, value))
+        for tier in self.rollups:
+            tier.add(ts, value)
+        if len(self.head_ts) >= self.chunk_points:
+            self.seal()
+
+    def seal(self) -> None:
+        """Encodes the head into a chunk and indexes it."""
+        if not self.head_ts:
+            return
+        ts, vals = self.head_ts, self.head_vals
+        payload = encode_chunk(ts, vals)
+        offset = self._chunks.tell()
+        self._chunks.write(payload)
+        self._chunks.flush()
+        entry = (ts[0], ts[-1], offset, len(payload), len(ts),
+                 sum(vals), min(vals), max(vals), vals[0], vals[-1])
+        self._index.write(_INDEX.pack(*entry))
+        self._index.flush()
+        self.index.append(entry)
+        self.t_min.append(ts[0])
+        self.t_max.append(ts[-1])
+        self.head_ts, self.head_vals = [], []
+        self._head.truncate(0)
+        self._head.seek(0)
+
+    def flush(self) -> None:
+        self._head.flush()
+        for tier in self.rollups:
+            tier.flush()
+
+    def read_chunk(self, i: int) -> Tuple[List[int], List[float]]:
+        _, _, offset, length, count = self.index[i][:5]
+        with open(self.path / "chunks.dat", "rb") as f:
+            f.seek(offset)
+            return decode_chunk(f.read(length), count)
+
+    def overlapping(self, start: int, end: int) -> range:
+        return range(bisect_left(self.t_max, start), bisect_right(self.t_min, end))
+
+    def close(self) -> None:
+        for f in (self._chunks, self._index, self._head):
+            f.close()
+        for tier in self.rollups:
+            tier.close()
+
+
+class TimeSeriesStore:
+    """
+    Embedded time-series store for watchtower signals.
+
+    Each series (e.g. "checkout/drift") is an append-only file of
+    Gorilla-compressed chunks (delta-of-delta timestamps, XOR floats) plus
+    a fixed-width time index that also carries per-chunk count/sum/min/max/
+    first/last. Range queries decode only the chunks that overlap. Each
+    series also keeps epoch-aligned 5-minute and 1-hour rollups, so a
+    downsample at those steps (or multiples) reads pre-aggregates instead
+    of points. Points not yet sealed into a chunk live in a raw write-ahead
+    head file and are replayed on open.
+
+    Timestamps are epoch seconds (stored as integer milliseconds).
+    """
+
+    def __init__(self, root: str, chunk_points: int = 1024):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.chunk_points = chunk_points
+        self._series: Dict[str, _Series] = {}
+
+    @staticmethod
+    def _key(series: str) -> str:
+        return re.sub(r"[^A-Za-z0-9_.-]", "__", series)
+
+    def _get(self, series: str, create: bool = True) -> Optional[_Series]:
+        s = self._series.get(series)
+        if s is None:
+            path = self.root / self._key(series)
+            if not create and not path.exists():
+                return None
+            s = self._series[series] = _Series(path, self.chunk_points)
+        return s
+
+    def series(self) -> List[str]:
+        """Names of the series on disk (in their file-safe form)."""
+        return sorted(p.name for p in self.root.iterdir() if (p / "index.dat").exists())
+
+    def append(self, series: str, ts: float, value: float) -> None:
+        self._get(series).append(int(round(ts * 1000)), float(value))
+
+    def append_many(self, series: str, points: Iterable[Tuple[float, float]]) -> None:
+        s = self._get(series)
+        for ts, value in points:
+            s.append(int(round(ts * 1000)), float(value))
+
+    def range(self, series: str, start: float, end: float) -> List[Tuple[float, float]]:
+        """All points with start <= ts <= end, in time order."""
+        s = self._get(series, create=False)
+        if s is None:
+            return []
+        lo, hi = int(start * 1000), int(end * 1000)
+        out: List[Tuple[float, float]] = []
+        for i in s.overlapping(lo, hi):
+            ts, vals = s.read_chunk(i)
+            a, b = bisect_left(ts, lo), bisect_right(ts, hi)
+            out.extend((t / 1000, v) for t, v in zip(ts[a:b], vals[a:b]))
+        a, b = bisect_left(s.head_ts, lo), bisect_right(s.head_ts, hi)
+        out.extend((t / 1000, v) for t, v in zip(s.head_ts[a:b], s.head_vals[a:b]))
+        return out
+
+    def downsample(self, series: str, start: float, end: float, step: float, agg: str = "mean") -> List[Tuple[float, float]]:
+        """
+        One aggregate per `step`-second bucket aligned to the epoch
+        (mean/min/max/sum/count/first/last); empty buckets are omitted.
+
+        Steps that are a multiple of a rollup tier are answered from the
+        tier's rows, decoding raw chunks only at the range edges and for the
+        still-open rollup bucket.
+        """
+        if agg not in AGGREGATES:
+            raise ValueError(f"agg must be one of {AGGREGATES}")
+        s = self._get(series, create=False)
+        if s is None:
+            return []
+        lo, hi, width = int(start * 1000), int(end * 1000), int(step * 1000)
+        if width <= 0:
+            raise ValueError("step must be positive")
+        buckets: Dict[int, List[float]] = {}   # bucket start -> [count, sum, min, max, first, last]
+
+        def merge(b: int, count: int, total: float, vmin: float, vmax: float, first: float, last: float) -> None:
+            acc = buckets.get(b)
+            if acc is None:
+                buckets[b] = [count, total, vmin, vmax, first, last]
+            else:
+                acc[0] += count
+                acc[1] += total
+                if vmin < acc[2]:
+                    acc[2] = vmin
+                if vmax > acc[3]:
+                    acc[3] = vmax
+                acc[5] = last
+
+        def add_raw(ts: Sequence[int], vals: Sequence[float], a: int, b: int) -> None:
+            a, b = bisect_left(ts, a), bisect_right(ts, b)
+            for t, v in zip(ts[a:b], vals[a:b]):
+                merge(t - t % width, 1, v, v, v, v, v)
+
+        def scan(a: int, b: int) -> None:
+            for i in s.overlapping(a, b):
+                t0, t1, _, _, count, total, vmin, vmax, first, last = s.index[i]
+                if t0 >= a and t1 <= b and t0 - t0 % width == t1 - t1 % width:
+                    merge(t0 - t0 % width, count, total, vmin, vmax, first, last)
+                else:
+                    ts, vals = s.read_chunk(i)
+                    add_raw(ts, vals, a, b)
+            add_raw(s.head_ts, s.head_vals, a, b)
+
+        tier = next((r for r in reversed(sorted(s.rollups, key=lambda r: r.res_ms))
+                     if width % r.res_ms == 0), None)
+        inner_lo = inner_hi = None
+        if tier is not None:
+            res = tier.res_ms
+            inner_lo = -(-lo // res) * res
+            inner_hi = (hi + 1) // res * res        # exclusive
+            if tier.open_start is not None:
+                inner_hi = min(inner_hi, tier.open_start)
+        if inner_lo is None or inner_lo >= inner_hi:
+            scan(lo, hi)
+        else:
+            if lo < inner_lo:
+                scan(lo, inner_lo - 1)
+            tier.load()
+            rows = tier.rows
+            for k in range(bisect_left(tier.starts, inner_lo), bisect_left(tier.starts, inner_hi)):
+                r0, count, total, vmin, vmax, first, last = rows[k]
+                merge(r0 - r0 % width, count, total, vmin, vmax, first, last)
+            if inner_hi <= hi:
+                scan(inner_hi, hi)
+
+        pick = {
+            "mean": lambda a: a[1] / a[0], "sum": lambda a: a[1], "count": lambda a: a[0],
+            "min": lambda a: a[2], "max": lambda a: a[3], "first": lambda a: a[4], "last": lambda a: a[5],
+        }[agg]
+        return [(b / 1000, pick(buckets[b])) for b in sorted(buckets)]
+
+    def stats(self, series: str) -> Dict[str, int]:
+        s = self._get(series, create=False)
+        if s is None:
+            return {"points": 0, "chunks": 0, "bytes": 0}
+        on_disk = sum(f.stat().st_size for f in s.path.iterdir() if f.is_file())
+        return {
+            "points": sum(e[4] for e in s.index) + len(s.head_ts),
+            "chunks": len(s.index),
+            "bytes": on_disk,
+        }
+
+    def flush(self) -> None:
+        for s in self._series.values():
+            s.flush()
+
+    def close(self) -> None:
+        """Flushes the head WALs; open chunks stay in the head until full."""
+        for s in self._series.values():
+            s.close()
+        self._series.clear()
+
+
+def ingest_evidence(store: TimeSeriesStore, root: str, target: str = "watchtower") -> Dict[str, int]:
+    """
+    Backfills <target>/drift, /queue and /latency from archived
+    cycle_summary.json files. Points at or before a series' last stored
+    timestamp are skipped, so re-running it is cheap and idempotent.
+    """
+    from .replay import session_dirs
+
+    points = []
+    for session in session_dirs(root):
+        for path in session.glob("cycle_*/cycle_summary.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    summary = json.load(f)
+                ts = datetime.datetime.fromisoformat(summary["timestamp"]).timestamp()
+                signals = summary["signals"]
+            except (OSError, ValueError, KeyError, TypeError):
+                continue   # ERROR/CRASH cycles carry no signals
+            latency = (summary.get("collection") or {}).get("latency_sec")
+            points.append((ts, signals.get("variance_detected"), signals.get("queue_depth"), latency))
+    points.sort(key=lambda p: p[0])
+
+    added = {}
+    for col, name in enumerate(("drift", "queue", "latency"), start=1):
+        series = f"{target}/{name}"
+        s = store._get(series)
+        last = s.last_ts
+        fresh = [(p[0], p[col]) for p in points
+                 if p[col] is not None and (last is None or int(round(p[0] * 1000)) > last)]
+        store.append_many(series, fresh)
+        added[series] = len(fresh)
+    store.flush()
+    return added
@@ -0,0 +1,54 @@
+import hashlib
+import json
+import os
+from statistics import mean, stdev
+
+from scripts.audit_signals import RunningStats, analyze_proposals
+
+
+def _write(vault, name, body):
+    path = vault / name
+    path.write_text(json.dumps(body))
+    return path
+
+
+def test_running_stats_match_statistics():
+    xs = [0.91, 0.42, 0.77, 0.1, 0.65]
+    stats = RunningStats()
+    for x in xs:
+        stats.push(x)
+    assert abs(stats.mean - mean(xs)) < 1e-12
+    assert abs(stats.stdev - stdev(xs)) < 1e-12
+
+
+def test_single_pass_audit_with_cache(tmp_path):
+    vault = tmp_path / "proposals"
+    vault.mkdir()
+    cache = tmp_path / "cache.json"
+    _write(vault, "a.json", {"simulated_pnl": 0.5, "execution_latency_ms": 40, "confidence_score": 0.9})
+    _write(vault, "b.json", {"simulated_pnl": -0.1, "execution_latency_ms": 80, "confidence_score": 0.5,
+                             "status": "failed"})
+    (vault / "c.json").write_text("{broken")
+
+    first = analyze_proposals(vault, cache)
+    assert first["files_read"] == 3
+    assert (first["total_signals"], first["profitable_signals"], first["failed_executions"]) == (3, 1, 1)
+    assert first["avg_latency_ms"] == 40.0  # the unreadable file counts as 0ms, as before
+    assert first["confidence_variance"] == round(stdev([0.9, 0.5]), 4)
+    assert first["top_performer"] == "a.json"
+
+    # Digests come from the file's bytes, not an exhausted handle
+    cached = json.load(open(cache))["files"]
+    assert cached["a.json"]["digest"] == hashlib.sha256((vault / "a.json").read_bytes()).hexdigest()[:16]
+    assert cached["a.json"]["digest"] != hashlib.sha256(b"").hexdigest()[:16]
+
+    again = analyze_proposals(vault, cache)
+    assert again["files_read"] == 0
+    assert again["integrity_hash"] == first["integrity_hash"]
+
+    path = _write(vault, "b.json", {"simulated_pnl": 2.0, "execution_latency_ms": 80})
+    os.utime(path, ns=(1, 1))
+    third = analyze_proposals(vault, cache)
+    assert third["files_read"] == 1
+    assert third["top_performer"] == "b.json"
+    assert third["integrity_hash"] != first["integrity_hash"]
@@ -0,0 +1,102 @@
+import numpy as np
+
+from modules.failure_miner import MutationFrame, mine
+
+
+def _history(n=4000, seed=7):
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(n):
+        aggression = float(rng.uniform(0.1, 0.9))
+        slippage = float(rng.uniform(0.001, 0.05))
+        # Aggressive clones on WETH lose far more often; slippage is noise
+        p_loss = 0.8 if (aggression > 0.7 and i % 2) else 0.2
+        loss = rng.random() < p_loss
+        records.append({
+            "id": f"CLONE-{i % 50}",
+            "generation": i // 50,
+            "event_type": "DIED" if loss and i % 5 == 0 else ("LOSS" if loss else "PROFIT"),
+            "pnl": -1.0 if loss else 0.5,
+            "traits": {"asset": "WETH" if i % 2 else "USDC", "aggression": aggression,
+                       "slippage": slippage, "gas_tolerance": 1.2},
+        })
+    return records
+
+
+def test_frame_is_columnar():
+    frame = MutationFrame.from_records([
+        {"id": "A", "pnl": 1.0, "event_type": "PROFIT", "traits": {"asset": "X", "aggression": 0.5}},
+        {"id": "B", "pnl": 0.0, "event_type": "DIED", "traits": {"asset": "Y"}},
+    ])
+    assert len(frame) == 2
+    assert frame.assets == ["X", "Y"]
+    assert frame.loss.tolist() == [False, True]
+    assert np.isnan(frame.traits["aggression"][1])
+
+
+def test_mine_ranks_the_failing_trait_bucket():
+    report = mine(MutationFrame.from_records(_history()))
+    corr = {c["trait"]: c for c in report["correlations"]}
+    assert corr["aggression"]["loss_corr"] > 0.2
+    assert abs(corr["slippage"]["loss_corr"]) < 0.1
+    assert "gas_tolerance" in corr  # constant trait: correlation only, no buckets
+
+    top = report["insights"][0]
+    assert top["scope"] == "WETH"
+    assert top["evidence"]["trait"] == "aggression"
+    assert top["evidence"]["lo"] >= 0.6
+    assert all(i["evidence"]["trait"] == "aggression" for i in report["insights"])
+
+
+def test_learner_adds_mined_rules_once(tmp_path):
+    import yaml
+    from modules.learner import Learner
+    from modules.scribe import Scribe
+    import asyncio
+
+    vault = tmp_path / "proposals"
+    async def record():
+        scribe = Scribe(str(vault))
+        for r in _history(2000):
+            await scribe.record_mutation(r["id"], r["generation"], r["traits"], r["pnl"], r["event_type"])
+        await scribe.aclose()
+    asyncio.run(record())
+
+    learner = Learner(expertise_path=str(tmp_path / "expertise.yaml"), vault_path=str(vault))
+    added = learner.mine_failure_patterns(top=3)
+    assert 0 < added <= 3
+    assert learner.mine_failure_patterns(top=3) == 0
+    with open(tmp_path / "expertise.yaml") as f:
+        rules = yaml.safe_load(f)["assets"]["WETH"]
+    assert any("aggression" in r["insight"] for r in rules)
+
+
+def test_remining_a_growing_history_updates_rules_in_place(tmp_path):
+    import yaml
+    from modules.learner import Learner
+    from modules.scribe import Scribe
+    import asyncio
+
+    vault = tmp_path / "proposals"
+    history = [dict(r, traits=dict(r["traits"], asset="WETH")) for r in _history(3000, seed=11)]
+
+    async def record(batch):
+        scribe = Scribe(str(vault))
+        for r in batch:
+            await scribe.record_mutation(r["id"], r["generation"], r["traits"], r["pnl"], r["event_type"])
+        await scribe.aclose()
+
+    learner = Learner(expertise_path=str(tmp_path / "expertise.yaml"), vault_path=str(vault))
+    asyncio.run(record(history[:2000]))
+    assert learner.mine_failure_patterns(top=5) > 0
+    for start in (2000, 2500):
+        asyncio.run(record(history[start:start + 500]))
+        assert learner.mine_failure_patterns(top=5) == 0
+
+    with open(tmp_path / "expertise.yaml") as f:
+        expertise = yaml.safe_load(f)
+    rules = expertise["global_rules"] + expertise["assets"].get("WETH", [])
+    keys = [r["pattern_key"] for r in rules]
+    assert len(keys) == len(set(keys))
+    assert not expertise["assets"].get("WETH")  # one asset: no per-asset copies of GLOBAL rules
+    assert all(r["evidence"]["n"] > 700 for r in rules)  # refreshed from the full 3000 records
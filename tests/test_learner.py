@@ -56,3 +56,46 @@ def test_learner_no_signal(temp_paths):
         
     result = learner.learn_from_mutation(str(success_file))
     assert result is False
+
+def test_learner_reads_scribe_log(temp_paths):
+    import asyncio
+    from modules.scribe import Scribe
+
+    exp_path, vault_path = temp_paths
+    async def record():
+        scribe = Scribe(str(vault_path))
+        await scribe.record_mutation("LOG-BOT", 2, {"asset": "LOGGED", "slippage": 0.2}, -0.5, "DIED")
+        await scribe.aclose()
+    asyncio.run(record())
+
+    learner = Learner(expertise_path=str(exp_path), vault_path=str(vault_path))
+    assert learner.scan_vault() == 1
+    with open(exp_path, 'r') as f:
+        assert "LOGGED" in yaml.safe_load(f)["assets"]
+
+def test_learner_scan_resumes_from_watermark(temp_paths):
+    import asyncio
+    from modules.scribe import Scribe
+
+    exp_path, vault_path = temp_paths
+    async def record(assets):
+        scribe = Scribe(str(vault_path))
+        for asset in assets:
+            await scribe.record_mutation("WM-BOT", 1, {"asset": asset, "slippage": 0.3}, -0.5, "LOSS")
+        await scribe.aclose()
+
+    asyncio.run(record(["A", "B", "A"]))
+    learner = Learner(expertise_path=str(exp_path), vault_path=str(vault_path), batch_size=2)
+    assert learner.scan_vault() == 2
+    assert learner.load_watermark()["log"] is not None
+
+    # Nothing new: no records re-read, no rewrite of the matrix
+    mtime = os.stat(exp_path).st_mtime_ns
+    assert Learner(expertise_path=str(exp_path), vault_path=str(vault_path)).scan_vault() == 0
+    assert os.stat(exp_path).st_mtime_ns == mtime
+
+    asyncio.run(record(["C"]))
+    assert Learner(expertise_path=str(exp_path), vault_path=str(vault_path)).scan_vault() == 1
+    with open(exp_path, 'r') as f:
+        assert sorted(yaml.safe_load(f)["assets"]) == ["A", "B", "C"]
+    assert Learner(expertise_path=str(exp_path), vault_path=str(vault_path)).scan_vault(full=True) == 0
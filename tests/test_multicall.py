@@ -0,0 +1,174 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from modules.multicall import (
+    AGGREGATE3, DECIMALS, GET_AMOUNTS_OUT_AERO, GET_AMOUNTS_OUT_V2, GET_POOL, MULTICALL3_ADDRESS,
+    SLOT0, TOKEN0, Call, Multicall3, MulticallError, PoolQuoter, decode_address, decode_uint,
+    encode_abi, keccak256, selector,
+)
+
+UNI, AERO_CL = "0x" + "f1" * 20, "0x" + "f2" * 20
+AERO_ROUTER, V2_ROUTER = "0x" + "a1" * 20, "0x" + "a2" * 20
+USDC, WETH = "0x" + "0c" * 20, "0x" + "0e" * 20
+TOKEN_A, TOKEN_B, TOKEN_C, TOKEN_D = ("0x" + f"{n:02x}" * 20 for n in (0x01, 0x02, 0x03, 0x04))
+POOL_LIVE, POOL_EMPTY = "0x" + "b1" * 20, "0x" + "b0" * 20
+
+
+class Revert(Exception):
+    pass
+
+
+def _decode_aggregate3_input(data):
+    """(target, allowFailure, callData) triples from aggregate3 calldata."""
+    body = data[4:]
+    base = decode_uint(body)
+    n = decode_uint(body, base // 32)
+    heads = base + 32
+    calls = []
+    for i in range(n):
+        elem = heads + int.from_bytes(body[heads + 32 * i:heads + 32 * i + 32], "big")
+        target = decode_address(body[elem:elem + 32])
+        at = elem + int.from_bytes(body[elem + 64:elem + 96], "big")
+        size = int.from_bytes(body[at:at + 32], "big")
+        calls.append((target, bool(body[elem + 63]), body[at + 32:at + 32 + size]))
+    return calls
+
+
+class FakeChain:
+    """
+    Stand-in for a Base node. TOKEN_A/USDC has a live pool on the second
+    factory in reversed token order behind an uninitialized one; TOKEN_B
+    only quotes on the Aerodrome router, TOKEN_C only on V2, and TOKEN_D's
+    decimals() reverts.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, to, data):
+        sel, args = data[:4], data[4:]
+        if to == MULTICALL3_ADDRESS.lower() and sel == selector(AGGREGATE3):
+            results = []
+            for target, _, calldata in _decode_aggregate3_input(data):
+                self.calls += 1
+                try:
+                    results.append((True, self.call(target, calldata)))
+                except Revert:
+                    results.append((False, b""))
+            return encode_abi([[("bool", "bytes")]], [results])
+        if sel == selector(DECIMALS):
+            if to == TOKEN_D:
+                raise Revert()
+            return encode_abi(["uint"], [6 if to == USDC else 18])
+        if sel == selector(GET_POOL):
+            key = (to, decode_address(args, 0), decode_address(args, 1), decode_uint(args, 2))
+            pools = {(AERO_CL, USDC, TOKEN_A, 500): POOL_EMPTY, (AERO_CL, USDC, TOKEN_A, 3000): POOL_LIVE}
+            return encode_abi(["address"], [pools.get(key, "0x" + "00" * 20)])
+        if sel == selector(SLOT0) and to in (POOL_LIVE, POOL_EMPTY):
+            # token1 (USDC) per token0 (TOKEN_A) = 2e-12 raw -> $2.00 after decimals
+            sqrt_price = int((2e-12) ** 0.5 * 2 ** 96) if to == POOL_LIVE else 0
+            return encode_abi(["uint", "int", "uint"], [sqrt_price, 0, 0])
+        if sel == selector(TOKEN0) and to in (POOL_LIVE, POOL_EMPTY):
+            return encode_abi(["address"], [TOKEN_A])
+        if to == AERO_ROUTER and sel == selector(GET_AMOUNTS_OUT_AERO):
+            if decode_address(args, 3) != TOKEN_B:
+                raise Revert()
+            return encode_abi([["uint"]], [[10 ** 18, 5 * 10 ** 15]])
+        if to == V2_ROUTER and sel == selector(GET_AMOUNTS_OUT_V2):
+            if decode_address(args, 3) != TOKEN_C:
+                raise Revert()
+            return encode_abi([["uint"]], [[10 ** 18, 25 * 10 ** 13]])
+        raise Revert()
+
+
+@pytest.fixture
+def rpc_url():
+    chain = FakeChain()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            req = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            params = req["params"][0]
+            try:
+                result = "0x" + chain.call(params["to"].lower(), bytes.fromhex(params["data"][2:])).hex()
+                reply = {"jsonrpc": "2.0", "id": req["id"], "result": result}
+            except Revert:
+                reply = {"jsonrpc": "2.0", "id": req["id"], "error": {"code": 3, "message": "execution reverted"}}
+            body = json.dumps(reply).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", chain
+    server.shutdown()
+    server.server_close()
+
+
+def _quoter(url, **kwargs):
+    return PoolQuoter(Multicall3(url, **kwargs), [("Uniswap V3", UNI), ("Aerodrome CL", AERO_CL)],
+                      aerodrome_router=AERO_ROUTER, aerodrome_factory=AERO_CL, v2_router=V2_ROUTER,
+                      stables=[USDC])
+
+
+def test_selectors_match_known_abi():
+    assert keccak256(b"").hex() == "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+    assert selector(DECIMALS).hex() == "313ce567"
+    assert selector(AGGREGATE3).hex() == "82ad56cb"
+    assert selector(GET_POOL).hex() == "1698ee82"
+    assert selector(GET_AMOUNTS_OUT_V2).hex() == "d06ca61f"
+    hits = selector.cache_info().hits
+    selector(DECIMALS)
+    assert selector.cache_info().hits == hits + 1
+
+
+def test_quote_prices_every_pair_in_two_round_trips(rpc_url):
+    url, chain = rpc_url
+    quoter = _quoter(url)
+    decimals = {USDC: 6, WETH: 18}
+    pairs = [(TOKEN_A, USDC), (TOKEN_B, WETH), (TOKEN_C, WETH), (TOKEN_D, USDC)]
+
+    a, b, c, d = quoter.quote(pairs, decimals)
+
+    assert quoter.multicall.round_trips == 2
+    assert chain.calls > 4 * 2 * 2 * 3  # every getPool plus pool and router reads
+    assert (a["venue"], a["pool"], a["fee"]) == ("Aerodrome CL", POOL_LIVE, 3000)
+    assert a["price"] == pytest.approx(2.0, rel=1e-6)
+    assert (b["venue"], b["price"]) == ("Aerodrome", pytest.approx(0.005))
+    assert (c["venue"], c["price"]) == ("Uniswap V2", pytest.approx(0.00025))
+    assert d["price"] is None
+    assert decimals[TOKEN_A] == 18 and TOKEN_D not in decimals
+
+
+def test_known_decimals_skip_the_lookup_and_batches_split(rpc_url):
+    url, _ = rpc_url
+    quoter = _quoter(url, batch_size=7)
+    (a,) = quoter.quote([(TOKEN_A, USDC)], {TOKEN_A: 18, USDC: 6})
+    assert a["price"] == pytest.approx(2.0, rel=1e-6)
+    assert quoter.multicall.round_trips == 3  # 14 calls in round 1, 4 in round 2
+
+
+def test_find_active_pool_skips_uninitialized_pools(rpc_url):
+    url, _ = rpc_url
+    quoter = _quoter(url)
+    assert quoter.find_active_pool(USDC, TOKEN_A, AERO_CL) == (POOL_LIVE, 3000)
+    assert quoter.find_active_pool(TOKEN_A, USDC, AERO_CL) == (None, None)
+    assert quoter.multicall.round_trips == 3  # no pool state to read the second time
+
+
+def test_rpc_error_raises_multicall_error(rpc_url):
+    url, _ = rpc_url
+    multicall = Multicall3(url, address="0x" + "dd" * 20)  # no Multicall3 deployed here
+    assert multicall.aggregate3([]) == [] and multicall.round_trips == 0
+    with pytest.raises(MulticallError):
+        multicall.aggregate3([Call(USDC, selector(DECIMALS))])
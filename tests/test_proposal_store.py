@@ -0,0 +1,100 @@
+import json
+import os
+
+import ratify_proposal
+from modules.proposal_store import STORE_NAME, ProposalStore
+from modules.vault_writer import VaultWriter
+
+
+def _proposal(pid, status="PROPOSED", **extra):
+    return {"id": pid, "type": "PARAMETER_TUNE", "status": status, "urgency": "HIGH",
+            "author": "TEST", "timestamp": f"2026-01-01T00:00:{pid[-2:]}", **extra}
+
+
+def test_writer_maintains_the_index(tmp_path):
+    vault = str(tmp_path)
+    writer = VaultWriter(vault)
+    writer.write("prop-01.json", _proposal("prop-01"))
+    writer.write("prop-02.json", _proposal("prop-02", status="RATIFIED"))
+    writer.write("mutation_x_1.json", {"id": "CLONE", "pnl": -1, "event_type": "DIED"})
+    writer.close()
+
+    store = ProposalStore(vault)
+    assert [r["id"] for r in store.query(status="PROPOSED")] == ["prop-01"]
+    assert store.count() == 2  # mutation events are not proposals
+    assert store.load(status="PROPOSED")[0]["_filepath"] == os.path.join(vault, "prop-01.json")
+
+
+def test_backfill_indexes_legacy_vault_and_tracks_changes(tmp_path):
+    vault = tmp_path
+    for i in range(3):
+        (vault / f"prop-1{i}.json").write_text(json.dumps(_proposal(f"prop-1{i}")))
+    (vault / "ext-1.json").write_text(json.dumps(_proposal("ext-01", status="EXTRACTED")))
+
+    store = ProposalStore(str(vault))  # first open backfills
+    assert store.count("PROPOSED") == 3
+    assert [r["id"] for r in store.query(prefix="prop-", exclude_status="PROPOSED")] == []
+
+    os.remove(vault / "prop-10.json")
+    (vault / "prop-11.json").write_text(json.dumps(_proposal("prop-11", status="VETOED")))
+    os.utime(vault / "prop-11.json", ns=(1, 1))
+    assert store.backfill() == 1
+    assert store.count("PROPOSED") == 1
+    assert store.count("VETOED") == 1
+    assert store.backfill() == 0
+
+
+def test_ratification_reads_only_pending(tmp_path, monkeypatch):
+    vault = tmp_path
+    (vault / "prop-21.json").write_text(json.dumps(_proposal("prop-21", risk_level="PARAMETER_TUNE")))
+    (vault / "prop-22.json").write_text(json.dumps(_proposal("prop-22", status="RATIFIED")))
+    monkeypatch.setattr(ratify_proposal, "EVIDENCE_VAULT", str(vault))
+    monkeypatch.setattr(ratify_proposal, "_STORE", None)
+    monkeypatch.setattr(ratify_proposal, "apply_mutation", lambda p: True)
+    monkeypatch.setattr(ratify_proposal.time, "sleep", lambda s: None)
+
+    pending = ratify_proposal.load_proposals(status="PROPOSED")
+    assert [p["id"] for p in pending] == ["prop-21"]
+    assert (vault / STORE_NAME).exists()
+
+    ratify_proposal.ratify_proposals_batch(auto_mode=True, regency_mode=True)
+    assert ratify_proposal.load_proposals(status="PROPOSED") == []
+    with open(vault / "prop-21.json") as f:
+        assert json.load(f)["status"] == "RATIFIED (REGENCY)"
+    assert ratify_proposal.proposal_store().count("RATIFIED (REGENCY)") == 1
+
+
+def test_console_lists_status_less_proposals_and_never_creates_the_vault(tmp_path, monkeypatch):
+    import review_console
+
+    missing = tmp_path / "proposals"
+    monkeypatch.setattr(review_console, "EVIDENCE_VAULT", str(missing))
+    assert review_console.list_proposals() is None
+    assert not missing.exists()
+
+    missing.mkdir()
+    legacy = _proposal("prop-31")
+    del legacy["status"]
+    (missing / "prop-31.json").write_text(json.dumps(legacy))
+    (missing / "mutation_x_1.json").write_text(json.dumps({"id": "CLONE", "event_type": "DIED"}))
+    rows = review_console.list_proposals(status="PROPOSED")
+    assert [(r["id"], r["status"]) for r in rows] == [("prop-31", "PROPOSED")]
+
+
+def test_rotated_proposals_keep_their_rows(tmp_path):
+    from scripts.rotate_evidence import rotate
+
+    vault = str(tmp_path)
+    writer = VaultWriter(vault)
+    writer.write("prop-41.json", _proposal("prop-41"))
+    writer.write("prop-42.json", _proposal("prop-42", status="RATIFIED"))
+    writer.close()
+    for name in ("prop-41.json", "prop-42.json"):
+        os.utime(os.path.join(vault, name), (1, 1))
+    assert rotate(vault, max_files=1000, retention_hours=24)["archived_count"] == 1
+    assert not os.path.exists(os.path.join(vault, "prop-42.json"))
+
+    with ProposalStore(vault) as store:
+        store.backfill()
+        assert [p["id"] for p in store.load(status="RATIFIED")] == ["prop-42"]
+        assert store.count() == 2
@@ -0,0 +1,106 @@
+import json
+import os
+import time
+
+import verify_vault_integrity as vvi
+from modules.vault_archive import ARCHIVE_DIR, VaultArchive
+from modules.vault_manifest import GENESIS, VaultManifest
+from modules.vault_merkle import MerkleCheckpointer
+from modules.vault_writer import VaultWriter
+from scripts.rotate_evidence import rotate
+from tests.test_verify_vault import _seal_chain
+
+
+def _age(vault, names, hours):
+    then = time.time() - hours * 3600
+    for name in names:
+        os.utime(os.path.join(vault, name), (then, then))
+
+
+def test_rotation_archives_instead_of_deleting(tmp_path):
+    vault = str(tmp_path)
+    _seal_chain(vault, 0, 30, GENESIS)
+    old = [f"ext-{i:04d}.json" for i in range(20)]
+    _age(vault, old, 48)
+    with open(os.path.join(vault, "prop-pending.json"), "w") as f:
+        json.dump({"id": "prop-pending", "status": "PROPOSED"}, f)
+    _age(vault, ["prop-pending.json"], 48)
+
+    res = rotate(vault, max_files=1000, retention_hours=24)
+    assert res["status"] == "archived" and res["archived_count"] == 20
+    assert res["pending_kept_hot"] == 1 and os.path.exists(os.path.join(vault, "prop-pending.json"))
+    assert not any(os.path.exists(os.path.join(vault, n)) for n in old)
+    assert res["bytes_out"] < res["bytes_in"]
+    assert rotate(vault, max_files=1000, retention_hours=24)["status"] == "optimal"
+
+    # Lineage and Merkle proofs stay verifiable across both tiers
+    full = vvi.verify_vault(vault, full=True)
+    assert (full["status"], full["verified"]) == ("ok", 30)
+    merkle = MerkleCheckpointer(vault, batch_size=8, root_key=vvi.ROOT_KEY)
+    merkle.update(seal_partial=True)
+    assert merkle.audit(3)["status"] == "ok"
+    os.remove(os.path.join(vault, VaultManifest(vault).path))
+    assert len(VaultManifest(vault).rebuild()) == 30
+
+
+def test_count_cap_and_tampered_segment(tmp_path):
+    vault = str(tmp_path)
+    _seal_chain(vault, 0, 12, GENESIS)
+    for i in range(12):
+        _age(vault, [f"ext-{i:04d}.json"], 1 - i / 100)  # oldest first, all inside retention
+
+    res = rotate(vault, max_files=5, retention_hours=24)
+    assert (res["archived_count"], res["retained_count"]) == (7, 5)
+    assert VaultArchive(vault).verify() == []
+
+    seg = os.path.join(vault, ARCHIVE_DIR, res["segments"][0])
+    with open(seg, "ab") as f:
+        f.write(b"\0")
+    full = vvi.verify_vault(vault, full=True)
+    assert full["status"] == "compromised"
+    assert res["segments"][0] in full["breaches"]
+
+
+def test_rotation_compacts_the_writer_journal(tmp_path):
+    vault = str(tmp_path)
+    writer = VaultWriter(vault, root_key=vvi.ROOT_KEY)
+    for i in range(40):
+        writer.write(f"ext-{i:04d}.json", {"id": i}, sealed=True)
+    writer.close()
+    journal = os.path.join(vault, ".journal", "vault.jsonl")
+    size = os.path.getsize(journal)
+    _age(vault, [f"ext-{i:04d}.json" for i in range(30)], 48)
+
+    res = rotate(vault, max_files=1000, retention_hours=24)
+    assert (res["archived_count"], res["journal_bytes_reclaimed"]) == (30, size)
+    assert os.path.getsize(journal) == 0
+    assert rotate(vault, max_files=1000, retention_hours=24)["journal_bytes_reclaimed"] == 0
+
+    writer = VaultWriter(vault, root_key=vvi.ROOT_KEY)
+    assert writer.write("ext-0040.json", {"id": 40}, sealed=True)["seq"] == 41
+    writer.close()
+    full = vvi.verify_vault(vault, full=True)
+    assert (full["status"], full["verified"]) == ("ok", 41)
+
+
+def test_checkpoint_skips_segments_already_verified(tmp_path):
+    vault = str(tmp_path)
+    _seal_chain(vault, 0, 10, GENESIS)
+    _age(vault, [f"ext-{i:04d}.json" for i in range(6)], 48)
+    first = rotate(vault, max_files=1000, retention_hours=24)["segments"][0]
+    assert vvi.verify_vault(vault)["status"] == "ok"
+    assert vvi.load_checkpoint(vault)["segment"] == 1
+
+    # Behind the checkpoint: only a full run re-hashes the segment.
+    with open(os.path.join(vault, ARCHIVE_DIR, first), "ab") as f:
+        f.write(b"\0")
+    assert vvi.verify_vault(vault)["status"] == "ok"
+
+    # A segment sealed after the checkpoint is checked even with no new records.
+    _age(vault, [f"ext-{i:04d}.json" for i in range(6, 9)], 48)
+    second = rotate(vault, max_files=1000, retention_hours=24)["segments"][0]
+    with open(os.path.join(vault, ARCHIVE_DIR, second), "ab") as f:
+        f.write(b"\0")
+    res = vvi.verify_vault(vault)
+    assert (res["verified"], res["breaches"]) == (0, [second])
+    assert {first, second} <= set(vvi.verify_vault(vault, full=True)["breaches"])
@@ -0,0 +1,71 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from modules.scribe import Scribe, iter_mutations, traits_digest
+
+
+def test_traits_digest_is_stable_across_processes():
+    traits = {"slippage": 0.1, "asset": "PEPE"}
+    other = subprocess.run(
+        [sys.executable, "-c", "from modules.scribe import traits_digest; print(traits_digest({'asset': 'PEPE', 'slippage': 0.1}))"],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.dirname(__file__)),
+    ).stdout.strip()
+    assert traits_digest(traits) == other
+
+
+def test_batches_rotate_and_reader_resumes(tmp_path):
+    async def run():
+        scribe = Scribe(str(tmp_path), batch_size=10, flush_interval_sec=60, max_segment_bytes=2000)
+        for i in range(25):
+            await scribe.record_mutation(f"C-{i}", 1, {"asset": "PEPE", "slippage": i}, -1.0, "DIED")
+        assert len(scribe._buffer) == 5
+        await scribe.aclose()
+        return scribe
+
+    scribe = asyncio.run(run())
+    segments = sorted(os.listdir(scribe.log_dir))
+    assert len(segments) > 1
+    assert not [f for f in os.listdir(tmp_path) if f.endswith(".json")]   # no per-event files
+
+    rows = list(scribe.read())
+    assert [r["id"] for _, r in rows] == [f"C-{i}" for i in range(25)]
+    resumed = list(iter_mutations(scribe.log_dir, since=rows[12][0]))
+    assert [r["id"] for _, r in resumed] == [f"C-{i}" for i in range(13, 25)]
+
+    with open(os.path.join(scribe.log_dir, segments[-1]), "a") as f:
+        f.write('{"id": "torn"')
+    assert [r["id"] for _, r in iter_mutations(scribe.log_dir, since=rows[-1][0])] == []
+
+
+def test_failed_append_keeps_the_batch(tmp_path, monkeypatch):
+    real = Scribe._append
+    calls = []
+
+    def flaky(path, data):
+        calls.append(len(data))
+        if len(calls) == 1:
+            real(path, data[:7])  # torn write, then the disk fills up
+            raise OSError(28, "No space left on device")
+        real(path, data)
+
+    monkeypatch.setattr("modules.scribe.aiofiles", None)
+    monkeypatch.setattr(Scribe, "_append", staticmethod(flaky))
+
+    async def run():
+        scribe = Scribe(str(tmp_path), batch_size=100, flush_interval_sec=60)
+        for i in range(3):
+            await scribe.record_mutation(f"C-{i}", 1, {"slippage": i}, -1.0, "DIED")
+        try:
+            await scribe.flush()
+        except OSError:
+            pass
+        await scribe.record_mutation("C-3", 1, {"slippage": 3}, -1.0, "DIED")
+        assert [r["id"] for r in scribe._buffer] == ["C-0", "C-1", "C-2", "C-3"]
+        assert await scribe.flush() == 4
+        return scribe
+
+    scribe = asyncio.run(run())
+    assert [r["id"] for _, r in scribe.read()] == ["C-0", "C-1", "C-2", "C-3"]
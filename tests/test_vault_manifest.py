@@ -0,0 +1,38 @@
+import json
+import os
+
+from modules.vault_manifest import GENESIS, VaultManifest
+
+
+def _seal(vault, name, parent, signature, ts):
+    with open(os.path.join(vault, name), "w") as f:
+        json.dump({"id": name, "timestamp": ts, "parent_hash": parent, "signature": signature}, f)
+
+
+def test_tip_tracks_appends_and_skips_torn_line(tmp_path):
+    manifest = VaultManifest(str(tmp_path))
+    assert manifest.tip() is None
+
+    manifest.append(str(tmp_path / "ext-2.json"), GENESIS, "sig-a")
+    manifest.append("ext-1.json", "sig-a", "sig-b")
+    assert manifest.tip()["signature"] == "sig-b" and manifest.tip()["seq"] == 2
+
+    with open(manifest.path, "ab") as f:
+        f.write(b'{"seq": 3, "file": "ext-3.js')          # crash mid-append
+    assert manifest.tip()["signature"] == "sig-b"
+    manifest.append("ext-3.json", "sig-b", "sig-c")
+    assert manifest.tip()["seq"] == 3
+    assert [e["file"] for e in manifest.entries()] == ["ext-2.json", "ext-1.json", "ext-3.json"]
+
+
+def test_rebuild_orders_by_lineage_not_filename(tmp_path):
+    vault = str(tmp_path)
+    _seal(vault, "ext-9.json", GENESIS, "s1", "2026-01-01T00:00:00")
+    _seal(vault, "ext-1.json", "s1", "s2", "2026-01-01T00:00:01")
+    with open(os.path.join(vault, "mutation_X_1.json"), "w") as f:
+        json.dump({"id": "X", "event_type": "DIED"}, f)            # unsigned, not in the chain
+
+    manifest = VaultManifest(vault)
+    chain = manifest.rebuild()
+    assert [e["file"] for e in chain] == ["ext-9.json", "ext-1.json"]
+    assert manifest.tip()["signature"] == "s2"
@@ -0,0 +1,70 @@
+import json
+import multiprocessing
+import os
+
+from modules.vault_manifest import GENESIS
+from modules.vault_merkle import MerkleCheckpointer, build_tree, leaf_hash, verify_proof
+from test_verify_vault import _seal_chain
+
+
+def test_every_leaf_proves_against_root():
+    for n in (1, 2, 5, 8, 13):
+        leaves = [leaf_hash({"i": i}) for i in range(n)]
+        root, proofs = build_tree(leaves)
+        assert all(verify_proof(leaf, proof, root) for leaf, proof in zip(leaves, proofs))
+        assert not verify_proof(leaf_hash({"i": -1}), proofs[0], root)
+
+
+def test_batches_seal_and_audit_detects_tampering(tmp_path):
+    vault = str(tmp_path)
+    tip = _seal_chain(vault, 0, 10, GENESIS)
+    merkle = MerkleCheckpointer(vault, batch_size=4, root_key=b"k")
+    sealed = merkle.update()
+    assert [(r["first_seq"], r["last_seq"]) for r in sealed] == [(1, 4), (5, 8)]
+    assert sealed[1]["prev_root"] == sealed[0]["root"]
+    assert merkle.audit(9)["status"] == "unsealed"
+
+    _seal_chain(vault, 10, 3, tip)
+    assert [(r["first_seq"], r["last_seq"]) for r in merkle.update()] == [(9, 12)]
+    assert [(r["first_seq"], r["last_seq"]) for r in merkle.update(seal_partial=True)] == [(13, 13)]
+    assert all(r["status"] == "ok" for r in merkle.audit_range(1, 13))
+
+    proof = merkle.prove(6)
+    path = os.path.join(vault, proof["file"])
+    record = json.load(open(path))
+    assert verify_proof(leaf_hash(record), proof["proof"], proof["root"]["root"])
+    record["content"]["pnl_est"] = 1e6
+    json.dump(record, open(path, "w"))
+    assert merkle.audit(6)["status"] == "compromised"
+    assert merkle.audit(5)["status"] == "ok"
+    assert MerkleCheckpointer(vault, batch_size=4, root_key=b"other").audit(5)["root_sealed"] is False
+
+
+def _produce(vault, worker, count, start):
+    from modules.vault_writer import VaultWriter
+    start.wait()
+    writer = VaultWriter(vault)
+    merkle = MerkleCheckpointer(vault, batch_size=4, root_key=b"k")
+    for i in range(count):
+        writer.write(f"ext-{worker}-{i:03d}.json", {"id": f"ext-{worker}-{i}", "status": "EXTRACTED"}, sealed=True)
+        merkle.update()
+    writer.close()
+
+
+def test_concurrent_producers_seal_each_batch_once(tmp_path):
+    vault = str(tmp_path)
+    ctx = multiprocessing.get_context("fork")
+    start = ctx.Event()
+    procs = [ctx.Process(target=_produce, args=(vault, w, 20, start)) for w in range(3)]
+    for p in procs:
+        p.start()
+    start.set()
+    for p in procs:
+        p.join()
+    assert [p.exitcode for p in procs] == [0, 0, 0]
+
+    roots = MerkleCheckpointer(vault, batch_size=4, root_key=b"k").roots()
+    assert [r["batch"] for r in roots] == list(range(1, 16))
+    assert [r["first_seq"] for r in roots] == [4 * i + 1 for i in range(15)]
+    assert all(r["last_seq"] + 1 == n["first_seq"] for r, n in zip(roots, roots[1:]))
+    assert all(r["root"] == n["prev_root"] for r, n in zip(roots, roots[1:]))
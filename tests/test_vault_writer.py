@@ -0,0 +1,106 @@
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+import verify_vault_integrity as vvi
+from modules.vault_manifest import VaultManifest
+from modules.vault_writer import VaultWriter
+
+
+def _produce(vault, tag, n):
+    writer = VaultWriter(vault, root_key=vvi.ROOT_KEY)
+    futures = [
+        writer.submit(f"ext-{tag}-{i}.json", {"id": f"{tag}-{i}", "content": {"i": i}}, sealed=True,
+                      extras={"justification": "test", "coherence_score": 1.0})
+        for i in range(n)
+    ]
+    futures += [writer.submit(f"mutation_{tag}_{i}.json", {"id": tag, "pnl": i}) for i in range(n)]
+    for f in futures:
+        f.result()
+    writer.close()
+
+
+def test_concurrent_producers_keep_one_linear_chain(tmp_path):
+    vault = str(tmp_path)
+    writer = VaultWriter(vault, root_key=vvi.ROOT_KEY)
+    threads = [
+        threading.Thread(target=lambda t=t: [writer.write(f"ext-{t}-{i}.json", {"id": i}, sealed=True)
+                                             for i in range(25)])
+        for t in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.close()
+
+    assert writer.batches < 200
+    seqs = [e["seq"] for e in writer.iter_journal()]
+    assert seqs == list(range(1, 201))
+    res = vvi.verify_vault(vault, full=True)
+    assert (res["status"], res["records"]) == ("ok", 200)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_writers_in_several_processes_share_the_chain(tmp_path):
+    vault = str(tmp_path)
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_produce, args=(vault, t, 30)) for t in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+
+    assert [e["seq"] for e in VaultManifest(vault).entries()] == list(range(1, 91))
+    assert vvi.verify_vault(vault, full=True)["status"] == "ok"
+    assert len([f for f in os.listdir(vault) if f.startswith("mutation_")]) == 90
+
+
+def test_journaled_but_unapplied_batch_is_replayed(tmp_path):
+    vault = str(tmp_path)
+    writer = VaultWriter(vault, root_key=vvi.ROOT_KEY)
+    writer.write("ext-a.json", {"id": "a"}, sealed=True)
+    writer.close()
+
+    # Simulate a crash after the journal fsync: entry durable, file and manifest line missing.
+    journal = os.path.join(vault, ".journal", "vault.jsonl")
+    entry = json.loads(open(journal).readline())
+    entry.update(seq=2, file="ext-b.json", chain_seq=2)
+    entry["record"] = dict(entry["record"], id="b")
+    with open(journal, "a") as f:
+        f.write(json.dumps(entry, sort_keys=True) + "\n")
+        f.write('{"seq": 3, "fi')                                  # torn, never acknowledged
+
+    writer = VaultWriter(vault, root_key=vvi.ROOT_KEY)
+    assert writer.write("note.json", {"id": "c"})["seq"] == 3
+    writer.close()
+    assert os.path.exists(os.path.join(vault, "ext-b.json"))
+    assert [e["file"] for e in VaultManifest(vault).entries()] == ["ext-a.json", "ext-b.json"]
+
+
+def test_journal_is_truncated_once_applied(tmp_path):
+    vault = str(tmp_path)
+    journal = os.path.join(vault, ".journal", "vault.jsonl")
+    writer = VaultWriter(vault, root_key=vvi.ROOT_KEY, journal_max_bytes=4096)
+    for i in range(60):
+        writer.write(f"ext-{i}.json", {"id": i, "content": "x" * 64}, sealed=True)
+    assert os.path.getsize(journal) < 4096
+    writer.close()
+
+    # A compaction that died between the truncate and applied.json still commits cleanly.
+    with open(os.path.join(vault, ".journal", "applied.json"), "w") as f:
+        json.dump({"seq": 60, "offset": 999999}, f)
+    writer = VaultWriter(vault, root_key=vvi.ROOT_KEY)
+    assert writer.write("ext-60.json", {"id": 60}, sealed=True)["seq"] == 61
+    assert writer.compact() > 0
+    assert os.path.getsize(journal) == 0
+    assert writer.write("ext-61.json", {"id": 61}, sealed=True)["seq"] == 62
+    writer.close()
+
+    assert [e["seq"] for e in writer.iter_journal()] == [62]
+    res = vvi.verify_vault(vault, full=True)
+    assert (res["status"], res["records"]) == ("ok", 62)
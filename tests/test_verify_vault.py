@@ -0,0 +1,57 @@
+import hashlib
+import hmac
+import json
+import os
+
+import verify_vault_integrity as vvi
+from modules.vault_manifest import GENESIS, VaultManifest
+
+
+def _seal_chain(vault, start, count, parent):
+    manifest = VaultManifest(vault)
+    for i in range(start, start + count):
+        body = {"id": f"ext-{i}", "status": "EXTRACTED", "content": {"pnl_est": i}, "parent_hash": parent}
+        signature = hmac.new(vvi.ROOT_KEY, json.dumps(body, sort_keys=True).encode(), hashlib.sha256).hexdigest()
+        body.update(signature=signature, justification="test", coherence_score=1.0)
+        name = f"ext-{i:04d}.json"
+        with open(os.path.join(vault, name), "w") as f:
+            json.dump(body, f, indent=2)
+        manifest.append(name, parent, signature)
+        parent = signature
+    return parent
+
+
+def test_checkpoint_limits_work_to_new_records(tmp_path):
+    vault = str(tmp_path)
+    tip = _seal_chain(vault, 0, 5, GENESIS)
+    first = vvi.verify_vault(vault)
+    assert first["status"] == "ok" and first["verified"] == 5
+
+    _seal_chain(vault, 5, 2, tip)
+    second = vvi.verify_vault(vault)
+    assert (second["status"], second["from_seq"], second["verified"]) == ("ok", 5, 2)
+    assert vvi.verify_vault(vault)["verified"] == 0
+
+    # Tampering behind the checkpoint needs a full run to surface.
+    path = os.path.join(vault, "ext-0001.json")
+    record = json.load(open(path))
+    record["content"]["pnl_est"] = 1000
+    json.dump(record, open(path, "w"))
+    assert vvi.verify_vault(vault)["status"] == "ok"
+    full = vvi.verify_vault(vault, full=True)
+    assert full["status"] == "compromised" and full["breaches"][0] == "ext-0001.json"
+
+
+def test_forged_checkpoint_forces_full_run_and_pool_matches_serial(tmp_path, monkeypatch):
+    vault = str(tmp_path)
+    _seal_chain(vault, 0, 12, GENESIS)
+    vvi.verify_vault(vault)
+    cp_path = os.path.join(vault, vvi.CHECKPOINT_NAME)
+    cp = json.load(open(cp_path))
+    cp["seq"] = 3
+    json.dump(cp, open(cp_path, "w"))
+    assert vvi.load_checkpoint(vault) is None
+
+    monkeypatch.setattr(vvi, "PARALLEL_MIN_RECORDS", 1)
+    res = vvi.verify_vault(vault, workers=2)
+    assert (res["status"], res["from_seq"], res["verified"]) == ("ok", 0, 12)
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from src.tools.recommend_mitigation import recommend_mitigation
+from src.watchtower.blobs import BlobStore, pack_evidence, read_artifact
+from src.watchtower.evidence_index import EvidenceIndex
+
+
+def _analysis(drift, queue):
+    return {"status": "ok", "variance_detected": drift, "queue_depth": queue,
+            "features": {"p95_ms": [120.0] * 200, "error_rate": 0.002}}
+
+
+def test_identical_subdocuments_are_stored_once(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"))
+    # A sustained incident: plans differ only in their trigger timestamp
+    digests = {store.put_document(recommend_mitigation(_analysis(0.3, 90))) for _ in range(20)}
+    objects = store.stats()["objects"]
+    assert objects <= len(digests) + 2  # one hypotheses blob, one recommended_actions blob
+
+    plan = store.get_document(next(iter(digests)))
+    assert plan["recommended_actions"][0]["action"] == "Scale worker concurrency +20%"
+    assert store.put_document(plan) in digests
+    assert store.deduplicated >= 38
+
+
+def test_corrupt_blob_is_rejected(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"))
+    digest = store.put_bytes(b'{"a":1}')
+    other = store.put_bytes(b'{"a":2}')
+    store._path(digest).write_bytes(store._path(other).read_bytes())
+    with pytest.raises(ValueError):
+        store.get_bytes(digest)
+
+
+def test_pack_evidence_rewrites_summaries(tmp_path):
+    root = tmp_path / "evidence"
+    for cycle in (1, 2, 3):
+        cycle_dir = root / "watch_a" / f"cycle_{cycle}"
+        cycle_dir.mkdir(parents=True)
+        (cycle_dir / "analysis.json").write_text(json.dumps(_analysis(0.3, 90), indent=2))
+        (cycle_dir / "mitigation_plan.json").write_text(json.dumps(recommend_mitigation(_analysis(0.3, 90)), indent=2))
+        (cycle_dir / "cycle_summary.json").write_text(json.dumps({
+            "cycle": cycle, "timestamp": f"2026-01-01T10:00:0{cycle}", "decision": "MITIGATE",
+            "artifacts": {"analysis": "analysis.json", "mitigation": "mitigation_plan.json", "actuation": None},
+        }))
+
+    store = BlobStore(str(tmp_path / "blobs"))
+    res = pack_evidence(store, str(root))
+    assert (res["cycles"], res["artifacts"]) == (3, 6)
+    assert not (root / "watch_a" / "cycle_2" / "analysis.json").exists()
+    assert store.stats()["stored_bytes"] < res["bytes_before"] / 5
+    assert pack_evidence(store, str(root))["cycles"] == 0
+
+    cycle_dir = root / "watch_a" / "cycle_2"
+    summary = json.loads((cycle_dir / "cycle_summary.json").read_text())
+    assert summary["artifacts"]["analysis"].startswith("blob:")
+    assert read_artifact(cycle_dir, summary["artifacts"]["analysis"], store) == _analysis(0.3, 90)
+
+    index = EvidenceIndex(str(tmp_path / "index.sqlite"))
+    index.backfill(str(root))
+    assert index.query()[0]["analysis"] == summary["artifacts"]["analysis"]
+    index.close()
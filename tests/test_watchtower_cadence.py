@@ -0,0 +1,25 @@
+from src.watchtower.cadence import CadenceController
+
+
+def test_hot_signal_shortens_to_floor():
+    c = CadenceController(8, floor_sec=2, ceiling_sec=32)
+    changes = [c.update(0.14, 10, 0.15, 50) for _ in range(4)]
+    assert c.interval_sec == 2
+    assert changes[0] == {"from_sec": 8, "to_sec": 4, "reason": "HOT", "pressure": 0.9333}
+    assert changes[-1] is None  # already at the floor
+
+
+def test_rising_queue_shortens_interval():
+    c = CadenceController(8, floor_sec=1, ceiling_sec=32)
+    assert c.update(0.0, 20, 0.15, 50) is None
+    change = c.update(0.0, 30, 0.15, 50)
+    assert change["reason"] == "RISING"
+    assert c.interval_sec == 4
+
+
+def test_calm_period_backs_off_to_ceiling():
+    c = CadenceController(4, floor_sec=1, ceiling_sec=9, calm_cycles=2, backoff=1.5)
+    changes = [c.update(0.0, 0, 0.15, 50) for _ in range(10)]
+    assert c.interval_sec == 9
+    reasons = [ch["reason"] for ch in changes if ch]
+    assert reasons and set(reasons) == {"CALM"}
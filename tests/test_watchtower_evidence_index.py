@@ -0,0 +1,101 @@
+import json
+import os
+
+import pytest
+
+from src.watchtower.evidence_index import EvidenceIndex
+
+
+def _write_cycle(session_dir, cycle, decision, drift, queue, ts, status=None):
+    cycle_dir = session_dir / f"cycle_{cycle}"
+    cycle_dir.mkdir(parents=True, exist_ok=True)
+    summary = {
+        "cycle": cycle,
+        "timestamp": ts,
+        "decision": decision,
+        "signals": {"variance_detected": drift, "queue_depth": queue},
+        "thresholds": {"variance": 0.15, "queue": 50},
+        "collection": {"latency_sec": 0.01},
+        "artifacts": {"analysis": "analysis.json",
+                      "mitigation": "mitigation_plan.json" if decision == "MITIGATE" else None},
+    }
+    if status:
+        summary["status"] = status
+    (cycle_dir / "cycle_summary.json").write_text(json.dumps(summary))
+    return cycle_dir
+
+
+def test_backfill_is_incremental_and_queries_filter(tmp_path):
+    root = tmp_path / "evidence"
+    a, b = root / "watch_a", root / "watch_b"
+    _write_cycle(a, 1, "NOOP", 0.01, 3, "2026-01-01T10:00:00")
+    _write_cycle(a, 2, "MITIGATE", 0.01, 80, "2026-01-01T10:00:05")          # status derived
+    _write_cycle(a, 3, "SKIPPED_DEBOUNCE", 0.01, 90, "2026-01-01T10:00:10")
+    _write_cycle(b, 1, "MITIGATE", 0.4, 90, "2026-01-08T09:00:00", status="INTERDICT_DRIFT")
+
+    index = EvidenceIndex(str(tmp_path / "index.sqlite"))
+    assert index.backfill(str(root)) == {"scanned": 4, "indexed": 4, "total": 4}
+    assert index.backfill(str(root))["indexed"] == 0
+
+    changed = _write_cycle(a, 1, "MITIGATE", 0.3, 3, "2026-01-01T10:00:00")
+    st = os.stat(changed / "cycle_summary.json")
+    os.utime(changed / "cycle_summary.json", ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    assert index.backfill(str(root))["indexed"] == 1
+
+    rows = index.query(decision="MITIGATE", status="INTERDICT_QUEUE")
+    assert [(r["session"], r["cycle"]) for r in rows] == [("watch_a", 2)]
+    assert rows[0]["mitigation"].endswith("cycle_2/mitigation_plan.json")
+    assert [r["session"] for r in index.query(since="2026-01-05T00:00:00")] == ["watch_b"]
+    assert len(index.query(limit=2)) == 2
+
+    agg = {r["status"]: r["cycles"] for r in index.aggregate(by="status", decision="MITIGATE")}
+    assert agg == {"INTERDICT_DRIFT": 2, "INTERDICT_QUEUE": 1}
+    with pytest.raises(ValueError):
+        index.aggregate(by="drift")
+    index.close()
+
+
+def test_record_indexes_live_cycle(tmp_path):
+    cycle_dir = _write_cycle(tmp_path / "watch_live", 1, "NOOP", 0.0, 0, "2026-01-01T00:00:00")
+    summary = json.loads((cycle_dir / "cycle_summary.json").read_text())
+    index = EvidenceIndex(str(tmp_path / "index.sqlite"))
+    index.record("watch_live", cycle_dir, summary)
+    assert index.backfill(str(tmp_path))["indexed"] == 0       # already current
+    assert index.query(session="watch_live")[0]["status"] == "OK"
+    index.close()
+
+
+def test_backfill_indexes_each_target_of_a_sharded_run(tmp_path):
+    root = tmp_path / "evidence"
+    _write_cycle(root / "watch_a", 1, "NOOP", 0.01, 3, "2026-01-01T10:00:00")
+    _write_cycle(root / "shards_x" / "checkout", 1, "NOOP", 0.01, 3, "2026-01-01T10:00:00")
+    _write_cycle(root / "shards_x" / "checkout", 2, "MITIGATE", 0.4, 3, "2026-01-01T10:00:05")
+    _write_cycle(root / "shards_x" / "search", 1, "NOOP", 0.02, 1, "2026-01-01T10:00:00")
+
+    index = EvidenceIndex(str(tmp_path / "index.sqlite"))
+    assert index.backfill(str(root))["indexed"] == 4
+    assert index.backfill(str(root / "shards_x"))["indexed"] == 0
+    assert [r["cycle"] for r in index.query(session="shards_x/checkout")] == [1, 2]
+    index.close()
+
+
+def test_watch_cycle_survives_an_index_write_failure(tmp_path, monkeypatch):
+    import sqlite3
+    import src.tools.watch_variance as wv
+
+    def locked(self, session, cycle_dir, summary):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(EvidenceIndex, "record", locked)
+    monkeypatch.setattr("src.watchtower.cycle.collect_window",
+                        lambda adapter, duration_sec: ({"status": "ok", "variance_detected": 0.01, "queue_depth": 0}, 0.01))
+
+    wv.watch_variance(iterations=2, interval_sec=0.01, output_dir=str(tmp_path / "out"),
+                      evidence_index=str(tmp_path / "index.sqlite"), stage_timing=False)
+
+    decisions = [json.loads((tmp_path / "out" / f"cycle_{i}" / "cycle_summary.json").read_text())["decision"]
+                 for i in (1, 2)]
+    assert decisions == ["NOOP", "NOOP"]
+    events = [json.loads(line) for line in (tmp_path / "watchtower.log").read_text().splitlines()]
+    assert sum(e["msg"] == "index_record_failed" for e in events) == 2
@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+from src.watchtower.hot_config import ConfigWatcher, WatchConfig, parse_config
+
+
+def _bump_mtime(path, step):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + step))
+
+
+def test_watcher_swaps_in_new_version_only_on_change(tmp_path):
+    path = tmp_path / "watch.json"
+    path.write_text('{"variance_threshold": 0.1}')
+    base = WatchConfig(variance_threshold=0.15)
+    watcher = ConfigWatcher(str(path), base)
+
+    first = watcher.poll()
+    assert first.variance_threshold == 0.1 and first.queue_threshold == 50
+    assert watcher.poll() is None                      # unchanged stat
+
+    _bump_mtime(path, 10)
+    assert watcher.poll() is None                      # touched, same content
+
+    path.write_text('{"variance_threshold": 0.1, "telemetry_mode": "prometheus"}')
+    _bump_mtime(path, 20)
+    second = watcher.poll()
+    assert second.version != first.version
+    assert first.diff(second) == {"telemetry_mode": ("mock", "prometheus")}
+
+
+def test_watcher_rejects_invalid_config_and_keeps_current(tmp_path):
+    path = tmp_path / "watch.json"
+    path.write_text('{"cooldown_cycles": "three"}')
+    watcher = ConfigWatcher(str(path), WatchConfig(variance_threshold=0.15))
+
+    assert watcher.poll() is None
+    assert "cooldown_cycles" in watcher.last_error
+    assert watcher.current.cooldown_cycles == 3
+
+
+def test_parse_config_rejects_unknown_keys():
+    with pytest.raises(ValueError):
+        parse_config({"varience_threshold": 0.1}, WatchConfig(variance_threshold=0.15), "v")
+
+
+def test_parse_config_rejects_unknown_modes():
+    with pytest.raises(ValueError):
+        parse_config({"actuation_mode": "teleport"}, WatchConfig(variance_threshold=0.15), "v")
+
+
+def test_bad_reload_mid_run_keeps_running_version(tmp_path, monkeypatch):
+    import src.tools.watch_variance as wv
+
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "watch.json"
+    path.write_text('{"variance_threshold": 0.2}')
+    reloads = iter([
+        '{"variance_threshold": 0.3, "actuation_options": {"bogus": 1}}',  # adapter refuses options
+        '{"variance_threshold": 0.4, "actuation_mode": "teleport"}',       # unknown mode
+    ])
+
+    def collect(adapter, duration_sec):
+        text = next(reloads, None)
+        if text:
+            path.write_text(text)
+            _bump_mtime(path, 10 ** 9)
+        return {"status": "ok", "variance_detected": 0.01, "queue_depth": 0}, 0.01
+
+    monkeypatch.setattr("src.watchtower.cycle.collect_window", collect)
+    result = wv.watch_variance(iterations=3, interval_sec=0.01, config_path=str(path),
+                               output_dir=str(tmp_path / "out"), stage_timing=False)
+
+    assert result.startswith("Watchtower session complete")
+    summaries = [json.loads((tmp_path / "out" / f"cycle_{i}" / "cycle_summary.json").read_text())
+                 for i in (1, 2, 3)]
+    assert [s["decision"] for s in summaries] == ["NOOP"] * 3
+    assert len({s["config_version"] for s in summaries}) == 1
+    assert [s["thresholds"]["variance"] for s in summaries] == [0.2] * 3
+    events = [json.loads(line) for line in (tmp_path / "watchtower.log").read_text().splitlines()]
+    assert sum(e["msg"] == "config_rejected" for e in events) == 2
@@ -0,0 +1,50 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.watchtower.metrics import MetricsServer, WatchtowerMetrics
+
+
+def test_render_exposes_watchtower_series():
+    m = WatchtowerMetrics()
+    m.cycles.inc("MITIGATE")
+    m.debounce_suppressions.inc("INTERDICT_QUEUE")
+    m.drift.set(0.0712)
+    m.queue.set(64)
+    m.observe_stage("actuate", 2_000_000)
+    m.observe_stage("collect", 50_000)
+
+    text = m.registry.render()
+    assert 'watchtower_cycles_total{decision="MITIGATE"} 1' in text
+    assert 'watchtower_cycles_total{decision="CRASH"} 0' in text
+    assert 'watchtower_debounce_suppressions_total{status="INTERDICT_QUEUE"} 1' in text
+    assert "watchtower_drift 0.0712" in text
+    assert "watchtower_queue_depth 64" in text
+    assert 'watchtower_stage_duration_seconds_bucket{stage="actuate",le="+Inf"} 1' in text
+    assert 'watchtower_stage_duration_seconds_bucket{stage="collect",le="0.0001"} 1' in text
+    assert "watchtower_actuation_latency_seconds_count 1" in text
+
+
+def test_histogram_buckets_are_cumulative():
+    m = WatchtowerMetrics()
+    for ns in (50_000, 2_000_000, 20_000_000):
+        m.observe_stage("evaluate", ns)
+    lines = [l for l in m.registry.render().splitlines() if l.startswith("watchtower_stage_duration_seconds_bucket")]
+    counts = [int(l.rsplit(" ", 1)[1]) for l in lines]
+    assert counts == sorted(counts)
+    assert counts[-1] == 3
+
+
+def test_http_endpoint_serves_metrics():
+    m = WatchtowerMetrics()
+    m.cycles.inc("NOOP")
+    server = MetricsServer(m.registry, port=0).start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert 'watchtower_cycles_total{decision="NOOP"} 1' in resp.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{server.port}/other", timeout=5)
+    finally:
+        server.stop()
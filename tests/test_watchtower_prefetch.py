@@ -0,0 +1,61 @@
+import time
+
+from src.watchtower.prefetch import WindowPrefetcher, collect_window
+
+
+class _SlowAdapter:
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+
+    def get_window(self, duration_sec):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"status": "ok", "variance_detected": 0.0, "queue_depth": 0}
+
+
+class _BrokenAdapter:
+    def get_window(self, duration_sec):
+        raise RuntimeError("adapter down")
+
+
+def test_collect_window_folds_exceptions(capsys):
+    analysis, latency = collect_window(_BrokenAdapter(), 30)
+    assert analysis["status"] == "crash"
+    assert "adapter down" in analysis["message"]
+    assert analysis["error_type"] == "RuntimeError"
+    assert latency >= 0
+    assert capsys.readouterr().out == ""  # reported by the cycle through the watchtower log
+
+
+def test_moving_estimate_tracks_collection_duration():
+    p = WindowPrefetcher(margin_sec=0.1, smoothing=0.5)
+    assert p.lead_time() == 0.1
+    p.observe(1.0)
+    p.observe(0.0)
+    assert abs(p.estimate_sec - 0.5) < 1e-9
+    assert abs(p.lead_time() - 0.6) < 1e-9
+    p.close()
+
+
+def test_prefetched_window_is_ready_at_tick():
+    adapter = _SlowAdapter(delay=0.1)
+    p = WindowPrefetcher(margin_sec=0.05)
+    p.observe(0.1)
+    p.sleep_until_tick(0.3, 2, lambda: collect_window(adapter, 30))
+
+    t0 = time.monotonic()
+    analysis, latency = p.take(2)
+    assert time.monotonic() - t0 < 0.05
+    assert analysis["status"] == "ok"
+    assert latency >= 0.1
+    assert adapter.calls == 1
+    p.close()
+
+
+def test_take_ignores_other_cycles():
+    p = WindowPrefetcher(margin_sec=0.0)
+    assert p.take(1) is None
+    p.sleep_until_tick(0.0, 3, lambda: ({"status": "ok"}, 0.0))
+    assert p.take(2) is None
+    p.close()
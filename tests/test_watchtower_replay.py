@@ -0,0 +1,56 @@
+import json
+
+from src.watchtower.policy import DetectionPolicy
+from src.watchtower.replay import load_evidence, replay
+
+
+def _write_session(root, name, cycles):
+    for idx, (drift, queue, decision) in enumerate(cycles, start=1):
+        cycle_dir = root / name / f"cycle_{idx}"
+        cycle_dir.mkdir(parents=True)
+        summary = {"cycle": idx, "decision": decision}
+        if drift is not None:
+            summary["signals"] = {"variance_detected": drift, "queue_depth": queue}
+            summary["thresholds"] = {"variance": 0.15, "queue": 50}
+        (cycle_dir / "cycle_summary.json").write_text(json.dumps(summary))
+
+
+def test_policy_debounce_matches_watchtower_semantics():
+    policy = DetectionPolicy(0.15, 50, cooldown_cycles=2)
+    decisions = [policy.evaluate(c, 0.2, 0).decision for c in range(1, 6)]
+    assert decisions == ["MITIGATE", "SKIPPED_DEBOUNCE", "SKIPPED_DEBOUNCE", "MITIGATE", "SKIPPED_DEBOUNCE"]
+    assert policy.evaluate(6, 0.0, 80).decision == "MITIGATE"  # new status is not debounced
+
+
+def test_replay_reproduces_recorded_decisions(tmp_path):
+    _write_session(tmp_path, "watch_a", [
+        (0.01, 10, "NOOP"),
+        (0.20, 10, "MITIGATE"),
+        (0.21, 10, "SKIPPED_DEBOUNCE"),
+        (None, None, "ERROR"),
+        (0.01, 70, "MITIGATE"),
+    ])
+    _write_session(tmp_path, "watch_b", [(0.20, 10, "MITIGATE")])  # debounce resets per session
+
+    records = load_evidence(str(tmp_path))
+    report = replay(records)
+    assert report["sessions"] == 2
+    assert report["cycles"] == 6
+    assert report["diff_count"] == 0
+    assert report["replayed"]["ERROR"] == 1
+
+
+def test_replay_diffs_a_candidate_threshold(tmp_path):
+    _write_session(tmp_path, "watch_a", [(0.01, 10, "NOOP"), (0.12, 10, "NOOP")])
+
+    report = replay(load_evidence(str(tmp_path)), variance_threshold=0.10)
+    assert report["diff_count"] == 1
+    assert report["diffs"][0]["cycle"] == 2
+    assert report["diffs"][0]["replayed"] == "MITIGATE"
+
+
+def test_replay_halts_session_on_mercy_lock(tmp_path):
+    _write_session(tmp_path, "watch_a", [(0.9, 0, "MITIGATE"), (0.01, 0, "NOOP")])
+
+    report = replay(load_evidence(str(tmp_path)))
+    assert [d["replayed"] for d in report["diffs"]] == ["HALT", "HALTED"]
@@ -0,0 +1,69 @@
+import json
+
+from src.watchtower.policy import CusumPolicy, DetectionPolicy
+from src.watchtower.shadow import ShadowPolicies, load_shadow_config
+
+
+def test_shadow_policies_log_would_be_decisions(tmp_path):
+    active = DetectionPolicy(0.15, 50, cooldown_cycles=3)
+    log_path = tmp_path / "shadow_decisions.jsonl"
+    shadow = ShadowPolicies(
+        [{"name": "tight", "variance_threshold": 0.08}, {"name": "deep_queue", "queue_threshold": 80}],
+        active,
+        str(log_path),
+    )
+    for cycle, (drift, queue) in enumerate([(0.1, 10), (0.1, 60), (0.01, 10)], start=1):
+        decision = active.evaluate(cycle, drift, queue).decision
+        shadow.evaluate(cycle, drift, queue, decision)
+    shadow.close()
+
+    lines = [json.loads(l) for l in log_path.read_text().splitlines()]
+    assert lines[0]["policies"][1]["variance_threshold"] == 0.15  # inherited from active
+    assert [l["a"] for l in lines[1:]] == ["N", "M", "N"]
+    assert [l["s"]["tight"] for l in lines[1:]] == ["M", "S", "N"]
+    assert [l["s"]["deep_queue"] for l in lines[1:]] == ["N", "N", "N"]
+    assert shadow.summary()["tight"]["disagreements"] == 2
+
+
+def test_cusum_fires_on_sustained_shift_not_spike():
+    spike = CusumPolicy(k=0.02, h=0.1)
+    assert [spike.evaluate(c, d, 0).decision for c, d in enumerate([0.0, 0.11, 0.0, 0.0], 1)] == ["NOOP"] * 4
+
+    shift = CusumPolicy(k=0.02, h=0.1)
+    decisions = [shift.evaluate(c, 0.06, 0).decision for c in range(1, 5)]
+    assert decisions == ["NOOP", "NOOP", "MITIGATE", "NOOP"]
+
+
+def test_load_shadow_config_from_file(tmp_path):
+    path = tmp_path / "shadow.json"
+    path.write_text('[{"name": "cp", "type": "cusum"}]')
+    assert load_shadow_config(str(path)) == [{"name": "cp", "type": "cusum"}]
+    assert load_shadow_config('[{"name": "a"}]') == [{"name": "a"}]
+
+
+def test_shadow_policies_follow_reloaded_inherited_thresholds(tmp_path, monkeypatch):
+    import os
+    import src.tools.watch_variance as wv
+
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "watch.json"
+    path.write_text('{"variance_threshold": 0.05}')
+    reloads = iter(['{"variance_threshold": 0.3}'])
+
+    def collect(adapter, duration_sec):
+        text = next(reloads, None)
+        if text:
+            path.write_text(text)
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        return {"status": "ok", "variance_detected": 0.1, "queue_depth": 0}, 0.01
+
+    monkeypatch.setattr("src.watchtower.cycle.collect_window", collect)
+    wv.watch_variance(iterations=3, interval_sec=0.01, config_path=str(path), output_dir=str(tmp_path / "out"),
+                      shadow_policies=[{"name": "deep_queue", "queue_threshold": 80}], stage_timing=False)
+
+    lines = [json.loads(l) for l in (tmp_path / "out" / "shadow_decisions.jsonl").read_text().splitlines()]
+    cycles = [l for l in lines if "c" in l]
+    assert [l["a"] for l in cycles] == ["M", "N", "N"]
+    assert [l["s"]["deep_queue"] for l in cycles] == ["M", "N", "N"]
+    assert [l["policies"][0]["variance_threshold"] for l in lines if "policies" in l] == [0.05, 0.3]
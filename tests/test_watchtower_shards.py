@@ -0,0 +1,166 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.watchtower import shards
+from src.watchtower.shards import ShardLease, ShardSupervisor, shard_of
+
+
+def _record_cycle(target, cycle_idx, policy, ctx):
+    out = Path(ctx["evidence_dir"]) / f"{target}.jsonl"
+    with open(out, "a") as f:
+        f.write(json.dumps({"cycle": cycle_idx, "worker": ctx["worker"], "shard": ctx["shard"]}) + "\n")
+    if ctx["worker"] == 0 and cycle_idx == 2:
+        os._exit(3)  # simulate a worker dying mid-session
+    return policy.evaluate(cycle_idx, 0.0, 0).decision
+
+
+def test_shard_of_is_stable_and_in_range():
+    assert shard_of("checkout", 8) == shard_of("checkout", 8)
+    assert {shard_of(f"svc-{i}", 8) for i in range(200)} == set(range(8))
+
+
+def test_lease_is_exclusive_and_carries_state(tmp_path):
+    first = ShardLease(str(tmp_path), 3, "a")
+    assert first.acquire()
+    first.renew({"checkout": {"cycle": 7}})
+    assert not ShardLease(str(tmp_path), 3, "b").acquire()
+
+    first.release()
+    second = ShardLease(str(tmp_path), 3, "b")
+    assert second.acquire()
+    assert second.state == {"checkout": {"cycle": 7}}
+    second.release()
+
+
+def test_supervisor_moves_shards_of_a_dead_worker(tmp_path):
+    targets = [f"svc-{i}" for i in range(8)]
+    settings = {
+        "evidence_dir": str(tmp_path),
+        "variance_threshold": 0.15,
+        "iterations": 6,
+        "interval_sec": 0.2,
+        "telemetry_mode": "prometheus",
+    }
+    supervisor = ShardSupervisor(
+        targets, workers=2, shards=4, lease_dir=str(tmp_path / "leases"),
+        settings=settings, poll_sec=0.05, cycle_fn=_record_cycle,
+    )
+    result = supervisor.run()
+
+    assert result["workers"][0] == 3
+    assert result["reassignments"][0]["shards"] == [0, 2]
+    assert set(result["assignment"].values()) == {1}
+    for target in targets:
+        cycles = [json.loads(l) for l in (tmp_path / f"{target}.jsonl").read_text().splitlines()]
+        numbers = [c["cycle"] for c in cycles]
+        # A cycle interrupted by the crash is re-run by the new owner (at-least-once)
+        assert numbers == sorted(numbers) and set(numbers) == set(range(1, numbers[-1] + 1))
+        if shard_of(target, 4) in (0, 2):
+            # Picked up by worker 1, continuing the dead worker's cycle count
+            assert cycles[-1]["worker"] == 1 and numbers[-1] > 2
+
+
+def _quiet_cycle(target, cycle_idx, policy, ctx):
+    return policy.evaluate(cycle_idx, 0.0, 0).decision
+
+
+def test_supervisor_rejects_ttl_not_above_interval(tmp_path):
+    with pytest.raises(ValueError):
+        ShardSupervisor(["svc"], workers=1, shards=1, lease_dir=str(tmp_path),
+                        settings={"evidence_dir": str(tmp_path), "variance_threshold": 0.15,
+                                  "interval_sec": 0.6}, lease_ttl_sec=0.4)
+
+
+def test_supervisor_refuses_to_start_without_flock(tmp_path, monkeypatch):
+    monkeypatch.setattr(shards, "fcntl", None)
+    with pytest.raises(OSError, match="flock"):
+        ShardSupervisor(["svc"], workers=1, shards=1, lease_dir=str(tmp_path),
+                        settings={"evidence_dir": str(tmp_path), "variance_threshold": 0.15})
+
+
+def test_idle_workers_heartbeat_and_release_leases(tmp_path, monkeypatch):
+    monkeypatch.setattr(shards, "LEASE_TTL_MARGIN_SEC", 0.0)
+    settings = {
+        "evidence_dir": str(tmp_path),
+        "variance_threshold": 0.15,
+        "iterations": 3,
+        "interval_sec": 0.5,
+        "telemetry_mode": "prometheus",
+    }
+    supervisor = ShardSupervisor(
+        [f"svc-{i}" for i in range(4)], workers=2, shards=2, lease_dir=str(tmp_path / "leases"),
+        settings=settings, lease_ttl_sec=0.6, poll_sec=0.05, cycle_fn=_quiet_cycle,
+    )
+    result = supervisor.run()
+
+    assert result["reassignments"] == []
+    assert result["workers"] == {0: 0, 1: 0}
+    bodies = [ShardLease.read(tmp_path / "leases" / f"shard_{shard:03d}.lease") for shard in range(2)]
+    assert all(b["pid"] is None for b in bodies)  # released on clean exit, state kept
+    assert sum(len(b["state"]) for b in bodies) == 4
+
+
+def _slow_cycle(target, cycle_idx, policy, ctx):
+    import time
+    time.sleep(1.6)  # longer than the lease TTL
+    return policy.evaluate(cycle_idx, 0.0, 0).decision
+
+
+def test_slow_cycle_keeps_its_lease_fresh(tmp_path):
+    settings = {
+        "evidence_dir": str(tmp_path),
+        "variance_threshold": 0.15,
+        "iterations": 2,
+        "interval_sec": 0.1,
+        "telemetry_mode": "prometheus",
+    }
+    supervisor = ShardSupervisor(
+        ["svc"], workers=1, shards=1, lease_dir=str(tmp_path / "leases"),
+        settings=settings, lease_ttl_sec=1.2, poll_sec=0.05, cycle_fn=_slow_cycle,
+    )
+    result = supervisor.run()
+
+    assert result["reassignments"] == []
+    assert result["workers"] == {0: 0}
+
+
+def test_worker_cycles_go_through_the_shared_cycle_and_its_sinks(tmp_path, monkeypatch):
+    from src.watchtower.evidence_index import EvidenceIndex
+    from src.watchtower.tsdb import TimeSeriesStore
+
+    monkeypatch.setattr("src.watchtower.cycle.collect_window",
+                        lambda adapter, duration_sec: ({"status": "ok", "variance_detected": 0.3, "queue_depth": 0}, 0.01))
+    leases, evidence = tmp_path / "leases", tmp_path / "shards_x"
+    leases.mkdir()
+    (leases / shards.ASSIGNMENT_FILE).write_text(json.dumps({"epoch": 1, "shards": {"0": 0}}))
+    config = tmp_path / "watch.json"
+    config.write_text('{"variance_threshold": 0.2}')
+    settings = {
+        "evidence_dir": str(evidence),
+        "variance_threshold": 0.15,
+        "iterations": 2,
+        "interval_sec": 0.01,
+        "telemetry_mode": "prometheus",
+        "config_path": str(config),
+        "shadow_policies": [{"name": "loose", "variance_threshold": 0.5}],
+        "evidence_index": str(tmp_path / "index.sqlite"),
+        "tsdb_dir": str(tmp_path / "tsdb"),
+        "blob_store": str(tmp_path / "blobs"),
+    }
+    shards.run_worker(0, str(leases), 1, ["svc"], settings)
+
+    summaries = [json.loads((evidence / "svc" / f"cycle_{i}" / "cycle_summary.json").read_text()) for i in (1, 2)]
+    assert [s["decision"] for s in summaries] == ["MITIGATE", "SKIPPED_DEBOUNCE"]
+    assert summaries[0]["target"] == "svc" and summaries[0]["worker"] == 0
+    assert summaries[0]["thresholds"]["variance"] == 0.2                  # from the hot config
+    assert summaries[0]["artifacts"]["analysis"].startswith("blob:")
+    assert "timings_ms" in summaries[0] and summaries[0]["timings_ms"]
+    index = EvidenceIndex(str(tmp_path / "index.sqlite"))
+    assert [r["cycle"] for r in index.query(session="shards_x/svc")] == [1, 2]
+    index.close()
+    assert len(TimeSeriesStore(str(tmp_path / "tsdb")).range("svc/drift", 0, 4e9)) == 2
+    shadow = (evidence / "svc" / "shadow_decisions.jsonl").read_text().splitlines()
+    assert [json.loads(l)["s"]["loose"] for l in shadow[1:]] == ["N", "N"]
@@ -0,0 +1,37 @@
+from src.watchtower.spans import RollingHistogram, SpanTimer
+
+
+def test_spans_accumulate_per_cycle():
+    t = SpanTimer()
+    with t.span("collect"):
+        pass
+    t.record("write.analysis", 2_000_000)
+    t.record("write.analysis", 1_000_000)
+    ms = t.cycle_ms()
+    assert set(ms) == {"collect", "write.analysis"}
+    assert ms["write.analysis"] == 3.0
+
+    t.end_cycle()
+    assert t.cycle_ms() == {}
+    assert t.histograms["write.analysis"].total == 2
+
+
+def test_disabled_timer_shares_one_noop_span():
+    t = SpanTimer(enabled=False)
+    assert t.span("collect") is t.span("actuate")
+    with t.span("collect"):
+        pass
+    t.record("sleep", 5)
+    assert t.cycle_ms() == {}
+    assert t.histograms == {}
+
+
+def test_rolling_histogram_evicts_oldest():
+    h = RollingHistogram(window=2)
+    h.add(50_000)          # 0.05ms -> first bucket
+    h.add(2_000_000)       # 2ms
+    h.add(3_000_000)       # 3ms evicts the 0.05ms sample
+    assert h.counts[0] == 0
+    assert sum(h.counts) == 2
+    assert h.total == 3
+    assert h.percentile(100) == 3.0
@@ -0,0 +1,62 @@
+import multiprocessing
+
+from src.watchtower.status_board import StatusBoard, read_board
+
+
+def _hammer(path, n):
+    board = StatusBoard(path)
+    slot = board.slot("checkout")
+    for i in range(1, n + 1):
+        slot.publish(i, "NOOP", "OK", float(i), i)
+    board.close()
+
+
+def test_slots_are_claimed_per_target_and_read_back(tmp_path):
+    path = str(tmp_path / "board")
+    board = StatusBoard(path, slots=4)
+    board.slot("checkout").publish(3, "MITIGATE", "INTERDICT_QUEUE", 0.02, 64)
+    board.slot("search")  # claimed, nothing published yet
+
+    other = StatusBoard(path, create=False)  # second mapping, as another process would
+    row = other.read("checkout")
+    assert (row["cycle"], row["decision"], row["status"], row["queue_depth"]) == (3, "MITIGATE", "INTERDICT_QUEUE", 64)
+    assert other.read("search") is None
+    assert [r["target"] for r in read_board(path)] == ["checkout"]
+    other.close()
+    board.close()
+
+
+def test_seqlock_reads_are_never_torn(tmp_path):
+    path = str(tmp_path / "board")
+    reader = StatusBoard(path)
+    reader.slot("checkout").publish(0, "NOOP", "OK", 0.0, 0)
+
+    writer = multiprocessing.Process(target=_hammer, args=(path, 50000))
+    writer.start()
+    seen = 0
+    while writer.is_alive() or seen == 0:
+        row = reader.read("checkout")
+        if row:
+            assert row["cycle"] == row["queue_depth"] == int(row["drift"])
+            seen += 1
+    writer.join()
+    assert reader.read("checkout")["cycle"] == 50000
+    reader.close()
+
+
+def test_watch_runs_without_a_board_where_flock_is_missing(tmp_path, monkeypatch):
+    import json
+    import src.tools.watch_variance as wv
+    import src.watchtower.status_board as status_board
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(status_board, "fcntl", None)
+    monkeypatch.setattr("src.watchtower.cycle.collect_window",
+                        lambda adapter, duration_sec: ({"status": "ok", "variance_detected": 0.01, "queue_depth": 0}, 0.01))
+
+    wv.watch_variance(iterations=1, interval_sec=0.01, output_dir=str(tmp_path / "out"),
+                      status_board=str(tmp_path / "board"), stage_timing=False)
+
+    summary = json.loads((tmp_path / "out" / "cycle_1" / "cycle_summary.json").read_text())
+    assert summary["decision"] == "NOOP"
+    assert not (tmp_path / "board").exists()
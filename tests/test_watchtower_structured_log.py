@@ -0,0 +1,66 @@
+import gzip
+import io
+import json
+import logging
+
+from src.watchtower.structured_log import JsonLinesFormatter, RotatingJsonlHandler, WatchtowerLog
+
+
+def test_events_and_console_are_routed_separately(tmp_path):
+    path = tmp_path / "watchtower.log"
+    out = io.StringIO()
+    log = WatchtowerLog(str(path), console_stream=out)
+    log.event("cycle", cycle=1, decision="NOOP", drift=0.01)
+    log.console("[WATCH] Cycle 1/1...")
+    log.close()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["msg"] == "cycle"
+    assert record["decision"] == "NOOP"
+    assert record["level"] == "INFO"
+    assert out.getvalue() == "[WATCH] Cycle 1/1...\n"
+
+
+def _record(msg):
+    return logging.LogRecord("t", logging.INFO, __file__, 1, msg, None, None)
+
+
+def test_size_rotation_compresses_and_prunes(tmp_path):
+    path = tmp_path / "watchtower.log"
+    handler = RotatingJsonlHandler(str(path), max_bytes=200, compress=True, backup_count=2)
+    handler.setFormatter(JsonLinesFormatter())
+    for i in range(30):
+        handler.emit(_record("x" * 40 + str(i)))
+    handler.close()
+
+    rotated = sorted(tmp_path.glob("watchtower.log.*"))
+    assert len(rotated) == 2
+    assert all(p.suffix == ".gz" for p in rotated)
+    with gzip.open(rotated[-1], "rt") as f:
+        assert json.loads(f.readline())["msg"].startswith("x" * 40)
+    assert path.stat().st_size <= 200
+
+
+def test_time_rotation(tmp_path, monkeypatch):
+    path = tmp_path / "watchtower.log"
+    handler = RotatingJsonlHandler(str(path), max_bytes=0, rotate_interval_sec=60)
+    handler.setFormatter(JsonLinesFormatter())
+    handler.emit(_record("first"))
+    handler._opened_at -= 61
+    handler.emit(_record("second"))
+    handler.close()
+
+    assert len(list(tmp_path.glob("watchtower.log.*"))) == 1
+    assert json.loads(path.read_text())["msg"] == "second"
+
+
+def test_instances_do_not_register_loggers(tmp_path):
+    before = set(logging.Logger.manager.loggerDict)
+    for i in range(3):
+        log = WatchtowerLog(str(tmp_path / f"w{i}.log"), console_stream=io.StringIO())
+        log.event("cycle", cycle=i)
+        log.close()
+    assert set(logging.Logger.manager.loggerDict) == before
+    assert [json.loads((tmp_path / f"w{i}.log").read_text())["cycle"] for i in range(3)] == [0, 1, 2]
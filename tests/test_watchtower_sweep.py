@@ -0,0 +1,54 @@
+import numpy as np
+
+from src.watchtower.policy import DetectionPolicy
+from src.watchtower.replay import CycleRecord
+from src.watchtower.sweep import SignalSeries, build_grid, rank, sweep
+
+
+def _records(n=400, seed=7):
+    rng = np.random.default_rng(seed)
+    drift = np.clip(rng.normal(0.05, 0.06, n), 0, None)
+    queue = rng.integers(0, 90, n)
+    return [
+        CycleRecord("watch_%d" % (i // 100), i % 100 + 1, "NOOP", float(d), int(q), 0.0, 0.15, 50)
+        for i, (d, q) in enumerate(zip(drift, queue))
+    ]
+
+
+def test_sweep_matches_detection_policy():
+    records = _records()
+    grid = build_grid([0.05, 0.1, 0.15], [40, 60], [0, 2, 5])
+    rows = sweep(SignalSeries.from_records(records), grid, workers=1)
+    assert len(rows) == 18
+
+    for row in rows:
+        policy = DetectionPolicy(row["variance_threshold"], row["queue_threshold"], row["cooldown_cycles"])
+        counts = {"MITIGATE": 0, "SKIPPED_DEBOUNCE": 0}
+        session = None
+        for rec in records:
+            if rec.session != session:
+                session = rec.session
+                policy.reset()
+            decision = policy.evaluate(rec.cycle, rec.drift, rec.queue_depth).decision
+            if decision in counts:
+                counts[decision] += 1
+        assert row["interdictions"] == counts["MITIGATE"]
+        assert row["suppressed"] == counts["SKIPPED_DEBOUNCE"]
+
+
+def test_sweep_time_to_detect_and_flaps():
+    # One incident episode at cycles 3-6; the 0.3 policy only catches its peak.
+    drift = [0.0, 0.0, 0.2, 0.4, 0.2, 0.2, 0.0]
+    series = SignalSeries(range(1, 8), drift, [0] * 7, [True] + [False] * 6)
+    rows = {r["variance_threshold"]: r for r in sweep(series, build_grid([0.1, 0.3], [100], [0]), workers=1)}
+
+    assert rows[0.1]["ttd_mean_cycles"] == 0 and rows[0.1]["detected"] == 1
+    assert rows[0.1]["flap_rate"] == 0.75  # re-fires every cycle with no cooldown
+    assert rows[0.3]["ttd_mean_cycles"] == 1
+    assert rank(list(rows.values()))[0]["variance_threshold"] == 0.1
+
+
+def test_sweep_process_split_matches_in_process():
+    series = SignalSeries.from_records(_records(200))
+    grid = build_grid(np.linspace(0.01, 0.3, 20), [30, 50, 70], [0, 1, 3, 8])
+    assert sweep(series, grid, workers=2, chunk_size=64) == sweep(series, grid, workers=1)
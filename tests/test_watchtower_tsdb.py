@@ -0,0 +1,120 @@
+import random
+import struct
+
+import pytest
+
+from src.watchtower.tsdb import TimeSeriesStore, decode_chunk, encode_chunk
+
+T0 = 1_700_000_003.0
+
+
+def _points(n, step=5.0, seed=7):
+    rng = random.Random(seed)
+    return [(T0 + i * step + rng.choice((0, 0, 0, 0.001, -0.002)), rng.random() * 0.3) for i in range(n)]
+
+
+def _brute(points, start, end, step, agg):
+    width = int(step * 1000)
+    buckets = {}
+    for t, v in points:
+        if start <= t <= end:
+            ms = int(round(t * 1000))
+            buckets.setdefault(ms - ms % width, []).append(v)
+    pick = {"mean": lambda l: sum(l) / len(l), "min": min, "max": max, "sum": sum,
+            "count": len, "first": lambda l: l[0], "last": lambda l: l[-1]}[agg]
+    return [(b / 1000, pick(vals)) for b, vals in sorted(buckets.items())]
+
+
+def test_codec_roundtrip_is_lossless():
+    ts = [1000, 6000, 11000, 11000, 16001, 10 ** 12, 10 ** 12 + 5000]
+    vals = [0.0, 0.1, 0.1, -3.5, float("inf"), 1e-300, 0.1]
+    payload = encode_chunk(ts, vals)
+    assert decode_chunk(payload, len(ts)) == (ts, vals)
+
+    regular = [i * 5000 for i in range(1000)]
+    assert len(encode_chunk(regular, [0.0] * 1000)) < 300     # ~2 bits per point
+
+
+@pytest.mark.parametrize("dod", [63, 64, -63, -64, 255, 256, -255, -256, 2047, 2048, -2047, -2048])
+def test_codec_roundtrips_delta_of_delta_bucket_edges(dod):
+    ts = [0, 1000, 2000 + dod]
+    assert decode_chunk(encode_chunk(ts, [0.0] * 3), 3)[0] == ts
+
+
+@pytest.mark.parametrize("step,agg", [(300, "mean"), (3600, "max"), (7200, "count"), (7, "first"), (60, "last")])
+def test_downsample_matches_brute_force(tmp_path, step, agg):
+    points = _points(5000)
+    store = TimeSeriesStore(str(tmp_path), chunk_points=256)
+    store.append_many("svc/drift", points)
+    start, end = T0 + 777, T0 + 20_000
+
+    got = store.downsample("svc/drift", start, end, step, agg)
+    want = _brute(points, start, end, step, agg)
+    assert [b for b, _ in got] == [b for b, _ in want]
+    assert [v for _, v in got] == pytest.approx([v for _, v in want])
+
+    raw = store.range("svc/drift", start, end)
+    assert raw == [(round(t, 3), v) for t, v in points if start <= round(t, 3) <= end]
+
+
+def test_reopen_replays_head_and_rollups(tmp_path):
+    points = _points(700)
+    store = TimeSeriesStore(str(tmp_path), chunk_points=256)
+    store.append_many("svc/queue", points[:500])
+    store.flush()
+    store.close()
+
+    store = TimeSeriesStore(str(tmp_path), chunk_points=256)
+    assert store.stats("svc/queue")["points"] == 500
+    store.append_many("svc/queue", points[500:])
+    with pytest.raises(ValueError):
+        store.append("svc/queue", T0, 0.0)                # out of order
+    got = store.downsample("svc/queue", T0, T0 + 10_000, 300, "sum")
+    want = _brute(points, T0, T0 + 10_000, 300, "sum")
+    assert [v for _, v in got] == pytest.approx([v for _, v in want])
+    assert store.stats("svc/queue")["chunks"] == 2
+
+
+def test_reopen_keeps_head_points_tied_with_the_last_chunk(tmp_path):
+    store = TimeSeriesStore(str(tmp_path), chunk_points=4)
+    store.append_many("svc/drift", [(T0 + i, float(i)) for i in range(4)])   # sealed
+    store.append("svc/drift", T0 + 3, 9.0)                                   # same second, in head
+    store.close()
+
+    store = TimeSeriesStore(str(tmp_path), chunk_points=4)
+    assert store.stats("svc/drift")["points"] == 5
+    assert store.range("svc/drift", T0 + 3, T0 + 3) == [(T0 + 3, 3.0), (T0 + 3, 9.0)]
+
+
+def test_reopen_drops_a_head_left_behind_by_a_crash_mid_seal(tmp_path):
+    points = [(T0 + i, float(i)) for i in range(4)]
+    store = TimeSeriesStore(str(tmp_path), chunk_points=4)
+    store.append_many("svc/drift", points)
+    store.close()
+    with open(tmp_path / "svc__drift" / "head.dat", "wb") as f:         # not yet truncated
+        f.write(b"".join(struct.pack("<qd", int(t * 1000), v) for t, v in points + [(T0 + 4, 4.0)]))
+
+    store = TimeSeriesStore(str(tmp_path), chunk_points=4)
+    assert store.stats("svc/drift")["points"] == 5
+    assert [v for _, v in store.range("svc/drift", T0, T0 + 10)] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_watch_cycle_drops_points_behind_the_store_instead_of_crashing(tmp_path, monkeypatch):
+    import json
+    import src.tools.watch_variance as wv
+
+    monkeypatch.chdir(tmp_path)
+    store = TimeSeriesStore(str(tmp_path / "tsdb"))
+    store.append("watchtower/drift", 4_102_444_800.0, 0.0)                  # 2100: clock stepped back since
+    store.close()
+    monkeypatch.setattr("src.watchtower.cycle.collect_window",
+                        lambda adapter, duration_sec: ({"status": "ok", "variance_detected": 0.01, "queue_depth": 0}, 0.01))
+
+    wv.watch_variance(iterations=2, interval_sec=0.01, output_dir=str(tmp_path / "out"),
+                      tsdb_dir=str(tmp_path / "tsdb"), stage_timing=False)
+
+    decisions = [json.loads((tmp_path / "out" / f"cycle_{i}" / "cycle_summary.json").read_text())["decision"]
+                 for i in (1, 2)]
+    assert decisions == ["NOOP", "NOOP"]
+    events = [json.loads(line) for line in (tmp_path / "watchtower.log").read_text().splitlines()]
+    assert sum(e["msg"] == "tsdb_point_dropped" for e in events) == 2
@@ -2,54 +2,210 @@ import os
 import json
 import hmac
 import hashlib
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 
+from modules.vault_archive import VaultArchive, read_record
+from modules.vault_manifest import GENESIS, VaultManifest
+from modules.vault_merkle import MerkleCheckpointer
+
 load_dotenv()
 
 ROOT_KEY = os.getenv("SENTINEL_ROOT_KEY", "COHERENCE_DEFAULT_SECRET").encode()
 VAULT_PATH = "evidence/proposals"
+CHECKPOINT_NAME = ".verify_checkpoint.json"
+
+# Below this many records a process pool costs more than it saves.
+PARALLEL_MIN_RECORDS = 2000
+
+
+def _hmac_record(args):
+    """Worker: (vault, filename, key) -> (filename, parent_hash, signature, sig_ok, error)."""
+    vault, filename, key = args
+    try:
+        # Hot file, or its archived copy once rotation has rolled it up
+        full_payload = read_record(vault, filename)
+    except (OSError, ValueError) as e:
+        return filename, None, None, False, str(e)
+
+    signature = full_payload.pop("signature", None)
+    full_payload.pop("justification", None)
+    full_payload.pop("coherence_score", None)
+    # The seal covers the canonical (sort_keys) form of the remaining body.
+    payload_str = json.dumps(full_payload, sort_keys=True)
+    expected_sig = hmac.new(key, payload_str.encode(), hashlib.sha256).hexdigest()
+    return filename, full_payload.get("parent_hash"), signature, signature == expected_sig, None
+
+
+def _hmac_batch(args):
+    vault, filenames, key = args
+    return [_hmac_record((vault, name, key)) for name in filenames]
+
+
+def _checkpoint_mac(seq, signature, filename, offset, segment, segment_digest):
+    msg = f"{seq}:{signature}:{filename}:{offset}:{segment}:{segment_digest}"
+    return hmac.new(ROOT_KEY, msg.encode(), hashlib.sha256).hexdigest()
+
+
+def load_checkpoint(vault_path=VAULT_PATH):
+    """The last signed verification checkpoint, or None if absent or forged."""
+    try:
+        with open(os.path.join(vault_path, CHECKPOINT_NAME), "r") as f:
+            cp = json.load(f)
+        mac = _checkpoint_mac(cp["seq"], cp["signature"], cp["file"], cp["offset"],
+                              cp["segment"], cp["segment_digest"])
+        if hmac.compare_digest(cp["mac"], mac):
+            return cp
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
 
-def verify_vault():
-    print(f"\n[SENTINEL] :: INITIATING VAULT INTEGRITY CHECK :: {VAULT_PATH}")
-    files = sorted([f for f in os.listdir(VAULT_PATH) if f.endswith(".json")])
-    
-    if not files:
+def save_checkpoint(vault_path, seq, signature, filename, offset=0, segment=0, segment_digest=None):
+    """
+    `offset` is where the next unverified manifest entry starts (0 without a
+    manifest); `segment`/`segment_digest` are the last verified archive
+    segment and the digest of its index line.
+    """
+    cp = {
+        "seq": seq,
+        "signature": signature,
+        "file": filename,
+        "offset": offset,
+        "segment": segment,
+        "segment_digest": segment_digest,
+        "verified_at": datetime.utcnow().isoformat(),
+        "mac": _checkpoint_mac(seq, signature, filename, offset, segment, segment_digest),
+    }
+    path = os.path.join(vault_path, CHECKPOINT_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(cp, f, indent=2)
+    os.replace(path + ".tmp", path)
+    return cp
+
+
+def _lineage(vault_path, cp):
+    """
+    (start_seq, pending filenames, total records, manifest offset) in lineage
+    order. With a manifest and a checkpoint, only the entries after the
+    checkpoint's offset are read; without a manifest, sorted filenames.
+    """
+    manifest = VaultManifest(vault_path)
+    if manifest.exists():
+        end = manifest.size()
+        if cp and cp["offset"] and cp["offset"] <= end:
+            tip = manifest.tip(before=cp["offset"])
+            if tip and tip["seq"] == cp["seq"] and tip["signature"] == cp["signature"]:
+                pending = [e["file"] for e in manifest.entries(cp["offset"])]
+                return cp["seq"], pending, cp["seq"] + len(pending), end
+        files = [e["file"] for e in manifest.entries()]
+        return 0, files, len(files), end
+    hot = [f for f in os.listdir(vault_path) if f.endswith(".json") and not f.startswith(".")]
+    files = sorted(set(hot).union(VaultArchive(vault_path).archived()))
+    if cp and 0 < cp["seq"] <= len(files) and files[cp["seq"] - 1] == cp["file"]:
+        return cp["seq"], files[cp["seq"]:], len(files), 0
+    return 0, files, len(files), 0
+
+
+def verify_vault(vault_path=VAULT_PATH, full=False, workers=None):
+    """
+    Verifies HMAC seals and parent_hash lineage of the vault.
+
+    Only records and archive segments after the last signed checkpoint are
+    verified unless `full` is set (or the checkpoint no longer matches the
+    vault). HMACs are recomputed in a process pool for large runs, then
+    lineage links are checked in one sequential pass. A clean run advances
+    the checkpoint.
+    """
+    print(f"\n[SENTINEL] :: INITIATING VAULT INTEGRITY CHECK :: {vault_path}")
+    cp = None if full else load_checkpoint(vault_path)
+    start, pending, total, offset = _lineage(vault_path, cp)
+
+    if not total:
         print("[EMPTY]   :: Vault is virgin. No records to verify.")
-        return
+        return {"status": "empty", "verified": 0}
 
-    last_sig = "GENESIS"
-    compromised = False
+    last_sig = GENESIS
+    if start:
+        # The checkpointed tip itself must still carry its sealed signature.
+        _, _, tip_sig, tip_ok, _ = _hmac_record((vault_path, cp["file"], ROOT_KEY))
+        if tip_ok and tip_sig == cp["signature"]:
+            last_sig = cp["signature"]
+            print(f"[CHECKPOINT]:: Records 1-{start} verified at {cp['verified_at']}. Verifying {len(pending)} new.")
+        else:
+            start, pending, total, offset = _lineage(vault_path, None)
+    if not start and cp:
+        print("[CHECKPOINT]:: Checkpoint does not match the vault. Full re-verification.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(pending) >= PARALLEL_MIN_RECORDS:
+        size = max(1, len(pending) // (workers * 4))
+        batches = [(vault_path, pending[i:i + size], ROOT_KEY) for i in range(0, len(pending), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [r for batch in pool.map(_hmac_batch, batches) for r in batch]
+    else:
+        results = [_hmac_record((vault_path, name, ROOT_KEY)) for name in pending]
+
+    archive = VaultArchive(vault_path)
+    segment, segment_digest = archive.head()
+    breaches = []
+    seen = (cp["segment"], cp["segment_digest"]) if start else (0, None)
+    for problem in archive.verify(*seen):
+        print(f"[BREACH]  :: archive :: {problem}")
+        breaches.append(problem.split(":")[0])
 
-    for filename in files:
-        path = os.path.join(VAULT_PATH, filename)
-        with open(path, "r") as f:
-            full_payload = json.load(f)
-            
-        signature = full_payload.pop("signature", None)
-        justification = full_payload.pop("justification", None)
-        coherence = full_payload.pop("coherence_score", None)
-        parent_hash = full_payload.get("parent_hash")
+    for filename, parent_hash, signature, sig_ok, error in results:
+        if error:
+            print(f"[BREACH]  :: {filename} :: Unreadable: {error}")
+            breaches.append(filename)
+            continue
 
         # 1. Verify Lineage
         if parent_hash != last_sig:
             print(f"[BREACH]  :: {filename} :: Lineage Broken! Expected parent {last_sig}, found {parent_hash}")
-            compromised = True
+            breaches.append(filename)
 
         # 2. Verify Signature
-        payload_str = json.dumps(full_payload, sort_keys=True)
-        expected_sig = hmac.new(ROOT_KEY, payload_str.encode(), hashlib.sha256).hexdigest()
-
-        if signature != expected_sig:
+        if not sig_ok:
             print(f"[BREACH]  :: {filename} :: Signature Invalid! HMAC Mismatch.")
-            compromised = True
+            breaches.append(filename)
         else:
-            print(f"[VERIFIED]:: {filename} :: Lineage & Signature Secure.")
             last_sig = signature
 
-    if not compromised:
+    if not breaches:
+        if pending:
+            save_checkpoint(vault_path, total, last_sig, pending[-1], offset, segment, segment_digest)
+        elif (segment, segment_digest) != seen:
+            save_checkpoint(vault_path, cp["seq"], cp["signature"], cp["file"], offset, segment, segment_digest)
+        print(f"[VERIFIED]:: {len(pending)} new record(s) :: Lineage & Signature Secure.")
         print("\n[SUCCESS] :: VAULT INTEGRITY CONFIRMED :: PERFECT COHERENCE.")
     else:
         print("\n[CRITICAL]:: VAULT COMPROMISED :: EVIDENCE CHAIN BROKEN.")
+    return {
+        "status": "compromised" if breaches else "ok",
+        "records": total,
+        "verified": len(pending),
+        "from_seq": start,
+        "breaches": sorted(set(breaches)),
+    }
 
 if __name__ == "__main__":
-    verify_vault()
+    parser = argparse.ArgumentParser(description="Verify Evidence Vault seals and lineage")
+    parser.add_argument("--vault", default=VAULT_PATH, help="Vault directory")
+    parser.add_argument("--full", action="store_true", help="Ignore the checkpoint; re-verify from GENESIS and every archive segment")
+    parser.add_argument("--workers", type=int, default=None, help="Processes for HMAC recomputation")
+    parser.add_argument("--audit", type=str, default=None, help="Check record seq (or first:last) against its Merkle root only")
+    parser.add_argument("--seal", action="store_true", help="After a clean run, seal a Merkle root over the remaining records")
+    args = parser.parse_args()
+    if args.audit:
+        first, _, last = args.audit.partition(":")
+        checkpointer = MerkleCheckpointer(args.vault, root_key=ROOT_KEY)
+        for res in checkpointer.audit_range(int(first), int(last or first)):
+            print(json.dumps(res))
+    else:
+        res = verify_vault(args.vault, full=args.full, workers=args.workers)
+        if args.seal and res["status"] == "ok":
+            for root in MerkleCheckpointer(args.vault, root_key=ROOT_KEY).update(seal_partial=True):
+                print(f"[MERKLE]  :: Batch {root['batch']} (seq {root['first_seq']}-{root['last_seq']}) root {root['root']}")